@@ -13,15 +13,93 @@ import subprocess
 import sys
 import platform
 import argparse
+import asyncio
+import contextvars
+import functools
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 import mimetypes
 import html
 
+from halo_workflow.core.analyzer import WorkflowAnalyzer
+from halo_workflow.core.snapshot import ProjectSnapshot
+from halo_workflow.core.check_cache import (
+    CheckCache, tree_fingerprint, tsc_command, CACHE_DIR_NAME, TSC_INPUTS, TSC_SUFFIXES
+)
+from halo_workflow.analyzers.module_graph import ModuleGraph
+
+# Directories with more files than this are collapsed in the rendered tree
+MAX_TREE_FILES = 50
+
+# Lists and tables longer than this are rendered inside a collapsible block
+COLLAPSE_AFTER = 20
+
+# Section output is kept in memory up to this size, then spooled to a temp file
+SECTION_SPOOL_SIZE = 1024 * 1024
+
+# Shown until the report is complete (hidden by a style appended at the end)
+PARTIAL_MARKER = (
+    '<div class="warning" id="partial-report">⏳ Partial report: the diagnostic is still running. '
+    'Reload the page to see more sections.</div>\n'
+)
+
+
+class SectionOutput:
+    """HTML and messages produced by one diagnostic section
+
+    HTML goes to a spooled temporary file, so long sections do not stay in memory.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.spool = tempfile.SpooledTemporaryFile(max_size=SECTION_SPOOL_SIZE, mode='w+', encoding='utf-8')
+        self.errors = []
+        self.warnings = []
+        self.duration = 0.0
+
+
+class ReportWriter:
+    """Writes the HTML report to disk incrementally
+
+    The file can be opened while the diagnostic is still running; everything
+    written so far is flushed after each block.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.file = open(self.path, 'w', encoding='utf-8')
+
+    def write(self, content):
+        self.file.write(content)
+
+    def write_section(self, output):
+        """Copy a finished section's spooled HTML into the report"""
+        output.spool.seek(0)
+        shutil.copyfileobj(output.spool, self.file)
+        output.spool.close()
+        self.flush()
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+# Output of the section running in the current thread/task (None outside sections)
+_current_section = contextvars.ContextVar('current_section', default=None)
+
+
 class CompleteProjectDiagnostic:
-    def __init__(self, target_dir=None):
+    def __init__(self, target_dir=None, output_path=None):
         self.base_dir = Path(target_dir) if target_dir else Path(__file__).parent
+        self.report_path = Path(output_path) if output_path else self.base_dir / "diagnostic_report.html"
+        self.report = None
         self.errors = []
         self.warnings = []
         self.info = []
@@ -31,8 +109,9 @@ class CompleteProjectDiagnostic:
         self.all_api_calls = []
         self.file_tree = {}
         self.data_sources = defaultdict(list)
-        self.html_content = []
         self.workflow_mismatches = []
+        self.snapshot = None
+        self.section_durations = []
         self.system_info = self.get_system_info()
         
     def get_system_info(self):
@@ -55,8 +134,107 @@ class CompleteProjectDiagnostic:
             return 'Not installed'
     
     def add_html(self, content):
-        """Add HTML content"""
-        self.html_content.append(content)
+        """Add HTML content (to the running section's buffer inside a section)"""
+        section = _current_section.get()
+        if section is not None:
+            section.spool.write(content)
+        else:
+            self.report.write(content)
+    
+    def add_collapsible(self, title, count, open_block):
+        """Open (or close) a collapsible block around a long list"""
+        if count <= COLLAPSE_AFTER:
+            return
+        if open_block:
+            self.add_html(f"""
+        <div class="collapsible">
+            <div class="collapsible-header">{html.escape(title)} ({count})</div>
+            <div class="collapsible-content">
+            """)
+        else:
+            self.add_html("</div></div>")
+    
+    def add_item_list(self, title, items):
+        """Escaped <ul> list under a heading, collapsible when long"""
+        self.add_html(f"<h3>{html.escape(title)}</h3>")
+        self.add_collapsible(title, len(items), True)
+        self.add_html("<ul>")
+        for item in items:
+            self.add_html(f"<li>{html.escape(item)}</li>")
+        self.add_html("</ul>")
+        self.add_collapsible(title, len(items), False)
+    
+    def add_messages(self, title, messages, css_class, icon):
+        """Escaped message boxes under a heading, collapsible when long"""
+        self.add_html(f"<h3>{html.escape(title)}</h3>")
+        self.add_collapsible(title, len(messages), True)
+        for message in messages:
+            self.add_html(f'<div class="{css_class}">{icon} {html.escape(message)}</div>')
+        self.add_collapsible(title, len(messages), False)
+    
+    def add_error(self, message):
+        section = _current_section.get()
+        (section.errors if section is not None else self.errors).append(message)
+    
+    def add_warning(self, message):
+        section = _current_section.get()
+        (section.warnings if section is not None else self.warnings).append(message)
+    
+    def run_sections(self, sections):
+        """Run sections concurrently and write their output in the given order
+        
+        Coroutine sections (subprocess checks) run on the event loop, the others on a
+        thread pool. Each section writes to its own buffer, so the report is the same
+        regardless of which section finishes first. A section is written to the report
+        as soon as it and every section before it have finished.
+        """
+        async def run_all():
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+                async def run_one(name, func):
+                    output = SectionOutput(name)
+                    _current_section.set(output)
+                    started = time.perf_counter()
+                    if asyncio.iscoroutinefunction(func):
+                        await func()
+                    else:
+                        context = contextvars.copy_context()
+                        await loop.run_in_executor(executor, functools.partial(context.run, func))
+                    output.duration = time.perf_counter() - started
+                    print(f"  ✓ {name} ({output.duration:.2f}s)")
+                    return output
+                
+                # create_task gives every section its own copy of the context
+                tasks = [asyncio.ensure_future(run_one(name, func)) for name, func in sections]
+                for task in tasks:
+                    output = await task
+                    self.report.write_section(output)
+                    self.errors.extend(output.errors)
+                    self.warnings.extend(output.warnings)
+                    self.section_durations.append((output.name, output.duration))
+        
+        asyncio.run(run_all())
+    
+    async def run_command(self, command, timeout):
+        """Run a subprocess without blocking the event loop - (exit code, stdout, stderr)"""
+        if platform.system() == 'Windows':
+            process = await asyncio.create_subprocess_shell(
+                subprocess.list2cmdline(command), cwd=self.base_dir,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+        else:
+            process = await asyncio.create_subprocess_exec(
+                *command, cwd=self.base_dir,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(command, timeout)
+        return (process.returncode, stdout.decode('utf-8', errors='replace'),
+                stderr.decode('utf-8', errors='replace'))
         
     def run_complete_diagnostic(self):
         """Run complete diagnostic - no time limit"""
@@ -64,7 +242,25 @@ class CompleteProjectDiagnostic:
         
         print("🔍 Starting complete project diagnostic (no time limit)...")
         print(f"📁 Base directory: {self.base_dir}")
+        print(f"📄 Writing report to: {self.report_path}")
+        
+        # The report is written as sections finish
+        self.report = ReportWriter(self.report_path)
+        try:
+            self.write_report(start_time)
+        finally:
+            self.report.close()
         
+        end_time = datetime.now()
+        duration = end_time - start_time
+        
+        print(f"✅ Diagnostic completed in {duration.total_seconds():.2f} seconds")
+        print(f"📄 Report saved to: {self.report_path}")
+        
+        return self.report_path
+    
+    def write_report(self, start_time):
+        """Write the header, every section and the summary"""
         # HTML header
         self.add_html(f"""
 <!DOCTYPE html>
@@ -72,7 +268,7 @@ class CompleteProjectDiagnostic:
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Project Diagnostic Report - {self.base_dir.name}</title>
+    <title>Project Diagnostic Report - {html.escape(self.base_dir.name)}</title>
     <style>
         body {{
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
@@ -281,87 +477,63 @@ class CompleteProjectDiagnostic:
             font-size: 14px;
         }}
     </style>
+    <script>
+        // Delegated handlers also work while the report is still being written
+        document.addEventListener('click', function(event) {{
+            const header = event.target.closest('.collapsible-header');
+            if (header) {{
+                header.parentElement.classList.toggle('active');
+                return;
+            }}
+            const item = event.target.closest('.expandable');
+            if (item && item.nextElementSibling) {{
+                item.nextElementSibling.classList.toggle('hidden');
+            }}
+        }});
+    </script>
 </head>
 <body>
     <div class="header">
         <h1>🔍 Project Diagnostic Report</h1>
-        <p><strong>Project:</strong> {self.base_dir.name}</p>
-        <p><strong>Location:</strong> {self.base_dir}</p>
+        <p><strong>Project:</strong> {html.escape(self.base_dir.name)}</p>
+        <p><strong>Location:</strong> {html.escape(str(self.base_dir))}</p>
         <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
         <p><strong>System:</strong> {self.system_info['platform']} {self.system_info['platform_version']}</p>
     </div>
 """)
+        self.add_html(PARTIAL_MARKER)
+        self.report.flush()
 
-        # Step 1: Project structure analysis
-        print("📊 Step 1: Analyzing project structure...")
-        self.analyze_project_structure()
-        
-        # Step 2: Workflow consistency check
-        print("🔄 Step 2: Checking workflow consistency...")
-        self.check_workflow_consistency()
-        
-        # Step 3: Dependency analysis
-        print("🔗 Step 3: Analyzing dependencies...")
-        self.analyze_dependencies()
-        
-        # Step 4: Type checking
-        print("🔍 Step 4: Running type checks...")
-        type_results = self.run_type_checks()
-        if not type_results['success'] and type_results['errors']:
-            print("⚠️  TypeScript type checking found issues")
-        
-        # Step 5: File system analysis
-        print("📁 Step 5: Analyzing file system...")
-        self.analyze_file_system()
-        
-        # Step 6: API analysis
-        print("🌐 Step 6: Analyzing API endpoints...")
-        self.analyze_api_endpoints()
+        # Single file listing (the analyzer's index and ignore rules) shared by every section
+        print("📂 Scanning project tree...")
+        self.snapshot = ProjectSnapshot.from_paths(self.base_dir, WorkflowAnalyzer().project_files(self.base_dir))
+        print(f"  {len(self.snapshot.files)} files, {len(self.snapshot.dirs)} directories")
+        
+        # Steps 1-6 run concurrently; the report keeps this order
+        print("🚀 Running diagnostic sections concurrently...")
+        self.run_sections([
+            ('Project structure', self.analyze_project_structure),
+            ('Workflow consistency', self.check_workflow_consistency),
+            ('Dependencies', self.analyze_dependencies),
+            ('Type checks', self.run_type_checks),
+            ('File system', self.analyze_file_system),
+            ('API endpoints', self.analyze_api_endpoints),
+        ])
         
         # Step 7: Generate summary
         print("📋 Step 7: Generating summary...")
         self.generate_summary()
         
-        # Close HTML
+        # Close HTML (the style hides the partial-report marker)
         self.add_html("""
     <div class="footer">
         <p>Generated by Workflow Visualizer Diagnostic Tool</p>
         <p>Report generated on """ + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + """</p>
     </div>
-    
-    <script>
-        // Add interactivity
-        document.querySelectorAll('.collapsible-header').forEach(header => {
-            header.addEventListener('click', function() {
-                this.parentElement.classList.toggle('active');
-            });
-        });
-        
-        document.querySelectorAll('.expandable').forEach(item => {
-            item.addEventListener('click', function() {
-                const target = this.nextElementSibling;
-                if (target) {
-                    target.classList.toggle('hidden');
-                }
-            });
-        });
-    </script>
+    <style>#partial-report { display: none; }</style>
 </body>
 </html>
         """)
-        
-        # Save report
-        report_path = self.base_dir / "diagnostic_report.html"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(''.join(self.html_content))
-        
-        end_time = datetime.now()
-        duration = end_time - start_time
-        
-        print(f"✅ Diagnostic completed in {duration.total_seconds():.2f} seconds")
-        print(f"📄 Report saved to: {report_path}")
-        
-        return report_path
 
     def analyze_project_structure(self):
         """Analyze project structure"""
@@ -374,28 +546,21 @@ class CompleteProjectDiagnostic:
         }
         
         try:
-            for item in self.base_dir.rglob('*'):
-                if item.is_file():
-                    structure_info['total_files'] += 1
-                    suffix = item.suffix.lower()
-                    structure_info['file_types'][suffix] += 1
-                    
-                    # Check file size
-                    size = item.stat().st_size
-                    if size == 0:
-                        structure_info['empty_files'].append(str(item.relative_to(self.base_dir)))
-                    else:
-                        structure_info['largest_files'].append((str(item.relative_to(self.base_dir)), size))
-                        
-                elif item.is_dir():
-                    structure_info['total_directories'] += 1
+            # The root itself is not counted as a directory
+            structure_info['total_directories'] = len(self.snapshot.dirs) - 1
+            for info in self.snapshot.iter_files():
+                structure_info['total_files'] += 1
+                structure_info['file_types'][info.suffix] += 1
+                
+                # Check file size
+                if info.size == 0:
+                    structure_info['empty_files'].append(info.path)
             
-            # Sort largest files
-            structure_info['largest_files'].sort(key=lambda x: x[1], reverse=True)
-            structure_info['largest_files'] = structure_info['largest_files'][:10]
+            # Largest files were collected during the scan
+            structure_info['largest_files'] = self.snapshot.largest_files()
             
         except Exception as e:
-            self.errors.append(f"Project structure analysis failed: {str(e)}")
+            self.add_error(f"Project structure analysis failed: {str(e)}")
         
         # Generate HTML for structure analysis
         self.add_html(f"""
@@ -436,7 +601,7 @@ class CompleteProjectDiagnostic:
             percentage = (count / structure_info['total_files']) * 100
             self.add_html(f"""
                 <tr>
-                    <td>{ext or 'No extension'}</td>
+                    <td>{html.escape(ext) or 'No extension'}</td>
                     <td>{count}</td>
                     <td>{percentage:.1f}%</td>
                 </tr>
@@ -448,16 +613,12 @@ class CompleteProjectDiagnostic:
         """)
         
         if structure_info['largest_files']:
-            self.add_html("<h3>Largest Files</h3><ul>")
-            for filename, size in structure_info['largest_files']:
-                self.add_html(f"<li>{filename} ({self.format_size(size)})</li>")
-            self.add_html("</ul>")
+            self.add_item_list("Largest Files", [
+                f"{filename} ({self.format_size(size)})" for filename, size in structure_info['largest_files']
+            ])
         
         if structure_info['empty_files']:
-            self.add_html("<h3>Empty Files</h3><ul>")
-            for filename in structure_info['empty_files'][:20]:  # Show first 20
-                self.add_html(f"<li>{filename}</li>")
-            self.add_html("</ul>")
+            self.add_item_list("Empty Files", structure_info['empty_files'])
         
         self.add_html("</div>")
 
@@ -476,8 +637,7 @@ class CompleteProjectDiagnostic:
         
         missing_files = []
         for file in workflow_files:
-            file_path = self.base_dir / file
-            if not file_path.exists():
+            if not self.snapshot.exists(file):
                 missing_files.append(file)
         
         if missing_files:
@@ -485,7 +645,7 @@ class CompleteProjectDiagnostic:
         
         # Check package.json dependencies
         package_json_path = self.base_dir / 'package.json'
-        if package_json_path.exists():
+        if self.snapshot.exists('package.json'):
             try:
                 with open(package_json_path, 'r', encoding='utf-8') as f:
                     package_data = json.load(f)
@@ -510,9 +670,7 @@ class CompleteProjectDiagnostic:
         """)
         
         if consistency_issues:
-            self.add_html("<h3>Issues Found</h3>")
-            for issue in consistency_issues:
-                self.add_html(f'<div class="warning">⚠️ {issue}</div>')
+            self.add_messages("Issues Found", consistency_issues, 'warning', '⚠️')
         else:
             self.add_html('<div class="success">✅ No workflow consistency issues found</div>')
         
@@ -528,7 +686,7 @@ class CompleteProjectDiagnostic:
         
         # Analyze package.json
         package_json_path = self.base_dir / 'package.json'
-        if package_json_path.exists():
+        if self.snapshot.exists('package.json'):
             try:
                 with open(package_json_path, 'r', encoding='utf-8') as f:
                     package_data = json.load(f)
@@ -551,33 +709,34 @@ class CompleteProjectDiagnostic:
                     })
                     
             except Exception as e:
-                self.errors.append(f"Failed to analyze package.json: {str(e)}")
+                self.add_error(f"Failed to analyze package.json: {str(e)}")
         
-        # Analyze import statements (limit to src directory for performance)
+        # Build the module graph (all JS/TS files outside ignored directories)
+        graph = None
         try:
-            src_dir = self.base_dir / 'src'
-            if src_dir.exists():
-                for file_path in src_dir.rglob('*.{ts,tsx,js,jsx}'):
-                    if file_path.is_file():
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                
-                            # Find import statements
-                            import_pattern = r'import\s+.*?from\s+[\'"]([^\'"]+)[\'"]'
-                            imports = re.findall(import_pattern, content)
-                            
-                            for imp in imports:
-                                dependencies_info['import_dependencies'].append({
-                                    'file': str(file_path.relative_to(self.base_dir)),
-                                    'import': imp
-                                })
-                                
-                        except Exception as e:
-                            continue
+            graph = ModuleGraph(
+                self.snapshot, self.base_dir / CACHE_DIR_NAME / 'import_edges.json'
+            ).build()
+            
+            for path in graph.modules:
+                for specifier in graph.specifiers[path]:
+                    dependencies_info['import_dependencies'].append({
+                        'file': path,
+                        'import': specifier
+                    })
+            
+            dependencies_info['circular_dependencies'] = graph.cycles()
+            for cycle in dependencies_info['circular_dependencies']:
+                self.add_warning(
+                    f"Circular dependency between {len(cycle['modules'])} modules: "
+                    f"{' → '.join(cycle['path'] + cycle['path'][:1])}"
+                )
+            
+            print(f"  {len(graph.modules)} modules, {graph.edge_count} local import edges "
+                  f"({graph.cache_hits} files from cache)")
                             
         except Exception as e:
-            self.errors.append(f"Failed to analyze imports: {str(e)}")
+            self.add_error(f"Failed to analyze imports: {str(e)}")
         
         # Generate HTML for dependencies
         self.add_html(f"""
@@ -596,6 +755,14 @@ class CompleteProjectDiagnostic:
                 <div class="stat-number">{len(set(d['import'] for d in dependencies_info['import_dependencies']))}</div>
                 <div>Unique Imports</div>
             </div>
+            <div class="stat-item">
+                <div class="stat-number">{len(graph.modules) if graph else 0}</div>
+                <div>Modules</div>
+            </div>
+            <div class="stat-item">
+                <div class="stat-number">{len(dependencies_info['circular_dependencies'])}</div>
+                <div>Circular Dependencies</div>
+            </div>
         </div>
         
         <div class="collapsible">
@@ -616,8 +783,8 @@ class CompleteProjectDiagnostic:
             badge_class = 'badge-success' if dep['type'] == 'production' else 'badge-warning'
             self.add_html(f"""
                 <tr>
-                    <td>{dep['name']}</td>
-                    <td>{dep['version']}</td>
+                    <td>{html.escape(dep['name'])}</td>
+                    <td>{html.escape(str(dep['version']))}</td>
                     <td><span class="badge {badge_class}">{dep['type']}</span></td>
                 </tr>
             """)
@@ -627,10 +794,22 @@ class CompleteProjectDiagnostic:
                 </table>
             </div>
         </div>
-        </div>
         """)
+        
+        if dependencies_info['circular_dependencies']:
+            self.add_item_list("🔁 Circular Dependencies", [
+                ' → '.join(cycle['path'] + cycle['path'][:1]) +
+                (f" (mutually dependent: {', '.join(cycle['modules'])})"
+                 if len(cycle['modules']) > len(cycle['path']) else '')
+                for cycle in dependencies_info['circular_dependencies']
+            ])
+        
+        if graph and graph.unresolved:
+            self.add_html(f'<div class="warning">⚠️ {len(graph.unresolved)} relative imports could not be resolved</div>')
+        
+        self.add_html("</div>")
 
-    def run_type_checks(self):
+    async def run_type_checks(self):
         """Run TypeScript type checking"""
         type_check_results = {
             'success': False,
@@ -647,25 +826,32 @@ class CompleteProjectDiagnostic:
                     type_check_results['warnings'].append("node_modules not found. Run 'npm install' first.")
                     return type_check_results
                 
-                # Run TypeScript type checking
-                print("  Running: npx tsc --noEmit")
-                result = subprocess.run(
-                    ['npx', 'tsc', '--noEmit'],
-                    cwd=self.base_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=120,
-                    shell=True if platform.system() == 'Windows' else False
-                )
-                print(f"  Exit code: {result.returncode}")
+                # Reuse the last outcome when no type-relevant input changed
+                cache = CheckCache(self.base_dir)
+                key = tree_fingerprint(self.base_dir, TSC_INPUTS, (
+                    (info.path, info.size, info.mtime) for info in self.snapshot.iter_files(suffixes=TSC_SUFFIXES)
+                ))
+                result = cache.get('tsc', key)
+                if result is not None:
+                    print("  tsc: sources unchanged, reusing cached result")
+                    type_check_results['warnings'].append("Result reused from cache (no source changes since the last run)")
+                else:
+                    # Run TypeScript type checking (incremental build info kept between runs)
+                    print("  Running: npx tsc --noEmit --incremental")
+                    returncode, stdout, stderr = await self.run_command(tsc_command(self.base_dir), timeout=120)
+                    print(f"  tsc exit code: {returncode}")
+                    result = {'returncode': returncode, 'stdout': stdout, 'stderr': stderr}
+                    cache.put('tsc', key, result)
                 
-                if result.returncode == 0:
+                returncode, stdout, stderr = result['returncode'], result['stdout'], result['stderr']
+                if returncode == 0:
                     type_check_results['success'] = True
-                    if result.stdout.strip():
-                        type_check_results['warnings'].append(result.stdout)
+                    if stdout.strip():
+                        type_check_results['warnings'].append(stdout)
                 else:
+                    print("⚠️  TypeScript type checking found issues")
                     # Combine stdout and stderr for better error reporting
-                    error_output = result.stdout + result.stderr
+                    error_output = stdout + stderr
                     if error_output.strip():
                         type_check_results['errors'] = [line for line in error_output.split('\n') if line.strip()]
                     else:
@@ -704,7 +890,7 @@ class CompleteProjectDiagnostic:
             self.add_html('<div class="info">ℹ️ TypeScript type checking was skipped</div>')
         
         for warning in type_check_results['warnings']:
-            self.add_html(f'<div class="warning">⚠️ {warning}</div>')
+            self.add_html(f'<div class="warning">⚠️ {html.escape(warning)}</div>')
         
         # Add type checking tips
         self.add_html(f"""
@@ -735,23 +921,20 @@ class CompleteProjectDiagnostic:
         }
         
         # Analyze src directory
-        src_path = self.base_dir / 'src'
-        if src_path.exists():
-            fs_info['src_structure'] = self.build_directory_tree(src_path)
+        if 'src' in self.snapshot.dirs:
+            fs_info['src_structure'] = self.build_directory_tree('src')
         
         # Analyze server directory
-        server_path = self.base_dir / 'server'
-        if server_path.exists():
-            fs_info['server_structure'] = self.build_directory_tree(server_path)
+        if 'server' in self.snapshot.dirs:
+            fs_info['server_structure'] = self.build_directory_tree('server')
         
         # Find config files
         config_extensions = ['.json', '.js', '.ts', '.config.js', '.config.ts']
         config_names = ['package.json', 'tsconfig.json', 'vite.config.js', 'vite.config.ts']
         
-        for item in self.base_dir.iterdir():
-            if item.is_file():
-                if item.name in config_names or any(item.name.endswith(ext) for ext in config_extensions):
-                    fs_info['config_files'].append(item.name)
+        for name in self.snapshot.listdir('')[1]:
+            if name in config_names or any(name.endswith(ext) for ext in config_extensions):
+                fs_info['config_files'].append(name)
         
         # Generate HTML for file system
         self.add_html(f"""
@@ -763,20 +946,20 @@ class CompleteProjectDiagnostic:
         """)
         
         for config_file in fs_info['config_files']:
-            self.add_html(f"<li>{config_file}</li>")
+            self.add_html(f"<li>{html.escape(config_file)}</li>")
         
         self.add_html("</ul>")
         
         if fs_info['src_structure']:
             self.add_html("<h3>Source Structure</h3>")
             self.add_html('<div class="file-tree">')
-            self.render_directory_tree(fs_info['src_structure'], 'src')
+            self.render_directory_tree(fs_info['src_structure'], 'src', totals=self.snapshot.dirs['src'])
             self.add_html('</div>')
         
         if fs_info['server_structure']:
             self.add_html("<h3>Server Structure</h3>")
             self.add_html('<div class="file-tree">')
-            self.render_directory_tree(fs_info['server_structure'], 'server')
+            self.render_directory_tree(fs_info['server_structure'], 'server', totals=self.snapshot.dirs['server'])
             self.add_html('</div>')
         
         self.add_html("</div>")
@@ -790,33 +973,30 @@ class CompleteProjectDiagnostic:
         }
         
         # Analyze server files for API endpoints
-        server_path = self.base_dir / 'server'
-        if server_path.exists():
-            for file_path in server_path.rglob('*.js'):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Find API routes
-                    route_patterns = [
-                        r'app\.(get|post|put|delete|patch)\([\'"]([^\'"]+)[\'"]',
-                        r'router\.(get|post|put|delete|patch)\([\'"]([^\'"]+)[\'"]',
-                        r'\.route\([\'"]([^\'"]+)[\'"][^.]*\.(get|post|put|delete|patch)'
-                    ]
-                    
-                    for pattern in route_patterns:
-                        matches = re.findall(pattern, content)
-                        for match in matches:
-                            if len(match) == 2:
-                                method, route = match
-                                api_info['endpoints'].append({
-                                    'method': method.upper(),
-                                    'route': route,
-                                    'file': str(file_path.relative_to(self.base_dir))
-                                })
-                                
-                except Exception as e:
-                    continue
+        for info in self.snapshot.iter_files('server', ('.js',)):
+            try:
+                content = self.snapshot.read_text(info.path)
+                
+                # Find API routes
+                route_patterns = [
+                    r'app\.(get|post|put|delete|patch)\([\'"]([^\'"]+)[\'"]',
+                    r'router\.(get|post|put|delete|patch)\([\'"]([^\'"]+)[\'"]',
+                    r'\.route\([\'"]([^\'"]+)[\'"][^.]*\.(get|post|put|delete|patch)'
+                ]
+                
+                for pattern in route_patterns:
+                    matches = re.findall(pattern, content)
+                    for match in matches:
+                        if len(match) == 2:
+                            method, route = match
+                            api_info['endpoints'].append({
+                                'method': method.upper(),
+                                'route': route,
+                                'file': info.path
+                            })
+                            
+            except Exception as e:
+                continue
         
         # Generate HTML for API analysis
         self.add_html(f"""
@@ -828,7 +1008,10 @@ class CompleteProjectDiagnostic:
                 <div>API Endpoints</div>
             </div>
         </div>
+        """)
         
+        self.add_collapsible("API Endpoints", len(api_info['endpoints']), True)
+        self.add_html("""
         <table class="table">
             <thead>
                 <tr>
@@ -852,16 +1035,17 @@ class CompleteProjectDiagnostic:
             self.add_html(f"""
                 <tr>
                     <td><span class="badge {method_class}">{endpoint['method']}</span></td>
-                    <td>{endpoint['route']}</td>
-                    <td>{endpoint['file']}</td>
+                    <td>{html.escape(endpoint['route'])}</td>
+                    <td>{html.escape(endpoint['file'])}</td>
                 </tr>
             """)
         
         self.add_html("""
             </tbody>
         </table>
-        </div>
         """)
+        self.add_collapsible("API Endpoints", len(api_info['endpoints']), False)
+        self.add_html("</div>")
 
     def generate_summary(self):
         """Generate diagnostic summary"""
@@ -887,63 +1071,91 @@ class CompleteProjectDiagnostic:
         </div>
         """)
         
+        if self.section_durations:
+            total = sum(duration for _, duration in self.section_durations)
+            slowest = max(duration for _, duration in self.section_durations)
+            self.add_html(f"""
+        <h3>Section Timings</h3>
+        <p>Sections ran concurrently: {total:.2f}s of work, bounded by the slowest section ({slowest:.2f}s).</p>
+        <table class="table">
+            <thead>
+                <tr>
+                    <th>Section</th>
+                    <th>Duration</th>
+                </tr>
+            </thead>
+            <tbody>
+            """)
+            for name, duration in self.section_durations:
+                self.add_html(f"<tr><td>{name}</td><td>{duration:.2f}s</td></tr>")
+            self.add_html("""
+            </tbody>
+        </table>
+            """)
+        
         if self.errors:
-            self.add_html("<h3>Errors</h3>")
-            for error in self.errors:
-                self.add_html(f'<div class="error">❌ {error}</div>')
+            self.add_messages("Errors", self.errors, 'error', '❌')
         
         if self.warnings:
-            self.add_html("<h3>Warnings</h3>")
-            for warning in self.warnings:
-                self.add_html(f'<div class="warning">⚠️ {warning}</div>')
+            self.add_messages("Warnings", self.warnings, 'warning', '⚠️')
         
         if self.info:
-            self.add_html("<h3>Information</h3>")
-            for info in self.info:
-                self.add_html(f'<div class="info">ℹ️ {info}</div>')
+            self.add_messages("Information", self.info, 'info', 'ℹ️')
         
         self.add_html("</div>")
 
-    def build_directory_tree(self, path, max_depth=3, current_depth=0):
-        """Build directory tree structure"""
+    def build_directory_tree(self, rel_dir, max_depth=3, current_depth=0):
+        """Build directory tree structure from the snapshot
+        
+        Directories carry their subtree totals; directories with more than
+        MAX_TREE_FILES files list the first ones and summarize the rest.
+        """
         if current_depth >= max_depth:
             return {}
         
         tree = {}
-        try:
-            for item in path.iterdir():
-                if item.is_dir():
-                    tree[item.name] = {
-                        'type': 'directory',
-                        'children': self.build_directory_tree(item, max_depth, current_depth + 1)
-                    }
-                else:
-                    tree[item.name] = {
-                        'type': 'file',
-                        'size': item.stat().st_size
-                    }
-        except PermissionError:
-            tree['<Permission Denied>'] = {'type': 'error'}
+        subdirs, files = self.snapshot.listdir(rel_dir)
+        for name in subdirs:
+            child = f"{rel_dir}/{name}"
+            tree[name] = {
+                'type': 'directory',
+                'size': self.snapshot.dirs[child]['size'],
+                'file_count': self.snapshot.dirs[child]['file_count'],
+                'children': self.build_directory_tree(child, max_depth, current_depth + 1)
+            }
+        for name in files[:MAX_TREE_FILES]:
+            tree[name] = {
+                'type': 'file',
+                'size': self.snapshot.files[f"{rel_dir}/{name}"].size
+            }
+        if len(files) > MAX_TREE_FILES:
+            hidden = files[MAX_TREE_FILES:]
+            tree[f"... {len(hidden)} more files"] = {
+                'type': 'collapsed',
+                'size': sum(self.snapshot.files[f"{rel_dir}/{name}"].size for name in hidden)
+            }
         
         return tree
 
-    def render_directory_tree(self, tree, name, indent=0):
+    def render_directory_tree(self, tree, name, indent=0, totals=None):
         """Render directory tree as HTML"""
         indent_str = "  " * indent
         
-        if not tree:
+        if totals:
+            self.add_html(f"{indent_str}{html.escape(name)}/ ({totals['file_count']} files, {self.format_size(totals['size'])})\n")
+        elif tree:
+            self.add_html(f"{indent_str}{html.escape(name)}/\n")
+        else:
             return
         
-        self.add_html(f"{indent_str}{name}/\n")
-        
         for key, value in tree.items():
             if value['type'] == 'directory':
-                self.render_directory_tree(value.get('children', {}), key, indent + 1)
-            elif value['type'] == 'file':
+                self.render_directory_tree(value.get('children', {}), key, indent + 1, value)
+            elif value['type'] in ('file', 'collapsed'):
                 size_str = self.format_size(value['size'])
-                self.add_html(f"{indent_str}  {key} ({size_str})\n")
+                self.add_html(f"{indent_str}  {html.escape(key)} ({size_str})\n")
             else:
-                self.add_html(f"{indent_str}  {key}\n")
+                self.add_html(f"{indent_str}  {html.escape(key)}\n")
 
     def format_size(self, size):
         """Format file size in human readable format"""
@@ -962,7 +1174,7 @@ def main():
     args = parser.parse_args()
     
     # Create diagnostic instance
-    diagnostic = CompleteProjectDiagnostic(args.dir)
+    diagnostic = CompleteProjectDiagnostic(args.dir, args.output)
     
     try:
         # Run complete diagnostic
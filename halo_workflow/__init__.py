@@ -7,6 +7,7 @@ __author__ = "Halo Workflow Team"
 __license__ = "MIT"
 
 from .core.analyzer import WorkflowAnalyzer
+from .core.issues import Issue
 from .cli.main import main
 
-__all__ = ["WorkflowAnalyzer", "main"]
\ No newline at end of file
+__all__ = ["WorkflowAnalyzer", "Issue", "main"]
\ No newline at end of file
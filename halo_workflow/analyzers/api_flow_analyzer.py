@@ -88,6 +88,7 @@ class APIFlowAnalyzer:
                         'severity': 'warning',
                         'file': file_path,
                         'line': call.get('line', 0),
+                        'code': call.get('code', ''),
                         'message': "API 호출에 에러 처리가 없습니다"
                     })
         
@@ -118,6 +119,7 @@ class APIFlowAnalyzer:
                             'method': self._extract_method(line),
                             'endpoint': endpoint_match.group(1) if endpoint_match else None,
                             'url': url_match.group(0).strip('"\'') if url_match else None,
+                            'code': line.strip(),
                             'has_error_handling': self._check_error_handling(lines, i)
                         }
                         
@@ -153,6 +155,7 @@ class APIFlowAnalyzer:
                             'method': self._extract_method(line),
                             'endpoint': endpoint_match.group(1) if endpoint_match else None,
                             'url': url_match.group(0).strip('"\'') if url_match else None,
+                            'code': line.strip(),
                             'has_error_handling': self._check_js_error_handling(lines, i)
                         }
                         
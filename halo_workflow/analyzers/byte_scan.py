@@ -0,0 +1,155 @@
+"""
+바이트 단위 검사 도구
+
+파일 전체를 디코딩하지 않고 원본 바이트에서 줄 경계를 찾아, 컴파일된 bytes 패턴을
+pattern.finditer(data, start, end)로 줄 범위 안에서만 실행한다. 줄을 잘라 복사하지 않으며
+매치된 부분만 디코딩한다. 잘못된 UTF-8 바이트도 그대로 남아 있어 위치가 밀리지 않는다.
+
+아주 큰 파일은 iter_windows로 줄 경계에 맞춘 창(window) 단위로 읽어 같은 방식으로 검사한다.
+"""
+
+import re
+from typing import Dict, List, Iterator, Tuple, Iterable, NamedTuple, BinaryIO
+
+# 줄 앞 공백 (ASCII)
+_LEADING_SPACE = re.compile(rb'[ \t\r\f\v]*')
+
+# UTF-8 연속 바이트 (문자 수 계산 시 제외)
+_CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+
+# 긴 줄을 조각으로 나눌 때 주석 판별용으로 보관하는 줄 앞부분 크기
+LINE_HEAD_SIZE = 256
+
+
+class LineSpan(NamedTuple):
+    """검사할 줄 범위
+
+    line         줄 번호
+    start, end   검사 범위 (end는 줄바꿈 위치 또는 조각 끝)
+    limit        이 위치 이전에 시작하는 매치만 보고 (긴 줄 조각의 겹치는 뒷부분 제외)
+    column_base  start 앞에 있는 같은 줄의 문자 수 (긴 줄의 두 번째 조각부터 0이 아님)
+    first        이 위치부터 시작하는 매치만 보고 (긴 줄 조각의 겹치는 앞부분 제외)
+    head         긴 줄의 두 번째 조각부터 - 줄 앞부분 (주석 판별용)
+
+    긴 줄의 조각은 앞쪽 문맥부터 검사해야 이전 조각의 매치와 겹치는 짧은 매치가
+    새로 생기지 않는다 (전체를 한 번에 검사한 결과와 같아짐).
+    """
+    line: int
+    start: int
+    end: int
+    limit: int
+    column_base: int = 0
+    first: int = 0
+    head: bytes = b''
+
+
+def compile_bytes_patterns(patterns: Dict[str, List[str]], flags: int = re.IGNORECASE) -> Dict[str, List['re.Pattern']]:
+    """규칙별 str 정규식을 bytes 패턴으로 컴파일"""
+    return {
+        rule_id: [re.compile(pattern.encode('utf-8'), flags) for pattern in rule_patterns]
+        for rule_id, rule_patterns in patterns.items()
+    }
+
+
+def iter_line_spans(data: bytes, first_line: int = 1, start: int = 0,
+                    end_of_data: bool = True) -> Iterator[LineSpan]:
+    """data[start:]의 줄 범위 순회 (end_of_data가 False면 마지막 줄바꿈 뒤의 나머지는 제외)"""
+    line_num = first_line
+    length = len(data)
+    while True:
+        end = data.find(b'\n', start)
+        if end < 0:
+            if end_of_data:
+                yield LineSpan(line_num, start, length, length + 1)
+            return
+        yield LineSpan(line_num, start, end, end + 1)
+        start = end + 1
+        line_num += 1
+
+
+def iter_windows(stream: BinaryIO, window_size: int, overlap: int) -> Iterator[Tuple[bytes, List[LineSpan]]]:
+    """큰 파일을 줄 경계에 맞춘 창 단위로 읽음 - (창 바이트, 창 안의 줄 범위 목록)
+
+    줄 번호는 창을 넘어 이어서 센다. 한 줄이 window_size보다 길면 그 줄을 앞뒤로
+    overlap만큼 겹치는 조각으로 나누고, 각 조각은 자기 구간에서 시작하는 매치만
+    보고한다. 따라서 길이가 overlap 이하인 매치는 경계에 걸쳐도 정확히 한 번 보고된다.
+    메모리는 파일 크기와 관계없이 약 2 * window_size + 2 * overlap 으로 제한된다.
+    """
+    buf = b''
+    # buf 앞부분 중 이전 조각과 겹치는 문맥 길이 (긴 줄을 처리하는 중일 때만 0이 아님)
+    context = 0
+    # buf 시작 앞에 있는 같은 줄의 문자 수와 그 줄의 앞부분
+    column_base = 0
+    line_head = b''
+    line_num = 1
+    eof = False
+
+    while True:
+        if not eof and len(buf) - context < window_size + overlap:
+            chunk = stream.read(window_size)
+            if chunk:
+                buf += chunk
+                continue
+            eof = True
+
+        cut = buf.rfind(b'\n', context)
+        if cut >= 0 or eof:
+            # 완전한 줄들 (파일 끝이면 나머지 전부)
+            window = buf if eof else buf[:cut + 1]
+            spans = list(iter_line_spans(window, line_num, context, end_of_data=eof))
+            if spans and context:
+                spans[0] = spans[0]._replace(start=0, column_base=column_base, first=context, head=line_head)
+            if spans:
+                yield window, spans
+            if eof:
+                return
+
+            line_num += len(spans)
+            buf = buf[cut + 1:]
+            context = 0
+            column_base = 0
+            line_head = b''
+        else:
+            # 줄바꿈 없이 window_size + overlap 이상 - 긴 줄의 조각
+            owned_end = context + window_size
+            window = buf[:owned_end + overlap]
+            if not column_base:
+                line_head = buf[:LINE_HEAD_SIZE]
+            yield window, [LineSpan(line_num, 0, len(window), owned_end, column_base, context, line_head)]
+
+            # 다음 조각 앞에 문맥으로 남길 부분 (overlap이 window_size보다 커도 버퍼 밖으로 나가지 않도록)
+            context = min(overlap, owned_end)
+            column_base += count_chars(buf[:owned_end - context])
+            buf = buf[owned_end - context:]
+
+
+def count_chars(data: bytes) -> int:
+    """UTF-8 바이트의 문자 수 (연속 바이트 제외)"""
+    if data.isascii():
+        return len(data)
+    return len(data.translate(None, _CONTINUATION_BYTES))
+
+
+def starts_with_any(data: bytes, start: int, end: int, prefixes: Iterable[bytes]) -> bool:
+    """줄 앞 공백을 건너뛴 위치가 prefixes 중 하나로 시작하는지 (주석 판별용)"""
+    position = _LEADING_SPACE.match(data, start, end).end()
+    return any(data.startswith(prefix, position, end) for prefix in prefixes)
+
+
+def is_comment_span(data: bytes, span: LineSpan, prefixes: Iterable[bytes]) -> bool:
+    """범위가 속한 줄이 주석인지 (긴 줄의 뒤 조각은 보관된 줄 앞부분으로 판별)"""
+    if not prefixes:
+        return False
+    if span.column_base == 0:
+        return starts_with_any(data, span.start, span.end, prefixes)
+    return starts_with_any(span.head, 0, len(span.head), prefixes)
+
+
+def char_column(data: bytes, line_start: int, offset: int) -> int:
+    """바이트 오프셋을 줄 안의 문자 위치로 변환 (디코딩 없이 UTF-8 연속 바이트를 빼고 셈)"""
+    return count_chars(data[line_start:offset])
+
+
+def decode_fragment(fragment: bytes) -> str:
+    """매치된 부분 디코딩 (표시용)"""
+    return fragment.decode('utf-8', errors='replace')
@@ -4,12 +4,26 @@
 
 import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterable
+
+from .byte_scan import (
+    LineSpan, compile_bytes_patterns, iter_line_spans, is_comment_span, char_column, decode_fragment
+)
 
 
 class DummyDataDetector:
     """의미 없는 더미 데이터 탐지"""
     
+    # 레지스트리 선언 (데이터/설정 파일의 값은 더미 데이터로 보지 않음)
+    name = 'dummy_data'
+    issue_type = 'dummy_data'
+    languages = [
+        'python', 'javascript', 'typescript', 'java', 'kotlin', 'swift',
+        'c', 'cpp', 'csharp', 'go', 'ruby', 'php', 'rust'
+    ]
+    extensions = None
+    rule_ids = ['dummy_data']
+    
     def __init__(self):
         # 더미 데이터 패턴
         self.dummy_patterns = [
@@ -31,40 +45,72 @@ class DummyDataDetector:
             'example_files': [r'example', r'sample', r'demo'],
             'documentation': [r'\.md$', r'\.rst$', r'\.txt$'],
         }
+        
+        # 컴파일된 패턴 (detect, detect_bytes 모두 바이트 단위로 검사)
+        self.bytes_patterns = compile_bytes_patterns({'dummy_data': self.dummy_patterns})['dummy_data']
+        
+        # 확장자별 주석 시작 문자열 (앞의 공백을 제외한 줄 시작)
+        self.comment_prefixes = {
+            '.py': (b'#',),
+            '.js': (b'//', b'/*'), '.ts': (b'//', b'/*'), '.jsx': (b'//', b'/*'), '.tsx': (b'//', b'/*'),
+        }
     
     def detect(self, content: str, file_path: Path) -> List[Dict[str, Any]]:
-        """더미 데이터 탐지"""
+        """더미 데이터 탐지 (문자열 입력 - UTF-8로 인코딩해 detect_bytes와 같은 규칙으로 검사)"""
+        return self.detect_bytes(content.encode('utf-8', 'surrogatepass'), file_path)
+    
+    def detect_bytes(self, data: bytes, file_path: Path, fast: bool = False,
+                     spans: Optional[Iterable[LineSpan]] = None) -> List[Dict[str, Any]]:
+        """더미 데이터 탐지 (원본 바이트에서 검사, 매치된 값만 디코딩)
+        
+        spans를 지정하면 해당 줄 범위만 검사한다 (큰 파일의 창 단위 검사).
+        """
         issues = []
         
         # 테스트 파일이나 예제 파일은 검사하지 않음
-        if self._is_allowed_file(file_path):
+        if not self.applies_to(file_path):
             return issues
         
-        lines = content.split('\n')
+        comment_prefixes = self.comment_prefixes.get(file_path.suffix, ())
         
-        for line_num, line in enumerate(lines, 1):
+        for span in iter_line_spans(data) if spans is None else spans:
             # 주석은 스킵
-            if self._is_comment(line, file_path):
+            if is_comment_span(data, span, comment_prefixes):
                 continue
             
-            for pattern in self.dummy_patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
-                
-                for match in matches:
-                    # 문자열 내부에 있는지 확인
-                    if self._is_in_string(line, match.start(), match.end()):
-                        issue = {
-                            'line': line_num,
-                            'column': match.start(),
+            start = span.start
+            for pattern in self.bytes_patterns:
+                for match in pattern.finditer(data, start, span.end):
+                    if match.start() >= span.limit:
+                        break
+                    if match.start() < span.first:
+                        continue
+                    # 줄(긴 줄은 조각) 시작부터 매치 전까지 따옴표가 홀수 개면 문자열 내부
+                    quote_count = data.count(b'"', start, match.start()) + data.count(b"'", start, match.start())
+                    if quote_count % 2 == 1:
+                        value = decode_fragment(match.group(0))
+                        issues.append({
+                            'line': span.line,
+                            'column': span.column_base + char_column(data, start, match.start()),
                             'type': 'dummy_data',
-                            'value': match.group(0),
-                            'message': f"의미 없는 더미 데이터 '{match.group(0)}' 사용",
+                            'value': value,
+                            'message': f"의미 없는 더미 데이터 '{value}' 사용",
                             'severity': 'warning'
-                        }
-                        issues.append(issue)
+                        })
         
         return issues
     
+    def applies_to(self, file_path: Path) -> bool:
+        """경로에 따른 규칙 - 테스트/예제/문서 파일은 검사하지 않음
+        
+        경로 규칙은 여기에만 두므로 내용이 같은 파일은 검사 결과를 재사용할 수 있다.
+        """
+        return not self._is_allowed_file(file_path)
+    
+    def rule_patterns(self) -> Dict[str, List[str]]:
+        """규칙별 정규식 (로드 시 백트래킹 위험 검사에 사용)"""
+        return {'dummy_data': self.dummy_patterns}
+    
     def _is_allowed_file(self, file_path: Path) -> bool:
         """허용된 파일 타입인지 확인"""
         path_str = str(file_path).lower()
@@ -75,23 +121,3 @@ class DummyDataDetector:
                     return True
         
         return False
-    
-    def _is_comment(self, line: str, file_path: Path) -> bool:
-        """주석 라인인지 확인"""
-        line = line.strip()
-        
-        if file_path.suffix in ['.py']:
-            return line.startswith('#')
-        elif file_path.suffix in ['.js', '.ts', '.jsx', '.tsx']:
-            return line.startswith('//') or line.startswith('/*')
-        
-        return False
-    
-    def _is_in_string(self, line: str, start: int, end: int) -> bool:
-        """매치가 문자열 내부에 있는지 확인"""
-        # 간단한 문자열 검사 (완벽하지 않음)
-        before = line[:start]
-        quote_count = before.count('"') + before.count("'")
-        
-        # 홀수면 문자열 내부
-        return quote_count % 2 == 1
\ No newline at end of file
@@ -1,79 +1,205 @@
 """
 중복 코드 탐지기
+
+Python 파일은 ast 정규화 해시로 이름/상수만 다른 함수, 클래스(Type-2 복제)를 찾고,
+그 밖의 파일(또는 파싱할 수 없는 Python 파일)은 공백을 정규화한 텍스트 블록을 비교한다.
 """
 
 import hashlib
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 from collections import defaultdict
 
+from .python_clones import fingerprint_python
+
 
 class DuplicateDetector:
     """중복 코드 및 파일 탐지"""
     
+    # 블록 시작으로 보는 키워드
+    BLOCK_KEYWORDS = ['def ', 'class ', 'function ', 'const ', 'var ', 'let ']
+    
     def __init__(self, min_lines: int = 10, similarity_threshold: float = 0.9):
         self.min_lines = min_lines
         self.similarity_threshold = similarity_threshold
         self.file_hashes = defaultdict(list)
         self.code_blocks = defaultdict(list)
+        # 정규화 AST 해시 → 함수/클래스 위치 (Python 복제 버킷)
+        self.clone_buckets = defaultdict(list)
     
     def add_file(self, file_path: Path, content: str):
         """파일 추가"""
+        self.add_fingerprints(str(file_path), self.fingerprint_file(content, Path(file_path).suffix))
+    
+    def fingerprint_file(self, content: Union[str, bytes], suffix: str = '') -> Dict[str, Any]:
+        """파일 및 코드 블록 해시 계산 (JSON 직렬화 가능, 샤드 간 병합용)
+        
+        bytes를 받으면 디코딩하지 않고 처리한다. ASCII 공백만 쓰는 UTF-8 파일은
+        str로 처리한 것과 해시가 같다. suffix가 '.py'이고 파싱에 성공하면
+        텍스트 블록 대신 함수/클래스별 정규화 AST 해시('clones')를 담는다.
+        """
+        if suffix == '.py':
+            clones = fingerprint_python(content, self.min_lines)
+            if clones is not None:
+                return {'hash': self._hash_content(content), 'blocks': [], 'clones': clones}
+        
+        return {
+            'hash': self._hash_content(content),
+            'blocks': [
+                {
+                    'hash': self._hash_content(block['content']),
+                    'start_line': block['start_line'],
+                    'end_line': block['end_line']
+                }
+                for block in self._extract_code_blocks(content)
+            ]
+        }
+    
+    def add_fingerprints(self, file_path: str, fingerprints: Dict[str, Any]):
+        """fingerprint_file 결과 등록"""
         # 전체 파일 해시
-        file_hash = self._hash_content(content)
-        self.file_hashes[file_hash].append(str(file_path))
-        
-        # 코드 블록 추출 및 저장
-        blocks = self._extract_code_blocks(content)
-        for block in blocks:
-            block_hash = self._hash_content(block['content'])
-            self.code_blocks[block_hash].append({
-                'file': str(file_path),
+        self.file_hashes[fingerprints['hash']].append(file_path)
+        
+        # 코드 블록 해시
+        for block in fingerprints['blocks']:
+            self.code_blocks[block['hash']].append({
+                'file': file_path,
                 'start_line': block['start_line'],
-                'end_line': block['end_line'],
-                'content': block['content']
+                'end_line': block['end_line']
             })
+        
+        # Python 함수/클래스 정규화 해시
+        for clone in fingerprints.get('clones', []):
+            self.clone_buckets[clone['hash']].append(dict(clone, file=file_path))
     
     def find_duplicates(self) -> List[Dict[str, Any]]:
-        """중복 찾기"""
-        duplicates = []
+        """중복 찾기 - 같은 코드를 묶은 복제 묶음(clone class) 목록
+        
+        해시 버킷(동일 파일, 코드 블록, Python 함수/클래스)을 노드로 두고, 위치가 같은 버킷과
+        모든 위치가 다른 버킷 안에 들어 있는 버킷(복제된 클래스의 메서드, 동일 파일 안에만 있는
+        블록 등)만 union-find로 합친다. 일부 위치만 겹치는 버킷은 서로 다른 복제이므로 합치지
+        않는다. 같은 블록을 50개 파일이 공유해도 묶음 하나로 보고되며, 묶음 안에서 파일별로
+        겹치는 줄 범위는 하나로 합친다.
+        """
+        # 버킷별 위치 목록 (file, start_line, end_line, name) - end_line이 None이면 파일 전체
+        buckets = []
         
         # 완전 중복 파일
-        for file_hash, files in self.file_hashes.items():
+        for files in self.file_hashes.values():
             if len(files) > 1:
+                buckets.append([(file_path, 1, None, None) for file_path in files])
+        
+        # 중복 코드 블록 (같은 파일 내 중복은 제외)
+        for blocks in self.code_blocks.values():
+            if len({block['file'] for block in blocks}) > 1:
+                buckets.append([(b['file'], b['start_line'], b['end_line'], None) for b in blocks])
+        
+        # Python 함수/클래스 (같은 파일 안의 복제 포함)
+        for clones in self.clone_buckets.values():
+            if len(clones) > 1:
+                buckets.append([(c['file'], c['start_line'], c['end_line'], c['name']) for c in clones])
+        
+        by_file = defaultdict(list)
+        for index, locations in enumerate(buckets):
+            for file_path, start_line, end_line, _ in locations:
+                by_file[file_path].append((start_line, float('inf') if end_line is None else end_line, index))
+        
+        # 위치별로 그 위치를 감싸는 버킷을 찾아, 버킷의 모든 위치를 감싸는 버킷만 남김
+        sets = _DisjointSet(len(buckets))
+        containers = {}
+        for locations in by_file.values():
+            locations.sort(key=lambda location: (location[0], -location[1]))
+            enclosing = []
+            for start_line, end_line, index in locations:
+                enclosing = [outer for outer in enclosing if outer[1] >= start_line]
+                inside = set()
+                for outer_start, outer_end, outer in enclosing:
+                    if outer == index or outer_end < end_line:
+                        continue
+                    if (outer_start, outer_end) == (start_line, end_line):
+                        sets.union(outer, index)
+                    inside.add(outer)
+                containers[index] = inside if index not in containers else containers[index] & inside
+                enclosing.append((start_line, end_line, index))
+        for index, inside in containers.items():
+            for outer in inside:
+                sets.union(outer, index)
+        
+        # 묶음별 집계 (실행마다 같은 순서가 되도록 버킷 등장 순서 유지)
+        classes = {}
+        for index, locations in enumerate(buckets):
+            clone_class = classes.setdefault(
+                sets.find(index), {'occurrences': 0, 'whole_file': False, 'files': defaultdict(list)}
+            )
+            clone_class['occurrences'] += len(locations)
+            for file_path, start_line, end_line, name in locations:
+                if end_line is None:
+                    clone_class['whole_file'] = True
+                clone_class['files'][file_path].append(
+                    (start_line, float('inf') if end_line is None else end_line, name)
+                )
+        
+        # 묶음 안에서 파일별로 겹치는 범위를 하나로 합침
+        for clone_class in classes.values():
+            blocks = clone_class['blocks'] = []
+            for file_path, locations in clone_class.pop('files').items():
+                locations.sort(key=lambda location: location[:2])
+                block = None
+                for start_line, end_line, name in locations:
+                    if block is not None and start_line <= block['end_line']:
+                        block['end_line'] = max(block['end_line'], end_line)
+                    else:
+                        block = {'file': file_path, 'start_line': start_line, 'end_line': end_line}
+                        blocks.append(block)
+                    if name and name not in block.setdefault('names', []):
+                        block['names'].append(name)
+            for block in blocks:
+                if block['end_line'] == float('inf'):
+                    block['end_line'] = None
+        
+        duplicates = []
+        for clone_class in classes.values():
+            blocks = clone_class['blocks']
+            files = list(dict.fromkeys(block['file'] for block in blocks))
+            if clone_class['whole_file']:
                 duplicates.append({
                     'type': 'file_duplicate',
                     'files': files,
+                    'blocks': blocks,
+                    'occurrences': clone_class['occurrences'],
                     'similarity': 100,
                     'message': f"{len(files)}개의 완전히 동일한 파일"
                 })
-        
-        # 중복 코드 블록
-        for block_hash, blocks in self.code_blocks.items():
-            if len(blocks) > 1:
-                # 같은 파일 내 중복은 제외
-                unique_files = set(b['file'] for b in blocks)
-                if len(unique_files) > 1:
-                    duplicates.append({
-                        'type': 'code_duplicate',
-                        'blocks': blocks,
-                        'files': list(unique_files),
-                        'similarity': 100,
-                        'message': f"{len(blocks)}개의 중복 코드 블록 발견"
-                    })
+            else:
+                duplicates.append({
+                    'type': 'clone_class',
+                    'files': files,
+                    'blocks': blocks,
+                    'occurrences': clone_class['occurrences'],
+                    'similarity': 100,
+                    'message': f"{len(blocks)}곳의 같은 코드 ({len(files)}개 파일)"
+                })
         
         return duplicates
     
-    def _hash_content(self, content: str) -> str:
+    def _hash_content(self, content: Union[str, bytes]) -> str:
         """콘텐츠 해시 생성"""
         # 공백 정규화
+        if isinstance(content, bytes):
+            return hashlib.md5(b' '.join(content.split())).hexdigest()
         normalized = ' '.join(content.split())
         return hashlib.md5(normalized.encode()).hexdigest()
     
-    def _extract_code_blocks(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_code_blocks(self, content: Union[str, bytes]) -> List[Dict[str, Any]]:
         """코드 블록 추출"""
         blocks = []
-        lines = content.split('\n')
+        if isinstance(content, bytes):
+            newline, comments = b'\n', (b'#', b'//')
+            keywords = [keyword.encode() for keyword in self.BLOCK_KEYWORDS]
+        else:
+            newline, comments = '\n', ('#', '//')
+            keywords = self.BLOCK_KEYWORDS
+        lines = content.split(newline)
         
         # 함수/클래스 단위로 블록 추출 (간단한 버전)
         current_block = []
@@ -84,16 +210,16 @@ class DuplicateDetector:
             stripped = line.strip()
             
             # 빈 줄이나 주석은 스킵
-            if not stripped or stripped.startswith('#') or stripped.startswith('//'):
+            if not stripped or stripped.startswith(comments):
                 continue
             
             # 함수/클래스 시작 감지
-            if any(keyword in stripped for keyword in ['def ', 'class ', 'function ', 'const ', 'var ', 'let ']):
+            if any(keyword in stripped for keyword in keywords):
                 # 이전 블록 저장
                 if len(current_block) >= self.min_lines:
                     blocks.append({
-                        'content': '\n'.join(current_block),
-                        'start_line': start_line,
+                        'content': newline.join(current_block),
+                        'start_line': start_line + 1,
                         'end_line': i
                     })
                 
@@ -110,8 +236,8 @@ class DuplicateDetector:
                     # 블록 종료
                     if len(current_block) >= self.min_lines:
                         blocks.append({
-                            'content': '\n'.join(current_block),
-                            'start_line': start_line,
+                            'content': newline.join(current_block),
+                            'start_line': start_line + 1,
                             'end_line': i
                         })
                     current_block = []
@@ -119,9 +245,31 @@ class DuplicateDetector:
         # 마지막 블록 처리
         if len(current_block) >= self.min_lines:
             blocks.append({
-                'content': '\n'.join(current_block),
-                'start_line': start_line,
+                'content': newline.join(current_block),
+                'start_line': start_line + 1,
                 'end_line': len(lines)
             })
         
-        return blocks
\ No newline at end of file
+        return blocks
+
+class _DisjointSet:
+    """union-find (경로 압축, 크기 기준 합치기)"""
+    
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+    
+    def find(self, node: int) -> int:
+        while self.parent[node] != node:
+            self.parent[node] = self.parent[self.parent[node]]
+            node = self.parent[node]
+        return node
+    
+    def union(self, first: int, second: int):
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return
+        if self.size[first] < self.size[second]:
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] += self.size[second]
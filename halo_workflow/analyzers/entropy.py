@@ -0,0 +1,169 @@
+"""
+엔트로피 기반 비밀 값 판별
+
+문자열 리터럴 안의 키 모양 토큰을 후보로 뽑아(변수 이름, 딕셔너리 키, 헤더 값과 관계없이) 문자 집합 종류와 섀넌 엔트로피로
+무작위 문자열(API 키, 토큰)인지 판별한다. 알파벳, 숫자를 차례로 나열한 상수는 제외한다. 후보는 파일 단위로 모아 한 번에 계산하며,
+NumPy가 있으면 바이트 히스토그램을 배열 연산으로 계산하고 없으면 순수 Python으로 계산한다.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import List, Optional, Sequence, Tuple, Iterator, AnyStr, Pattern, Match
+
+try:
+    import numpy as np
+except ImportError:
+    # 선택 의존성 - 없으면 순수 Python으로 계산
+    np = None
+
+# 후보 토큰: 한 줄짜리 문자열 리터럴 안에 있는 20~256자의 키 모양 문자열
+MIN_TOKEN_LENGTH = 20
+MAX_TOKEN_LENGTH = 256
+STRING_LITERAL_PATTERN = r'"[^"\n]{%d,2048}"|\'[^\'\n]{%d,2048}\'|`[^`\n]{%d,2048}`' % ((MIN_TOKEN_LENGTH,) * 3)
+TOKEN_PATTERN = r'(?<![A-Za-z0-9+/=_\-.])[A-Za-z0-9+/=_\-.]{%d,%d}(?![A-Za-z0-9+/=_\-.])' % (
+    MIN_TOKEN_LENGTH, MAX_TOKEN_LENGTH
+)
+
+# 문자 집합 종류별 알파벳 크기 (엔트로피 상한 계산용)
+CHARSET_SIZES = {'hex': 16, 'base64': 64, 'base64url': 64, 'jwt': 65}
+
+# 엔트로피가 log2(min(길이, 알파벳 크기))의 이 비율 이상이면 무작위 문자열로 간주
+# (무작위 base64/hex는 0.85~0.95, 중복 글자가 많은 일반 문자열은 그 아래)
+ENTROPY_RATIO = 0.8
+
+# 이웃한 글자 쌍 중 코드 값이 1씩 오르거나 내리는 쌍이 이 비율 이상이면 연속 문자열로 보고 제외
+# (ABC...Z0123456789 같은 알파벳 상수는 글자가 모두 달라 엔트로피가 최대지만 무작위가 아님,
+#  무작위 base64에서는 3% 정도)
+MAX_SEQUENTIAL_RATIO = 0.5
+
+# NumPy 한 번에 계산하는 토큰 수 (토큰 수 x 256 히스토그램 메모리 제한)
+BATCH_SIZE = 4096
+# 이보다 적으면 배열 생성 비용이 더 커서 순수 Python으로 계산
+NUMPY_MIN_TOKENS = 64
+
+_HEX = re.compile(rb'[0-9a-fA-F]+')
+_BASE64 = re.compile(rb'[A-Za-z0-9+/]+={0,2}')
+_BASE64URL = re.compile(rb'[A-Za-z0-9_\-]+={0,2}')
+_JWT = re.compile(rb'eyJ[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+')
+_DIGIT = re.compile(rb'[0-9]')
+_ALPHA = re.compile(rb'[A-Za-z]')
+_RUNS = re.compile(rb'[A-Z]+|[a-z]+|[0-9]+|[^A-Za-z0-9]+')
+
+
+def iter_candidates(literal_pattern: Pattern[AnyStr], token_pattern: Pattern[AnyStr],
+                    text: AnyStr, start: int, end: int) -> Iterator[Match[AnyStr]]:
+    """text[start:end]의 문자열 리터럴 안에 있는 후보 토큰 매치 (str, bytes 모두 가능)"""
+    for literal in literal_pattern.finditer(text, start, end):
+        yield from token_pattern.finditer(text, literal.start() + 1, literal.end() - 1)
+
+
+def charset_class(token: bytes) -> Optional[str]:
+    """토큰의 문자 집합 종류 (키 모양이 아니면 None)
+
+    글자와 숫자가 섞여 있어야 하고, 단어로 이루어진 식별자(상수 이름 등)는 제외한다.
+    점이 들어간 문자열(버전, 파일 이름, 호스트)은 JWT 형태만 허용한다.
+    """
+    if not _DIGIT.search(token) or not _ALPHA.search(token):
+        return None
+    if _HEX.fullmatch(token):
+        return 'hex'
+    if _JWT.fullmatch(token):
+        return 'jwt'
+    if _is_identifier(token):
+        return None
+    if _BASE64.fullmatch(token):
+        return 'base64'
+    if _BASE64URL.fullmatch(token):
+        return 'base64url'
+    return None
+
+
+def entropies(tokens: Sequence[bytes]) -> List[float]:
+    """토큰별 바이트 섀넌 엔트로피 (bits/byte)"""
+    if np is None or len(tokens) < NUMPY_MIN_TOKENS:
+        return [_entropy(token) for token in tokens]
+
+    result: List[float] = []
+    for offset in range(0, len(tokens), BATCH_SIZE):
+        result.extend(_entropies_numpy(tokens[offset:offset + BATCH_SIZE]))
+    return result
+
+
+def score_tokens(tokens: Sequence[bytes]) -> List[Optional[Tuple[str, float]]]:
+    """토큰별 판별 결과 - 비밀 값이면 (문자 집합 종류, 엔트로피), 아니면 None"""
+    classes = [charset_class(token) for token in tokens]
+    indexes = [
+        i for i, charset in enumerate(classes)
+        if charset is not None and not _is_sequential(tokens[i])
+    ]
+
+    scores: List[Optional[Tuple[str, float]]] = [None] * len(tokens)
+    for i, entropy in zip(indexes, entropies([tokens[i] for i in indexes])):
+        charset = classes[i]
+        limit = math.log2(min(len(tokens[i]), CHARSET_SIZES[charset]))
+        if entropy >= ENTROPY_RATIO * limit:
+            scores[i] = (charset, entropy)
+    return scores
+
+
+def _is_identifier(token: bytes) -> bool:
+    """단어, 숫자, 구분자로만 이루어졌는지 (상수/함수 이름, 라이선스 id 등)
+
+    한 글자 조각은 숫자에 붙어 있거나(X64, v2), 단어 첫 글자이거나(Remove),
+    구분자 사이에 혼자 있을 때만 허용한다. 무작위 문자열에는 그 밖의 한 글자
+    조각이 거의 항상 섞여 있다. 대문자와 숫자만 있는 토큰(AWS 액세스 키 등)은
+    식별자로 보지 않는다.
+    """
+    runs = _RUNS.findall(token)
+    has_lower = has_separator = False
+    for i, run in enumerate(runs):
+        if run.isdigit():
+            continue
+        if not run.isalpha():
+            has_separator = True
+            continue
+        if run.islower():
+            has_lower = True
+        if len(run) > 1:
+            continue
+
+        previous = runs[i - 1] if i > 0 else b''
+        following = runs[i + 1] if i + 1 < len(runs) else b''
+        if previous.isdigit() or following.isdigit():
+            continue
+        if run.isupper() and following.islower():
+            continue
+        if not previous.isalpha() and not following.isalpha():
+            continue
+        return False
+    return has_lower or has_separator
+
+
+def _is_sequential(token: bytes) -> bool:
+    """대부분 1씩 오르거나 내리는 글자 연속인지 (알파벳, 숫자 나열 상수)"""
+    steps = sum(1 for a, b in zip(token, token[1:]) if abs(a - b) == 1)
+    return steps >= MAX_SEQUENTIAL_RATIO * (len(token) - 1)
+
+
+def _entropy(token: bytes) -> float:
+    """토큰 하나의 엔트로피 (순수 Python)"""
+    total = len(token)
+    return -sum(count / total * math.log2(count / total) for count in Counter(token).values())
+
+
+def _entropies_numpy(tokens: Sequence[bytes]) -> List[float]:
+    """토큰 묶음의 엔트로피 - 토큰별 바이트 히스토그램을 한 번의 bincount로 계산"""
+    if not tokens:
+        return []
+
+    count = len(tokens)
+    lengths = np.fromiter((len(token) for token in tokens), dtype=np.int64, count=count)
+    data = np.frombuffer(b''.join(tokens), dtype=np.uint8)
+    owners = np.repeat(np.arange(count, dtype=np.int64), lengths)
+
+    histograms = np.bincount(owners * 256 + data, minlength=count * 256).reshape(count, 256)
+    probabilities = histograms / lengths[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(histograms > 0, probabilities * np.log2(probabilities), 0.0)
+    return (-terms.sum(axis=1)).tolist()
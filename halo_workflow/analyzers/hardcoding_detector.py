@@ -4,12 +4,33 @@
 
 import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterable
+
+from .byte_scan import (
+    LineSpan, compile_bytes_patterns, iter_line_spans, is_comment_span, char_column, decode_fragment
+)
+from .entropy import STRING_LITERAL_PATTERN, TOKEN_PATTERN, iter_candidates, score_tokens
+
+# 문제에 기록하는 리터럴 값의 최대 길이 (프로젝트 전체 리터럴 색인용)
+MAX_LITERAL_LENGTH = 200
+
+# 매치에서 리터럴 값을 꺼내는 패턴 (따옴표 안의 문자열, 끝의 숫자)
+_QUOTED = re.compile(r'["\']([^"\']*)["\']')
+_TRAILING_NUMBER = re.compile(r'\d+$')
 
 
 class HardcodingDetector:
     """하드코딩된 값 탐지"""
     
+    # 레지스트리 선언 (설정 파일의 URL/비밀번호도 대상이므로 모든 파일에 적용)
+    name = 'hardcoding'
+    issue_type = 'hardcoding'
+    languages = None
+    extensions = None
+    rule_ids = ['api_key', 'password', 'url', 'path', 'port', 'database', 'email', 'secret']
+    # 생성 코드/압축 파일에 적용하는 빠른 규칙 (비밀 값 유출만 확인)
+    fast_rule_ids = ['api_key', 'database']
+    
     def __init__(self):
         # 하드코딩 패턴 정의
         self.patterns = {
@@ -61,63 +82,161 @@ class HardcodingDetector:
             r'TODO',
             r'FIXME',
         ]
+        
+        # 컴파일된 패턴 (detect, detect_bytes 모두 바이트 단위로 검사)
+        self.bytes_patterns = compile_bytes_patterns(self.patterns)
+        
+        # secret 규칙: 변수 이름과 관계없이 문자열 리터럴 안의 키 모양 토큰을 엔트로피로 판별
+        self.secret_bytes_patterns = (
+            re.compile(STRING_LITERAL_PATTERN.encode('utf-8')), re.compile(TOKEN_PATTERN.encode('utf-8'))
+        )
+        
+        # 확장자별 주석 시작 문자열 (앞의 공백을 제외한 줄 시작)
+        self.comment_prefixes = {
+            '.py': (b'#',), '.rb': (b'#',),
+            '.js': (b'//', b'/*'), '.ts': (b'//', b'/*'), '.jsx': (b'//', b'/*'), '.tsx': (b'//', b'/*'),
+            '.java': (b'//', b'/*'), '.c': (b'//', b'/*'), '.cpp': (b'//', b'/*'),
+            '.php': (b'//', b'#'),
+        }
     
-    def detect(self, content: str, file_path: Path) -> List[Dict[str, Any]]:
-        """하드코딩 탐지"""
+    def detect(self, content: str, file_path: Path,
+               rule_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """하드코딩 탐지 (rule_ids를 지정하면 해당 규칙만 검사)
+        
+        문자열 입력은 UTF-8로 인코딩해 detect_bytes와 같은 규칙으로 검사한다.
+        """
+        return self.detect_bytes(content.encode('utf-8', 'surrogatepass'), file_path, rule_ids=rule_ids)
+    
+    def detect_bytes(self, data: bytes, file_path: Path, fast: bool = False,
+                     spans: Optional[Iterable[LineSpan]] = None,
+                     rule_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """하드코딩 탐지 (원본 바이트에서 검사, 매치된 값만 디코딩)
+        
+        spans를 지정하면 해당 줄 범위만 검사한다 (큰 파일의 창 단위 검사).
+        fast이면 빠른 규칙만, rule_ids를 지정하면 해당 규칙만 검사한다.
+        """
         issues = []
-        lines = content.split('\n')
         
-        # 파일 확장자별 처리
-        if file_path.suffix in ['.env', '.env.example', '.env.sample']:
-            # 환경 변수 파일은 검사하지 않음
+        # 환경 변수 파일은 검사하지 않음
+        if not self.applies_to(file_path):
             return issues
         
-        for line_num, line in enumerate(lines, 1):
+        if rule_ids is None and fast:
+            rule_ids = self.fast_rule_ids
+        patterns = [
+            (pattern_type, pattern)
+            for pattern_type, type_patterns in self.bytes_patterns.items()
+            if rule_ids is None or pattern_type in rule_ids
+            for pattern in type_patterns
+        ]
+        comment_prefixes = self.comment_prefixes.get(file_path.suffix, ())
+        check_secrets = rule_ids is None or 'secret' in rule_ids
+        # secret 후보 (줄 번호, 열, 토큰) - 파일 단위로 모아 한 번에 판별
+        candidates = []
+        
+        for span in iter_line_spans(data) if spans is None else spans:
             # 주석 라인 스킵
-            if self._is_comment(line, file_path):
+            if is_comment_span(data, span, comment_prefixes):
                 continue
             
-            # 각 패턴 타입별 검사
-            for pattern_type, patterns in self.patterns.items():
-                for pattern in patterns:
-                    matches = re.finditer(pattern, line, re.IGNORECASE)
+            # 다른 규칙에 매치된 범위 (secret 규칙이 같은 값을 다시 보고하지 않도록)
+            covered = []
+            for pattern_type, pattern in patterns:
+                for match in pattern.finditer(data, span.start, span.end):
+                    if match.start() >= span.limit:
+                        break
+                    covered.append(match.span())
+                    if match.start() < span.first:
+                        continue
+                    value = decode_fragment(match.group(0))
+                    # 예외 체크
+                    if self._is_exception(value):
+                        continue
                     
-                    for match in matches:
-                        # 예외 체크
-                        if self._is_exception(match.group(0)):
-                            continue
-                        
-                        issue = {
-                            'line': line_num,
-                            'column': match.start(),
-                            'type': pattern_type,
-                            'value': match.group(0)[:50] + '...' if len(match.group(0)) > 50 else match.group(0),
-                            'message': f"하드코딩된 {pattern_type} 발견",
-                            'severity': 'error' if pattern_type in ['api_key', 'password'] else 'warning'
-                        }
-                        issues.append(issue)
+                    issues.append({
+                        'line': span.line,
+                        'column': span.column_base + char_column(data, span.start, match.start()),
+                        'type': pattern_type,
+                        'value': value[:50] + '...' if len(value) > 50 else value,
+                        'literal': self._literal(pattern_type, value),
+                        'message': f"하드코딩된 {pattern_type} 발견",
+                        'severity': 'error' if pattern_type in ['api_key', 'password'] else 'warning'
+                    })
+            
+            if check_secrets:
+                for match in iter_candidates(*self.secret_bytes_patterns, data, span.start, span.end):
+                    if match.start() >= span.limit:
+                        break
+                    if match.start() < span.first or _is_covered(match.start(), covered):
+                        continue
+                    column = span.column_base + char_column(data, span.start, match.start())
+                    candidates.append((span.line, column, match.group(0)))
         
+        issues.extend(self._secret_issues(candidates))
         return issues
     
-    def _is_comment(self, line: str, file_path: Path) -> bool:
-        """주석 라인인지 확인"""
-        line = line.strip()
+    def applies_to(self, file_path: Path) -> bool:
+        """경로에 따른 규칙 - 환경 변수 파일은 검사하지 않음
         
-        # 언어별 주석 패턴
-        if file_path.suffix in ['.py']:
-            return line.startswith('#')
-        elif file_path.suffix in ['.js', '.ts', '.jsx', '.tsx', '.java', '.c', '.cpp']:
-            return line.startswith('//') or line.startswith('/*')
-        elif file_path.suffix in ['.rb']:
-            return line.startswith('#')
-        elif file_path.suffix in ['.php']:
-            return line.startswith('//') or line.startswith('#')
+        경로 규칙은 여기에만 두므로 내용이 같은 파일은 검사 결과를 재사용할 수 있다.
+        """
+        return file_path.suffix not in ['.env', '.env.example', '.env.sample']
+    
+    def _secret_issues(self, candidates: List[tuple]) -> List[Dict[str, Any]]:
+        """secret 후보 (줄 번호, 열, 토큰)를 한 번에 판별해 문제 목록 생성"""
+        issues = []
+        scores = score_tokens([token for _, _, token in candidates])
         
-        return False
+        for (line_num, column, token), score in zip(candidates, scores):
+            if score is None:
+                continue
+            value = token.decode('ascii')
+            if self._is_exception(value):
+                continue
+            
+            charset, entropy = score
+            issues.append({
+                'line': line_num,
+                'column': column,
+                'type': 'secret',
+                'value': value[:50] + '...' if len(value) > 50 else value,
+                'literal': value[:MAX_LITERAL_LENGTH],
+                'message': "하드코딩된 secret 발견",
+                'severity': 'error',
+                'charset': charset,
+                'entropy': round(entropy, 2)
+            })
+        
+        return issues
+    
+    def _literal(self, pattern_type: str, text: str) -> str:
+        """매치에서 하드코딩된 값만 추출 (따옴표 안의 문자열, 포트 번호, URL 전체)"""
+        if pattern_type == 'port':
+            match = _TRAILING_NUMBER.search(text)
+        elif pattern_type in ('url', 'database'):
+            match = None
+        else:
+            match = _QUOTED.search(text)
+        
+        literal = match.group(match.lastindex or 0) if match else text
+        return literal[:MAX_LITERAL_LENGTH]
+    
+    def rule_patterns(self) -> Dict[str, List[str]]:
+        """규칙별 정규식 (로드 시 백트래킹 위험 검사에 사용)"""
+        return dict(self.patterns, secret=[STRING_LITERAL_PATTERN, TOKEN_PATTERN], exception=self.exceptions)
+    
+    def detect_fast(self, content: str, file_path: Path) -> List[Dict[str, Any]]:
+        """빠른 규칙만으로 탐지"""
+        return self.detect(content, file_path, rule_ids=self.fast_rule_ids)
     
     def _is_exception(self, value: str) -> bool:
         """예외 패턴인지 확인"""
         for exception in self.exceptions:
             if re.search(exception, value, re.IGNORECASE):
                 return True
-        return False
\ No newline at end of file
+        return False
+
+
+def _is_covered(offset: int, ranges: List[tuple]) -> bool:
+    """offset이 다른 규칙에 매치된 범위 안에 있는지"""
+    return any(start <= offset < end for start, end in ranges)
@@ -0,0 +1,285 @@
+"""
+JS/TS import 그래프
+
+프로젝트 스냅샷의 모듈 파일에서 import 지정자를 뽑아 상대 경로, index 파일,
+tsconfig `paths` 별칭을 스냅샷 안에서 해석한다(디스크를 다시 조회하지 않음).
+모듈은 번호로, 간선은 정수 인접 리스트로 저장하고 순환 참조는 Tarjan SCC로 찾는다.
+"""
+
+import json
+import os
+import posixpath
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 모듈 파일 확장자 (확장자 없는 import를 해석하는 순서)
+MODULE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs')
+
+# import ... from 'x', import 'x', export ... from 'x', require('x'), import('x')
+IMPORT_PATTERN = re.compile(
+    r'''(?:\bimport\s+(?:[\w*${}\s,]+?\s+from\s+)?'''
+    r'''|\bexport\s+(?:[\w*${}\s,]+?\s+)?from\s+'''
+    r'''|\brequire\s*\(\s*|\bimport\s*\(\s*)(['"])([^'"\n]+)\1'''
+)
+
+# 문자열을 먼저 매치해서 문자열 안의 주석 표시("@/*")는 유지
+_JSONC_TOKENS = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*|/\*.*?\*/', re.DOTALL)
+_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+
+
+def load_jsonc(path) -> dict:
+    """주석과 후행 쉼표가 있을 수 있는 JSON 로드 (tsconfig.json)"""
+    text = Path(path).read_text(encoding='utf-8')
+    text = _JSONC_TOKENS.sub(lambda m: m.group(0) if m.group(0).startswith('"') else '', text)
+    return json.loads(_TRAILING_COMMA.sub(r'\1', text))
+
+
+def strongly_connected_components(adjacency: List[List[int]]) -> List[List[int]]:
+    """정수 인접 리스트의 강연결 요소 (반복형 Tarjan, 선형 시간)"""
+    count = len(adjacency)
+    index = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, 0)]
+
+        while work:
+            node, position = work[-1]
+            edges = adjacency[node]
+            if position < len(edges):
+                work[-1] = (node, position + 1)
+                target = edges[position]
+                if index[target] == -1:
+                    index[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = True
+                    work.append((target, 0))
+                elif on_stack[target]:
+                    low[node] = min(low[node], index[target])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+class ModuleGraph:
+    """ProjectSnapshot 파일들의 JS/TS import 그래프
+
+    파일별 import 지정자는 cache_path에 (크기, mtime)을 키로 저장해 두고
+    변경되지 않은 파일은 다시 읽지 않는다.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, snapshot, cache_path: Optional[Path] = None):
+        self.snapshot = snapshot
+        self.cache_path = cache_path
+        self.modules: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.adjacency: List[List[int]] = []
+        self.specifiers: Dict[str, List[str]] = {}
+        self.unresolved: List[Tuple[str, str]] = []
+        self.aliases: List[Tuple[str, Optional[str], List[str]]] = []
+        self.base_url: Optional[str] = None
+        self.cache_hits = 0
+
+    def build(self) -> 'ModuleGraph':
+        """모든 모듈의 간선을 추출, 해석하고 번호 매기기"""
+        self.load_tsconfig()
+
+        self.modules = sorted(info.path for info in self.snapshot.iter_files(suffixes=MODULE_EXTENSIONS))
+        self.ids = {path: number for number, path in enumerate(self.modules)}
+        self.specifiers = self.extract_specifiers()
+
+        self.adjacency = []
+        for path in self.modules:
+            targets: List[int] = []
+            for specifier in self.specifiers[path]:
+                target = self.resolve(path, specifier)
+                if target is not None:
+                    number = self.ids[target]
+                    if number not in targets:
+                        targets.append(number)
+                elif specifier.startswith('.') and not self.snapshot.exists(
+                        posixpath.normpath(posixpath.join(posixpath.dirname(path), specifier))):
+                    # 존재하는 자원(.css, .json)의 상대 import는 모듈 간선이 아님
+                    self.unresolved.append((path, specifier))
+            self.adjacency.append(targets)
+        return self
+
+    def load_tsconfig(self):
+        """tsconfig.json의 baseUrl과 paths 별칭 읽기"""
+        if not self.snapshot.exists('tsconfig.json'):
+            return
+        try:
+            options = load_jsonc(self.snapshot.root / 'tsconfig.json').get('compilerOptions', {})
+        except (OSError, ValueError):
+            return
+
+        base_url = options.get('baseUrl')
+        paths = options.get('paths') or {}
+        if base_url is None and not paths:
+            return
+        self.base_url = os.path.normpath(base_url or '.').replace(os.sep, '/')
+
+        # TypeScript 컴파일러처럼 가장 긴 접두사부터
+        for pattern, targets in paths.items():
+            prefix, star, suffix = pattern.partition('*')
+            self.aliases.append((prefix, suffix if star else None, targets))
+        self.aliases.sort(key=lambda alias: len(alias[0]), reverse=True)
+
+    def extract_specifiers(self) -> Dict[str, List[str]]:
+        """모듈별 import 지정자 (변경되지 않은 파일은 캐시 사용)"""
+        cached = self.load_cache()
+        specifiers = {}
+        entries = {}
+        for path in self.modules:
+            info = self.snapshot.files[path]
+            entry = cached.get(path)
+            if entry and entry['size'] == info.size and entry['mtime'] == info.mtime:
+                self.cache_hits += 1
+            else:
+                try:
+                    content = self.snapshot.read_text(path)
+                except (OSError, UnicodeDecodeError):
+                    content = ''
+                found = list(dict.fromkeys(match.group(2) for match in IMPORT_PATTERN.finditer(content)))
+                entry = {'size': info.size, 'mtime': info.mtime, 'specifiers': found}
+            entries[path] = entry
+            specifiers[path] = entry['specifiers']
+
+        self.save_cache(entries)
+        return specifiers
+
+    def load_cache(self) -> Dict[str, dict]:
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get('files', {}) if data.get('version') == self.CACHE_VERSION else {}
+
+    def save_cache(self, entries: Dict[str, dict]):
+        if not self.cache_path:
+            return
+        try:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.CACHE_VERSION, 'files': entries}, f)
+        except OSError:
+            pass
+
+    def resolve(self, importer: str, specifier: str) -> Optional[str]:
+        """import 지정자가 가리키는 모듈 경로 (패키지, 없는 파일은 None)"""
+        specifier = specifier.split('?', 1)[0]
+        if specifier.startswith('.'):
+            base = posixpath.dirname(importer)
+            return self.resolve_path(posixpath.normpath(posixpath.join(base, specifier)))
+
+        for prefix, suffix, targets in self.aliases:
+            if suffix is None:
+                if specifier != prefix:
+                    continue
+                wildcard = ''
+            elif specifier.startswith(prefix) and specifier.endswith(suffix) \
+                    and len(specifier) >= len(prefix) + len(suffix):
+                wildcard = specifier[len(prefix):len(specifier) - len(suffix)]
+            else:
+                continue
+            for target in targets:
+                candidate = posixpath.normpath(posixpath.join(self.base_url, target.replace('*', wildcard)))
+                resolved = self.resolve_path(candidate)
+                if resolved is not None:
+                    return resolved
+            return None
+
+        if self.base_url is not None:
+            return self.resolve_path(posixpath.normpath(posixpath.join(self.base_url, specifier)))
+        return None
+
+    def resolve_path(self, path: str) -> Optional[str]:
+        """파일, 모듈 확장자를 붙인 파일, 디렉토리 index 순서로 시도"""
+        path = path[2:] if path.startswith('./') else path
+        if path.startswith('../'):
+            return None
+        if path in self.ids:
+            return path
+
+        # TypeScript ESM 방식: './util.js'는 util.ts를 가리킴
+        stem, extension = posixpath.splitext(path)
+        if extension in ('.js', '.jsx', '.mjs', '.cjs'):
+            for candidate in (stem + '.ts', stem + '.tsx'):
+                if candidate in self.ids:
+                    return candidate
+
+        for candidate in [path + ext for ext in MODULE_EXTENSIONS] + \
+                [f"{path}/index{ext}" for ext in MODULE_EXTENSIONS]:
+            if candidate in self.ids:
+                return candidate
+        return None
+
+    def cycles(self) -> List[Dict[str, List[str]]]:
+        """순환 참조 목록 (모듈이 둘 이상이거나 자기 자신을 import하는 SCC마다 하나)
+
+        modules  서로 의존하는 모듈 전체 (이름순)
+        path     실제 import 순환 하나 - 이름이 가장 앞선 모듈에서 출발해 돌아오는 가장 짧은 경로
+                 (path[i]가 path[i + 1]을, 마지막 모듈이 path[0]을 import)
+        """
+        found = []
+        for component in strongly_connected_components(self.adjacency):
+            if len(component) > 1 or component[0] in self.adjacency[component[0]]:
+                found.append({
+                    'modules': sorted(self.modules[number] for number in component),
+                    'path': [self.modules[number] for number in self._cycle_path(component)],
+                })
+        found.sort(key=lambda cycle: (-len(cycle['modules']), cycle['modules']))
+        return found
+
+    def _cycle_path(self, component: List[int]) -> List[int]:
+        """SCC 안의 간선만 따라 가장 앞선 모듈로 돌아오는 가장 짧은 경로 (BFS)"""
+        members = set(component)
+        start = min(component)
+        parents = {start: None}
+        queue = [start]
+        for node in queue:
+            for target in self.adjacency[node]:
+                if target == start:
+                    path = [node]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    return path[::-1]
+                if target in members and target not in parents:
+                    parents[target] = node
+                    queue.append(target)
+        return [start]
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(targets) for targets in self.adjacency)
@@ -0,0 +1,208 @@
+"""
+정규식 패턴의 과도한 백트래킹(catastrophic backtracking) 위험 검사
+
+파싱된 정규식 트리에서 다음 형태를 찾는다.
+  nested_quantifier       반복 안의 반복           예: (a+)+, (\\w*\\s?)*
+  overlapping_alternation 반복 안의 겹치는 분기     예: (\\w\\w|\\d)+, (ab|\\wc)*
+  adjacent_quantifiers    겹치는 문자의 연속 반복   예: \\w+\\d+, [a-z]*[a-z0-9]+
+문자 집합 비교는 ASCII 범위에서 근사한다.
+"""
+
+import re
+from typing import Dict, List, Any, FrozenSet, Optional
+
+try:
+    # Python 3.11+
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+_ASCII = frozenset(range(128))
+
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: frozenset(c for c in _ASCII if chr(c).isdigit()),
+    sre_constants.CATEGORY_WORD: frozenset(c for c in _ASCII if chr(c).isalnum() or chr(c) == '_'),
+    sre_constants.CATEGORY_SPACE: frozenset(c for c in _ASCII if chr(c).isspace()),
+}
+_CATEGORIES[sre_constants.CATEGORY_NOT_DIGIT] = _ASCII - _CATEGORIES[sre_constants.CATEGORY_DIGIT]
+_CATEGORIES[sre_constants.CATEGORY_NOT_WORD] = _ASCII - _CATEGORIES[sre_constants.CATEGORY_WORD]
+_CATEGORIES[sre_constants.CATEGORY_NOT_SPACE] = _ASCII - _CATEGORIES[sre_constants.CATEGORY_SPACE]
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+_POSSESSIVE = getattr(sre_constants, 'POSSESSIVE_REPEAT', None)
+
+
+def check_pattern(pattern: str, flags: int = 0) -> List[str]:
+    """패턴의 백트래킹 위험 목록 반환 (없으면 빈 목록, 잘못된 패턴은 invalid)"""
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error as e:
+        return [f'invalid: {e}']
+
+    ignore_case = bool(flags & re.IGNORECASE)
+    risks: List[str] = []
+    _walk(list(parsed), ignore_case, risks)
+    # 같은 위험은 한 번만
+    return list(dict.fromkeys(risks))
+
+
+def check_detector_patterns(detector: Any) -> Dict[str, List[str]]:
+    """탐지기의 rule_patterns()에 있는 모든 패턴 검사 - {패턴: 위험 목록} (위험한 것만)"""
+    rule_patterns = getattr(detector, 'rule_patterns', None)
+    if not callable(rule_patterns):
+        return {}
+
+    flags = getattr(detector, 'pattern_flags', re.IGNORECASE)
+    problems = {}
+    for patterns in rule_patterns().values():
+        for pattern in patterns:
+            risks = check_pattern(pattern, flags)
+            if risks:
+                problems[pattern] = risks
+    return problems
+
+
+def _walk(items: List, ignore_case: bool, risks: List[str]):
+    """시퀀스(items)와 하위 트리 검사"""
+    previous_repeat: Optional[FrozenSet[int]] = None
+
+    for op, av in items:
+        if op in _REPEATS or op == _POSSESSIVE:
+            low, high, body = av
+            body = list(body)
+            unbounded = high == sre_constants.MAXREPEAT
+
+            if op != _POSSESSIVE and high > 1:
+                if _contains_repeat(body):
+                    risks.append('nested_quantifier')
+                if _has_overlapping_branch(body, ignore_case):
+                    risks.append('overlapping_alternation')
+
+            # 바로 앞의 무한 반복과 소비하는 문자가 겹치면 분할 방법이 많아짐
+            first = _first_chars(body, ignore_case)
+            if unbounded and previous_repeat is not None and first is not None and previous_repeat & first:
+                risks.append('adjacent_quantifiers')
+
+            previous_repeat = _single_char_set(body, ignore_case) if unbounded and op != _POSSESSIVE else None
+            _walk(body, ignore_case, risks)
+            continue
+
+        previous_repeat = None
+        for sub in _subsequences(op, av):
+            _walk(sub, ignore_case, risks)
+
+
+def _subsequences(op, av) -> List[List]:
+    """노드의 하위 시퀀스들"""
+    if op == sre_constants.SUBPATTERN:
+        return [list(av[-1])]
+    if op == sre_constants.BRANCH:
+        return [list(branch) for branch in av[1]]
+    if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        return [list(av[1])]
+    if op == getattr(sre_constants, 'ATOMIC_GROUP', None):
+        return [list(av)]
+    return []
+
+
+def _contains_repeat(items: List) -> bool:
+    """하위 트리에 2회 이상 반복이 있는지 (소유 반복/원자 그룹 제외)"""
+    for op, av in items:
+        if op in _REPEATS:
+            if av[1] > 1:
+                return True
+            if _contains_repeat(list(av[2])):
+                return True
+        elif op != _POSSESSIVE and op != getattr(sre_constants, 'ATOMIC_GROUP', None):
+            if any(_contains_repeat(sub) for sub in _subsequences(op, av)):
+                return True
+    return False
+
+
+def _has_overlapping_branch(items: List, ignore_case: bool) -> bool:
+    """반복 본문의 분기들이 같은 문자로 시작할 수 있는지 (빈 분기 제외)"""
+    for op, av in items:
+        if op == sre_constants.SUBPATTERN:
+            if _has_overlapping_branch(list(av[-1]), ignore_case):
+                return True
+        elif op == sre_constants.BRANCH:
+            firsts = [_first_chars(list(branch), ignore_case) for branch in av[1] if branch]
+            for i, a in enumerate(firsts):
+                for b in firsts[i + 1:]:
+                    if a is None or b is None or a & b:
+                        return True
+    return False
+
+
+def _first_chars(items: List, ignore_case: bool) -> Optional[FrozenSet[int]]:
+    """시퀀스가 첫 글자로 소비할 수 있는 문자 집합 (알 수 없으면 None)"""
+    result = frozenset()
+    for op, av in items:
+        if op in (sre_constants.AT,):
+            continue
+        if op in _REPEATS or op == _POSSESSIVE:
+            first = _first_chars(list(av[2]), ignore_case)
+            if first is None:
+                return None
+            result |= first
+            if av[0] > 0:
+                return result
+            continue
+        if op == sre_constants.SUBPATTERN:
+            first = _first_chars(list(av[-1]), ignore_case)
+            return None if first is None else result | first
+        if op == sre_constants.BRANCH:
+            union = frozenset()
+            for branch in av[1]:
+                first = _first_chars(list(branch), ignore_case)
+                if first is None:
+                    return None
+                union |= first
+            return result | union
+        chars = _char_set(op, av, ignore_case)
+        return None if chars is None else result | chars
+    return result
+
+
+def _single_char_set(items: List, ignore_case: bool) -> Optional[FrozenSet[int]]:
+    """본문이 한 문자짜리(리터럴, 문자 집합)이면 그 문자 집합"""
+    if len(items) != 1:
+        return None
+    op, av = items[0]
+    return _char_set(op, av, ignore_case)
+
+
+def _char_set(op, av, ignore_case: bool) -> Optional[FrozenSet[int]]:
+    """한 문자 노드의 ASCII 문자 집합"""
+    if op == sre_constants.LITERAL:
+        return _with_case(frozenset([av]) & _ASCII, ignore_case)
+    if op == sre_constants.NOT_LITERAL:
+        return _ASCII - _with_case(frozenset([av]), ignore_case)
+    if op == sre_constants.ANY:
+        return _ASCII - {ord('\n')}
+    if op == sre_constants.IN:
+        chars = frozenset()
+        negate = False
+        for item_op, item_av in av:
+            if item_op == sre_constants.NEGATE:
+                negate = True
+            elif item_op == sre_constants.LITERAL:
+                chars |= frozenset([item_av])
+            elif item_op == sre_constants.RANGE:
+                chars |= frozenset(range(item_av[0], min(item_av[1], 127) + 1))
+            elif item_op == sre_constants.CATEGORY:
+                chars |= _CATEGORIES.get(item_av, _ASCII)
+            else:
+                return None
+        chars = _with_case(chars & _ASCII, ignore_case)
+        return _ASCII - chars if negate else chars
+    return None
+
+
+def _with_case(chars: FrozenSet[int], ignore_case: bool) -> FrozenSet[int]:
+    """대소문자 무시 플래그면 양쪽 대소문자 포함"""
+    if not ignore_case:
+        return chars
+    return frozenset(ord(variant) for c in chars for variant in (chr(c).lower(), chr(c).upper()) if ord(variant) < 128)
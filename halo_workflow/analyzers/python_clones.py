@@ -0,0 +1,84 @@
+"""
+Python 구조 복제(Type-2 clone) 지문
+
+파일을 ast로 한 번 파싱하고, 식별자와 리터럴을 정규화한 뒤 하위 트리 해시를
+아래에서 위로(자식 해시로 부모 해시를) 계산한다. 함수/클래스 노드의 해시를
+버킷에 모으면 이름과 상수만 다른 복제를 선형 시간에 찾을 수 있다.
+"""
+
+import ast
+import hashlib
+from typing import Dict, List, Any, Optional, Union
+
+# 이름(식별자)을 담는 필드 - 값 대신 자리 표시자로 해시
+IDENTIFIER_FIELDS = {'id', 'arg', 'attr', 'name', 'module', 'asname', 'names'}
+
+# 구조와 관계없는 필드
+IGNORED_FIELDS = {'ctx', 'type_comment', 'kind'}
+
+# 복제 단위로 보는 노드
+CLONE_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def fingerprint_python(source: Union[str, bytes], min_lines: int) -> Optional[List[Dict[str, Any]]]:
+    """함수/클래스별 정규화 해시 목록 (파싱할 수 없으면 None)
+
+    각 항목: hash, kind(function/class), name, start_line, end_line.
+    min_lines보다 짧은 노드는 제외한다.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+
+    clones: List[Dict[str, Any]] = []
+    try:
+        _hash_node(tree, clones, min_lines)
+    except RecursionError:
+        return None
+    return clones
+
+
+def _hash_node(node: ast.AST, clones: List[Dict[str, Any]], min_lines: int) -> bytes:
+    """노드의 정규화 해시 (자식 해시를 먼저 계산, 함수/클래스 노드는 clones에 추가)"""
+    digest = hashlib.blake2b(type(node).__name__.encode(), digest_size=16)
+
+    for field, value in ast.iter_fields(node):
+        if field in IGNORED_FIELDS:
+            continue
+        digest.update(field.encode())
+        if isinstance(value, list):
+            digest.update(b'[%d' % len(value))
+            for item in value:
+                digest.update(_hash_value(field, item, clones, min_lines))
+        else:
+            digest.update(_hash_value(field, value, clones, min_lines))
+
+    node_hash = digest.digest()
+
+    if isinstance(node, CLONE_NODES):
+        end_line = getattr(node, 'end_lineno', None) or node.lineno
+        # 데코레이터가 있으면 데코레이터 줄부터
+        start_line = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+        if end_line - start_line + 1 >= min_lines:
+            clones.append({
+                'hash': node_hash.hex(),
+                'kind': 'class' if isinstance(node, ast.ClassDef) else 'function',
+                'name': node.name,
+                'start_line': start_line,
+                'end_line': end_line,
+            })
+
+    return node_hash
+
+
+def _hash_value(field: str, value: Any, clones: List[Dict[str, Any]], min_lines: int) -> bytes:
+    """필드 값의 해시 재료 (하위 노드는 재귀, 이름/상수는 종류만)"""
+    if isinstance(value, ast.AST):
+        return _hash_node(value, clones, min_lines)
+    if field in IDENTIFIER_FIELDS:
+        return b'<id>'
+    if field == 'value':
+        # 상수 - 값은 무시하고 종류만 (문자열, 숫자 등)
+        return b'<%s>' % type(value).__name__.encode()
+    return repr(value).encode()
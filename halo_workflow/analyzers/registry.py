@@ -0,0 +1,174 @@
+"""
+탐지기 레지스트리
+
+파일 단위 탐지기는 클래스 속성으로 자신을 선언한다.
+  name        레지스트리 이름 (CLI --detectors/--disable-detector에서 사용)
+  issue_type  결과에 기록되는 문제 유형
+  languages   적용 언어 목록 (EXTENSION_LANGUAGES 기준)
+  extensions  적용 확장자 목록 (languages와 합쳐짐, 둘 다 None이면 모든 파일)
+  rule_ids    제공하는 규칙 id 목록
+그리고 detect(content, file_path) -> List[Dict] 를 구현한다.
+빠른 규칙 세트(분류 결과 fast인 파일에 적용)를 제공하려면 detect_fast도 구현한다.
+rule_patterns() -> {규칙 id: [정규식]} 를 구현하면 로드할 때 백트래킹 위험을 검사한다.
+applies_to(file_path) -> bool 을 구현하면 경로에 따른 규칙이 그 안에만 있다고 보고,
+내용이 같은 파일은 한 번만 검사해 결과를 나눠 쓴다 (구현하지 않으면 경로마다 실행).
+
+외부 패키지는 'halo_workflow.detectors' entry point 그룹으로 탐지기를 등록할 수 있다.
+"""
+
+from typing import Dict, List, Any, Optional, Iterable
+
+from .hardcoding_detector import HardcodingDetector
+from .dummy_data_detector import DummyDataDetector
+from .pattern_check import check_detector_patterns
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ENTRY_POINT_GROUP = 'halo_workflow.detectors'
+
+# 확장자별 언어
+EXTENSION_LANGUAGES = {
+    '.py': 'python',
+    '.js': 'javascript', '.jsx': 'javascript',
+    '.ts': 'typescript', '.tsx': 'typescript',
+    '.java': 'java', '.kt': 'kotlin', '.swift': 'swift',
+    '.c': 'c', '.cpp': 'cpp', '.cs': 'csharp',
+    '.go': 'go', '.rb': 'ruby', '.php': 'php', '.rs': 'rust',
+    '.json': 'json', '.yaml': 'yaml', '.yml': 'yaml', '.xml': 'xml',
+    '.env': 'config', '.config': 'config',
+}
+
+BUILTIN_DETECTORS = [HardcodingDetector, DummyDataDetector]
+
+
+class DetectorRegistry:
+    """탐지기 클래스 등록 및 확장자별 디스패치 테이블 생성"""
+
+    def __init__(self):
+        self._detectors: Dict[str, type] = {}
+
+    def register(self, detector_cls: type):
+        """탐지기 클래스 등록"""
+        for attr in ('name', 'issue_type'):
+            if not getattr(detector_cls, attr, None):
+                raise ValueError(f"탐지기 {detector_cls.__name__}에 '{attr}' 선언이 없습니다.")
+        if not callable(getattr(detector_cls, 'detect', None)):
+            raise ValueError(f"탐지기 {detector_cls.__name__}에 detect 메서드가 없습니다.")
+
+        if detector_cls.name in self._detectors and self._detectors[detector_cls.name] is not detector_cls:
+            logger.warning(f"탐지기 이름 중복, 먼저 등록된 것을 사용합니다: {detector_cls.name}")
+            return
+        self._detectors[detector_cls.name] = detector_cls
+
+    def load_entry_points(self):
+        """entry point로 설치된 탐지기 로드"""
+        for entry_point in _iter_entry_points(ENTRY_POINT_GROUP):
+            try:
+                self.register(entry_point.load())
+            except Exception as e:
+                logger.warning(f"탐지기 플러그인 로드 실패 {entry_point.name}: {e}")
+
+    def names(self) -> List[str]:
+        """등록된 탐지기 이름 (등록 순서)"""
+        return list(self._detectors)
+
+    def get(self, name: str) -> type:
+        """이름으로 탐지기 클래스 조회"""
+        if name not in self._detectors:
+            raise KeyError(f"알 수 없는 탐지기: {name} (사용 가능: {', '.join(self._detectors)})")
+        return self._detectors[name]
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """등록된 탐지기 선언 정보"""
+        return [
+            {
+                'name': cls.name,
+                'issue_type': cls.issue_type,
+                'extensions': sorted(applicable_extensions(cls)) if applicable_extensions(cls) is not None else None,
+                'rule_ids': list(getattr(cls, 'rule_ids', None) or []),
+                'fast_rule_ids': list(getattr(cls, 'fast_rule_ids', None) or []),
+                'pattern_risks': check_detector_patterns(cls()),
+            }
+            for cls in self._detectors.values()
+        ]
+
+    def create(self, enabled: Optional[Iterable[str]] = None,
+               disabled: Optional[Iterable[str]] = None,
+               check_patterns: bool = True) -> List[Any]:
+        """활성화된 탐지기 인스턴스 생성 (등록 순서 유지, check_patterns: 백트래킹 위험 경고)"""
+        names = list(enabled) if enabled else self.names()
+        disabled = set(disabled or [])
+        for name in list(names) + list(disabled):
+            self.get(name)
+
+        detectors = [self.get(name)() for name in self.names() if name in names and name not in disabled]
+        if not check_patterns:
+            return detectors
+        for detector in detectors:
+            for pattern, risks in check_detector_patterns(detector).items():
+                logger.warning(f"탐지기 {detector.name} 패턴 백트래킹 위험 ({', '.join(risks)}): {pattern}")
+        return detectors
+
+
+def applicable_extensions(detector: Any) -> Optional[set]:
+    """탐지기가 적용되는 확장자 집합 (None이면 모든 파일)"""
+    languages = getattr(detector, 'languages', None)
+    extensions = getattr(detector, 'extensions', None)
+    if languages is None and extensions is None:
+        return None
+
+    result = set(ext.lower() for ext in extensions or [])
+    for ext, language in EXTENSION_LANGUAGES.items():
+        if language in (languages or []):
+            result.add(ext)
+    return result
+
+
+def build_dispatch_table(detectors: List[Any], extensions: Iterable[str]) -> Dict[str, List[Any]]:
+    """확장자별로 실행할 탐지기 목록 (분석 시작 전 한 번 생성)
+
+    기본 확장자에 탐지기(플러그인 포함)가 선언한 확장자를 더한 전체가 분석 대상이다.
+    """
+    applicable = [(detector, applicable_extensions(detector)) for detector in detectors]
+    all_extensions = list(dict.fromkeys(ext.lower() for ext in extensions))
+    for _, detector_extensions in applicable:
+        all_extensions.extend(sorted((detector_extensions or set()) - set(all_extensions)))
+
+    table = {}
+    for ext in all_extensions:
+        table[ext] = [
+            detector for detector, detector_extensions in applicable
+            if detector_extensions is None or ext in detector_extensions
+        ]
+    return table
+
+
+def build_fast_dispatch_table(dispatch_table: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    """빠른 규칙 세트(detect_fast)를 제공하는 탐지기만 남긴 디스패치 테이블"""
+    return {
+        ext: [detector for detector in detectors if callable(getattr(detector, 'detect_fast', None))]
+        for ext, detectors in dispatch_table.items()
+    }
+
+
+def default_registry() -> DetectorRegistry:
+    """내장 탐지기와 entry point 플러그인이 등록된 레지스트리"""
+    registry = DetectorRegistry()
+    for detector_cls in BUILTIN_DETECTORS:
+        registry.register(detector_cls)
+    registry.load_entry_points()
+    return registry
+
+
+def _iter_entry_points(group: str):
+    """entry point 조회 (Python 3.8~3.12 호환)"""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return []
+
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        return eps.select(group=group)
+    return eps.get(group, [])
@@ -8,15 +8,25 @@ import sys
 import argparse
 import json
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from ..core.analyzer import WorkflowAnalyzer
+from ..core.analyzer import WorkflowAnalyzer, DEFAULT_CHUNK_THRESHOLD
 from ..core.license_manager import LicenseManager
-from ..utils.logger import setup_logger
+from ..core.result_store import ResultStore
+from ..core.literal_index import normalize_literal, display_literal
+from ..core.baseline import DEFAULT_BASELINE_FILE, load_baseline, write_baseline
+from ..core.sharding import parse_shard_spec, write_partial, load_partials
+from ..core.daemon import AnalysisDaemon, DaemonClient, RemoteAnalyzer
+from ..core.diagnose import ProjectDiagnostic, LEVELS
+from ..analyzers.registry import default_registry
+from ..utils.logger import setup_logger, configure_logging, flush_logging
 from ..utils.reporter import HTMLReporter, JSONReporter
 
 logger = setup_logger(__name__)
 
+# 파일 하나의 분석 시간 제한 기본값 (초) - diagnose도 같은 값을 써서 데몬의 분석기를 공유
+DEFAULT_FILE_TIMEOUT = 60
+
 
 def create_parser():
     """CLI 파서 생성"""
@@ -29,11 +39,24 @@ def create_parser():
   halo-workflow analyze .                    # 현재 디렉토리 분석
   halo-workflow analyze ./src --output html  # src 폴더 분석 후 HTML 보고서 생성
   halo-workflow report --format json         # JSON 형식으로 보고서 출력
+  halo-workflow query --type hardcoding --path 'src/**' --severity error  # 저장된 결과 조회
+  halo-workflow query --literal https://api.example.com  # 하드코딩 값의 등장 위치
+  halo-workflow diff previous latest         # 직전 실행 대비 새로 생긴/해결된 문제
+  halo-workflow baseline create .            # 현재 문제를 기준선으로 기록 (이후 실행에서 억제)
+  halo-workflow analyze . --shard 0/4        # 4개 샤드 중 0번 분석 (부분 결과 저장)
+  halo-workflow merge halo-shard-*.json      # 부분 결과 병합 및 전체 분석
+  halo-workflow serve                        # 캐시를 유지하는 분석 데몬 실행 (이후 명령이 자동으로 사용)
+  halo-workflow analyze . --disable-detector dummy_data  # 특정 탐지기 끄기
+  halo-workflow detectors                    # 사용 가능한 탐지기 목록
+  halo-workflow diagnose . --level complete  # 프로젝트 진단 (analyze의 파일 색인/캐시 재사용)
   halo-workflow activate LICENSE-KEY         # 라이선스 활성화
         """
     )
     
     parser.add_argument('--version', action='version', version='%(prog)s 0.1.0')
+    parser.add_argument('--verbose', '-v', action='count', default=0, help='디버그 로그 출력 (파일별 처리 시간 포함)')
+    parser.add_argument('--quiet', '-q', action='store_true', help='경고 이상의 로그만 출력')
+    parser.add_argument('--log-file', help='JSON Lines 형식의 로그 파일 경로 (파일별 처리 시간 포함)')
     
     subparsers = parser.add_subparsers(dest='command', help='사용 가능한 명령어')
     
@@ -43,15 +66,89 @@ def create_parser():
     analyze_parser.add_argument('--output', '-o', choices=['console', 'html', 'json'], default='console', help='출력 형식')
     analyze_parser.add_argument('--output-file', '-f', help='출력 파일 경로')
     analyze_parser.add_argument('--max-files', type=int, help='최대 파일 수 제한')
-    analyze_parser.add_argument('--ignore', nargs='*', help='무시할 파일/폴더 패턴')
+    analyze_parser.add_argument('--ignore', nargs='*', help='무시할 파일/폴더 이름 (glob 가능, 예: dist *.min.js)')
     analyze_parser.add_argument('--fix', action='store_true', help='자동 수정 시도 (프리미엄 기능)')
     analyze_parser.add_argument('--ci', action='store_true', help='CI/CD 모드 (종료 코드 반환)')
+    analyze_parser.add_argument('--fail-fast', action='store_true', help='첫 오류 발견 즉시 분석을 중단하고 종료 코드 1 반환')
+    analyze_parser.add_argument('--trend', type=int, default=10, help='HTML 보고서 추이 차트에 포함할 최근 실행 수')
+    analyze_parser.add_argument('--baseline', help=f'기준선 파일 경로 (기본값: <프로젝트>/{DEFAULT_BASELINE_FILE})')
+    analyze_parser.add_argument('--no-baseline', action='store_true', help='기준선 파일을 사용하지 않음')
+    analyze_parser.add_argument('--shard', help="i/N: 경로 해시로 나눈 N개 샤드 중 i번째만 분석하고 부분 결과 저장 (merge로 병합)")
+    analyze_parser.add_argument('--no-daemon', action='store_true', help='실행 중인 분석 데몬을 사용하지 않음')
+    analyze_parser.add_argument('--stream', action='store_true', help='발견 즉시 문제를 콘솔에 출력 (결과는 저장하지 않음)')
+    analyze_parser.add_argument('--detectors', nargs='+', metavar='NAME', help='이 탐지기만 실행 (목록: halo-workflow detectors)')
+    analyze_parser.add_argument('--file-timeout', type=float, default=DEFAULT_FILE_TIMEOUT, help=f'파일 하나의 분석 시간 제한(초), 넘기면 건너뛰고 보고 (0: 제한 없음, 기본값: {DEFAULT_FILE_TIMEOUT})')
+    analyze_parser.add_argument('--chunk-threshold', type=int, default=64, metavar='MB', help='이보다 큰 파일은 겹치는 창 단위로 읽어 메모리 사용량 제한 (MB, 0: 항상 전체를 읽음, 기본값: 64)')
+    analyze_parser.add_argument('--no-triage', action='store_true', help='잠금 파일/생성 코드/압축 파일 분류 없이 모든 파일에 전체 규칙 적용')
+    analyze_parser.add_argument('--disable-detector', action='append', metavar='NAME', help='실행하지 않을 탐지기 (여러 번 지정 가능)')
+    
+    # merge 명령어
+    merge_parser = subparsers.add_parser('merge', help='샤드 부분 결과 병합')
+    merge_parser.add_argument('partials', nargs='+', help='analyze --shard로 생성한 부분 결과 파일')
+    merge_parser.add_argument('--output', '-o', choices=['console', 'html', 'json'], default='console', help='출력 형식')
+    merge_parser.add_argument('--output-file', '-f', help='출력 파일 경로')
+    merge_parser.add_argument('--ci', action='store_true', help='CI/CD 모드 (종료 코드 반환)')
+    merge_parser.add_argument('--trend', type=int, default=10, help='HTML 보고서 추이 차트에 포함할 최근 실행 수')
+    merge_parser.add_argument('--baseline', help=f'기준선 파일 경로 (기본값: <프로젝트>/{DEFAULT_BASELINE_FILE})')
+    merge_parser.add_argument('--no-baseline', action='store_true', help='기준선 파일을 사용하지 않음')
     
     # report 명령어
     report_parser = subparsers.add_parser('report', help='보고서 생성')
     report_parser.add_argument('--format', choices=['html', 'json', 'markdown'], default='html', help='보고서 형식')
     report_parser.add_argument('--output', '-o', help='출력 파일 경로')
     report_parser.add_argument('--open', action='store_true', help='생성 후 자동으로 열기')
+    report_parser.add_argument('--run', type=int, help='보고서를 생성할 실행 id (기본값: 최근 실행)')
+    report_parser.add_argument('--trend', type=int, default=10, help='HTML 보고서 추이 차트에 포함할 최근 실행 수')
+    
+    # query 명령어
+    query_parser = subparsers.add_parser('query', help='저장된 분석 결과 조회')
+    query_parser.add_argument('--type', dest='issue_type', help='문제 유형 (예: hardcoding, dummy_data, duplicate, api_flow)')
+    query_parser.add_argument('--path', help="파일 경로 glob 패턴 (예: 'src/**')")
+    query_parser.add_argument('--severity', choices=['error', 'warning', 'info'], help='심각도')
+    query_parser.add_argument('--literal', metavar='VALUE', help='하드코딩 값의 등장 위치 조회 (정규화해서 비교)')
+    query_parser.add_argument('--run', type=int, help='조회할 실행 id (기본값: 최근 실행)')
+    query_parser.add_argument('--limit', type=int, help='최대 결과 수')
+    query_parser.add_argument('--format', choices=['console', 'json'], default='console', help='출력 형식')
+    query_parser.add_argument('--no-daemon', action='store_true', help='실행 중인 분석 데몬을 사용하지 않음')
+    
+    # diff 명령어
+    diff_parser = subparsers.add_parser('diff', help='두 실행 결과 비교')
+    diff_parser.add_argument('run_a', nargs='?', default='previous', help="기준 실행 id 또는 'previous'/'latest' (기본값: previous)")
+    diff_parser.add_argument('run_b', nargs='?', default='latest', help="비교 실행 id 또는 'previous'/'latest' (기본값: latest)")
+    diff_parser.add_argument('--format', choices=['console', 'json'], default='console', help='출력 형식')
+    diff_parser.add_argument('--limit', type=int, default=20, help='콘솔에 표시할 항목 수')
+    
+    # baseline 명령어
+    baseline_parser = subparsers.add_parser('baseline', help='기준선(기존 문제 억제) 관리')
+    baseline_parser.add_argument('action', choices=['create'], help='create: 최근 분석 결과로 기준선 파일 생성')
+    baseline_parser.add_argument('path', nargs='?', default='.', help='프로젝트 경로 (기본값: 현재 디렉토리)')
+    baseline_parser.add_argument('--run', type=int, help='기준선으로 사용할 실행 id (기본값: 해당 프로젝트의 최근 실행)')
+    baseline_parser.add_argument('--output', '-o', help=f'기준선 파일 경로 (기본값: <프로젝트>/{DEFAULT_BASELINE_FILE})')
+    
+    # detectors 명령어
+    detectors_parser = subparsers.add_parser('detectors', help='사용 가능한 탐지기 목록')
+    detectors_parser.add_argument('--format', choices=['console', 'json'], default='console', help='출력 형식')
+    
+    # diagnose 명령어
+    diagnose_parser = subparsers.add_parser('diagnose', help='프로젝트 진단 (필수 파일, 의존성, 타입 검사, 빌드)')
+    diagnose_parser.add_argument('path', nargs='?', default='.', help='진단할 프로젝트 경로 (기본값: 현재 디렉토리)')
+    diagnose_parser.add_argument('--level', choices=LEVELS, default='standard',
+                                 help='quick: 파일/의존성만, standard: + tsc/빌드 (기본값), complete: + 구조/순환 참조/코드 분석')
+    diagnose_parser.add_argument('--format', choices=['console', 'json'], default='console', help='출력 형식')
+    diagnose_parser.add_argument('--ignore', nargs='*', help='무시할 파일/폴더 이름 (glob 가능, 예: dist *.min.js)')
+    diagnose_parser.add_argument('--require-files', nargs='*', metavar='FILE',
+                                 help='필수 파일 목록 (프로젝트 기준 경로, 지정하면 빠진 파일은 실패 - '
+                                      '기본값: Vite + React/Express 구조, 빠진 파일은 경고)')
+    diagnose_parser.add_argument('--require-deps', nargs='*', metavar='NAME',
+                                 help='필수 의존성 목록 (지정하면 빠진 의존성은 실패 - '
+                                      '기본값: react, react-dom, 빠진 의존성은 경고)')
+    diagnose_parser.add_argument('--no-daemon', action='store_true', help='실행 중인 분석 데몬을 사용하지 않음')
+    
+    # serve 명령어
+    serve_parser = subparsers.add_parser('serve', help='분석 데몬 실행 (캐시 유지)')
+    serve_parser.add_argument('--socket', help='Unix 소켓 경로 (기본값: ~/.halo-workflow/daemon.sock)')
+    serve_parser.add_argument('--port', type=int, help='Unix 소켓 대신 사용할 localhost 포트')
+    serve_parser.add_argument('--stop', action='store_true', help='실행 중인 데몬 종료')
     
     # activate 명령어
     activate_parser = subparsers.add_parser('activate', help='라이선스 활성화')
@@ -81,18 +178,66 @@ def analyze_command(args):
         max_files = 100
         logger.info("무료 버전: 최대 100개 파일까지 분석합니다.")
     
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard_spec(args.shard)
+        except ValueError as e:
+            logger.error(str(e))
+            return 1
+    
+    # 기준선 로드
+    try:
+        baseline = _load_baseline_option(args, project_path)
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        return 1
+    
     # 분석기 생성
-    analyzer = WorkflowAnalyzer(
-        max_files=max_files,
-        ignore_patterns=args.ignore or [],
-        premium_features=is_premium
-    )
+    try:
+        analyzer = WorkflowAnalyzer(
+            max_files=max_files,
+            ignore_patterns=args.ignore or [],
+            premium_features=is_premium,
+            baseline=baseline,
+            fail_fast=args.fail_fast,
+            detectors=args.detectors,
+            disabled_detectors=args.disable_detector,
+            triage=not args.no_triage,
+            file_timeout=args.file_timeout or None,
+            chunk_threshold=args.chunk_threshold * 1024 * 1024 or None
+        )
+    except KeyError as e:
+        logger.error(e.args[0])
+        return 1
     
     try:
         logger.info(f"프로젝트 분석 시작: {project_path}")
         
-        # 분석 실행
-        results = analyzer.analyze(project_path)
+        # 스트리밍 모드: 파일 분석이 끝날 때마다 출력
+        if args.stream:
+            return stream_issues(args, analyzer, project_path)
+        
+        # 샤드 모드: 부분 결과만 저장
+        if shard:
+            shard_index, shard_count = shard
+            partial = analyzer.analyze_shard(project_path, shard_index, shard_count)
+            output_file = args.output_file or f'halo-shard-{shard_index}-of-{shard_count}.json'
+            write_partial(partial, Path(output_file))
+            logger.info(f"샤드 {shard_index}/{shard_count} 부분 결과 저장: {output_file} ({len(partial['records'])}개 파일)")
+            return 0
+        
+        # 분석 실행 (데몬이 실행 중이면 데몬의 캐시 사용)
+        results = None
+        if not args.no_daemon and not args.fix:
+            results = _analyze_with_daemon(args, project_path, max_files, is_premium)
+        if results is None:
+            results = analyzer.analyze(project_path)
+        
+        # fail-fast 중단: 원인이 된 오류만 출력하고 바로 실패
+        if results.get('aborted'):
+            print_abort_report(results)
+            return 1
         
         # 자동 수정 (프리미엄 기능)
         if args.fix:
@@ -103,38 +248,142 @@ def analyze_command(args):
                 fixed_count = analyzer.auto_fix(results)
                 logger.info(f"{fixed_count}개 문제를 자동으로 수정했습니다.")
         
-        # 결과 출력
-        if args.output == 'console':
-            print_results(results)
-        elif args.output == 'html':
-            output_file = args.output_file or 'halo-report.html'
-            reporter = HTMLReporter()
-            reporter.generate(results, output_file)
-            logger.info(f"HTML 보고서 생성: {output_file}")
-        elif args.output == 'json':
-            output_file = args.output_file or 'halo-report.json'
-            reporter = JSONReporter()
-            reporter.generate(results, output_file)
-            logger.info(f"JSON 보고서 생성: {output_file}")
-        
-        # CI 모드: 문제가 있으면 1 반환
-        if args.ci:
-            error_count = len(results.get('errors', []))
-            warning_count = len(results.get('warnings', []))
-            if error_count > 0:
-                return 1
-            elif warning_count > 0:
-                return 2
-        
-        return 0
+        return output_results(args, results)
         
     except Exception as e:
         logger.error(f"분석 중 오류 발생: {e}")
         return 1
 
 
+def stream_issues(args, analyzer: WorkflowAnalyzer, project_path: Path) -> int:
+    """문제를 발견 즉시 콘솔에 출력"""
+    flush_logging()
+    error_count = 0
+    warning_count = 0
+    
+    for issue in analyzer.iter_issues(project_path):
+        icon = '❌' if issue.severity == 'error' else '⚠️ '
+        print(f"{icon} [{issue.type}] {issue.location}: {issue.message}", flush=True)
+        
+        if issue.severity == 'error':
+            error_count += 1
+            if args.fail_fast:
+                break
+        else:
+            warning_count += 1
+    
+    print(f"\n📊 오류 {error_count}개, 경고 {warning_count}개")
+    
+    if args.ci or args.fail_fast:
+        if error_count > 0:
+            return 1
+        elif warning_count > 0 and args.ci:
+            return 2
+    return 0
+
+
+def _analyze_with_daemon(args, project_path: Path, max_files, is_premium: bool):
+    """데몬으로 분석 (데몬이 없거나 실패하면 None)"""
+    client = DaemonClient.connect()
+    if client is None:
+        return None
+    
+    try:
+        with client:
+            logger.debug("분석 데몬 사용")
+            return client.request(
+                'analyze',
+                path=str(project_path),
+                max_files=max_files,
+                ignore=args.ignore or [],
+                premium=is_premium,
+                fail_fast=args.fail_fast,
+                baseline=str(Path(args.baseline).resolve()) if args.baseline else None,
+                no_baseline=args.no_baseline,
+                detectors=args.detectors,
+                disabled_detectors=args.disable_detector,
+                no_triage=args.no_triage,
+                file_timeout=args.file_timeout or None,
+                chunk_threshold=args.chunk_threshold * 1024 * 1024 or None
+            )
+    except (OSError, RuntimeError) as e:
+        logger.warning(f"분석 데몬 요청 실패, 직접 분석합니다: {e}")
+        return None
+
+
+def merge_command(args):
+    """샤드 부분 결과 병합"""
+    try:
+        partials = load_partials([Path(p) for p in args.partials])
+    except (OSError, ValueError) as e:
+        logger.error(f"부분 결과 로드 실패: {e}")
+        return 1
+    
+    project_path = Path(partials[0]['project_path'])
+    
+    # 파일 단위 억제는 각 샤드에서 이미 적용됨 - 여기서는 프로젝트 전체 문제에 적용
+    try:
+        baseline = _load_baseline_option(args, project_path)
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        return 1
+    
+    analyzer = WorkflowAnalyzer(baseline=baseline)
+    
+    try:
+        logger.info(f"부분 결과 병합: {len(partials)}개 샤드 ({project_path})")
+        results = analyzer.merge_partials(partials)
+        return output_results(args, results)
+    except Exception as e:
+        logger.error(f"병합 중 오류 발생: {e}")
+        return 1
+
+
+def _load_baseline_option(args, project_path: Path):
+    """--baseline/--no-baseline 옵션에 따라 기준선 로드"""
+    if args.no_baseline:
+        return None
+    
+    baseline_file = Path(args.baseline) if args.baseline else project_path / DEFAULT_BASELINE_FILE
+    if baseline_file.exists():
+        return load_baseline(baseline_file)
+    if args.baseline:
+        raise FileNotFoundError(f"기준선 파일을 찾을 수 없습니다: {baseline_file}")
+    return None
+
+
+def output_results(args, results) -> int:
+    """분석 결과 출력 후 종료 코드 반환"""
+    if args.output == 'console':
+        print_results(results)
+    elif args.output == 'html':
+        output_file = args.output_file or 'halo-report.html'
+        reporter = HTMLReporter()
+        reporter.generate(results, output_file, history=_load_history(results['project_path'], args.trend))
+        logger.info(f"HTML 보고서 생성: {output_file}")
+    elif args.output == 'json':
+        output_file = args.output_file or 'halo-report.json'
+        reporter = JSONReporter()
+        reporter.generate(results, output_file)
+        logger.info(f"JSON 보고서 생성: {output_file}")
+    
+    # CI 모드: 문제가 있으면 1 반환
+    if args.ci:
+        error_count = len(results.get('errors', []))
+        warning_count = len(results.get('warnings', []))
+        if error_count > 0:
+            return 1
+        elif warning_count > 0:
+            return 2
+    
+    return 0
+
+
 def print_results(results):
     """콘솔에 결과 출력"""
+    # 진행 로그(stderr)가 결과 사이에 끼지 않도록 먼저 비움
+    flush_logging()
+    
     print("\n🔍 Halo Workflow 분석 결과")
     print("=" * 50)
     
@@ -145,6 +394,16 @@ def print_results(results):
     print(f"  - 발견된 문제: {summary.get('total_issues', 0)}개")
     print(f"  - 오류: {summary.get('error_count', 0)}개")
     print(f"  - 경고: {summary.get('warning_count', 0)}개")
+    if summary.get('suppressed_count'):
+        print(f"  - 기준선으로 억제: {summary['suppressed_count']}개")
+    if summary.get('timed_out_count'):
+        print(f"  - 시간 초과로 건너뜀: {summary['timed_out_count']}개")
+    if summary.get('identical_files'):
+        print(f"  - 내용이 같아 결과를 재사용한 파일: {summary['identical_files']}개")
+    triage = summary.get('triage') or {}
+    if triage.get('skipped') or triage.get('fast'):
+        reasons = ', '.join(f"{reason} {count}" for reason, count in triage.get('reasons', {}).items())
+        print(f"  - 분류: 건너뜀 {triage['skipped']}개, 빠른 규칙만 {triage['fast']}개 ({reasons})")
     
     # 주요 문제
     errors = results.get('errors', [])
@@ -159,10 +418,18 @@ def print_results(results):
     if warnings:
         print(f"\n⚠️  경고 ({len(warnings)}개):")
         for i, warning in enumerate(warnings[:5], 1):
-            print(f"  {i}. {warning['file']}: {warning['message']}")
+            location = warning.get('file') or ', '.join(warning.get('files', []))
+            print(f"  {i}. {location}: {warning['message']}")
         if len(warnings) > 5:
             print(f"  ... 그 외 {len(warnings) - 5}개")
     
+    # 여러 파일에 반복되는 하드코딩 값
+    repeated = [value for value in results.get('hardcoded_values', []) if value['file_count'] > 1]
+    if repeated:
+        print(f"\n🔁 반복되는 하드코딩 값 (상위 {min(len(repeated), 5)}개):")
+        for i, value in enumerate(repeated[:5], 1):
+            print(f"  {i}. {display_literal(value)[:60]} - {value['file_count']}개 파일, {value['occurrences']}회 [{value['type']}]")
+    
     # 개선 제안
     suggestions = results.get('suggestions', [])
     if suggestions:
@@ -173,33 +440,75 @@ def print_results(results):
     print("\n" + "=" * 50)
 
 
+def _load_history(project_path: str, limit: int):
+    """추이 차트용 최근 실행 기록"""
+    if limit <= 0:
+        return None
+    
+    try:
+        with ResultStore() as store:
+            return store.list_runs(project_path, limit=limit)
+    except Exception as e:
+        logger.warning(f"실행 기록을 불러오지 못했습니다: {e}")
+        return None
+
+
+def _resolve_run_id(store: ResultStore, run_id: Optional[int]) -> Optional[int]:
+    """실행 id 확인 (지정하지 않으면 최근 실행)"""
+    if run_id is None:
+        run_id = store.latest_run_id()
+    
+    if run_id is None or store.get_run(run_id) is None:
+        if run_id is None:
+            logger.error("분석 결과가 없습니다. 먼저 'halo-workflow analyze'를 실행하세요.")
+        else:
+            logger.error(f"실행 기록을 찾을 수 없습니다: {run_id}")
+        return None
+    
+    return run_id
+
+
+def print_abort_report(results):
+    """fail-fast 중단 시 최소 보고서 출력"""
+    flush_logging()
+    
+    error = results['errors'][0]
+    print("\n❌ Halo Workflow fail-fast: 오류 발견으로 분석 중단")
+    print(f"  {error['file']}:{error['line']}: {error['message']}")
+    print(f"  (분석된 파일: {results['summary'].get('total_files', 0)}개)")
+
+
 def report_command(args):
     """보고서 생성"""
-    # 최근 분석 결과 로드
-    results_file = Path.home() / '.halo-workflow' / 'last-analysis.json'
-    
-    if not results_file.exists():
-        logger.error("분석 결과가 없습니다. 먼저 'halo-workflow analyze'를 실행하세요.")
+    if args.format == 'markdown':
+        # TODO: Markdown reporter 구현
+        logger.error("Markdown 형식은 아직 지원되지 않습니다.")
         return 1
     
-    with open(results_file) as f:
-        results = json.load(f)
+    with ResultStore() as store:
+        run_id = _resolve_run_id(store, args.run)
+        if run_id is None:
+            return 1
+        
+        # HTML 보고서는 표시할 행만 읽는다
+        history = None
+        if args.format == 'html':
+            results = store.load_results(run_id, limit=HTMLReporter.MAX_ISSUES, include_files=False)
+            if args.trend > 0:
+                history = store.list_runs(results['project_path'], limit=args.trend, until_run_id=run_id)
+        else:
+            results = store.load_results(run_id)
     
     # 보고서 생성
     output_file = args.output
     if args.format == 'html':
         output_file = output_file or 'halo-report.html'
         reporter = HTMLReporter()
-        reporter.generate(results, output_file)
+        reporter.generate(results, output_file, history=history)
     elif args.format == 'json':
         output_file = output_file or 'halo-report.json'
         reporter = JSONReporter()
         reporter.generate(results, output_file)
-    elif args.format == 'markdown':
-        output_file = output_file or 'halo-report.md'
-        # TODO: Markdown reporter 구현
-        logger.error("Markdown 형식은 아직 지원되지 않습니다.")
-        return 1
     
     logger.info(f"{args.format.upper()} 보고서 생성: {output_file}")
     
@@ -211,6 +520,275 @@ def report_command(args):
     return 0
 
 
+def query_command(args):
+    """저장된 분석 결과 조회"""
+    client = None if args.no_daemon else DaemonClient.connect()
+    if client is not None:
+        try:
+            with client:
+                response = client.request(
+                    'query', run=args.run, type=args.issue_type, path=args.path,
+                    severity=args.severity, limit=args.limit, literal=args.literal
+                )
+        except (OSError, RuntimeError) as e:
+            logger.error(f"조회 실패: {e}")
+            return 1
+        run_id = response['run_id']
+        if args.literal is not None:
+            return print_literal_occurrences(args, run_id, response['occurrences'])
+        issues = response['issues']
+    else:
+        with ResultStore() as store:
+            run_id = _resolve_run_id(store, args.run)
+            if run_id is None:
+                return 1
+            
+            if args.literal is not None:
+                occurrences = store.query_literal(run_id, args.literal, path=args.path, limit=args.limit)
+                return print_literal_occurrences(args, run_id, occurrences)
+            
+            issues = store.query_issues(
+                run_id,
+                issue_type=args.issue_type,
+                path=args.path,
+                severity=args.severity,
+                limit=args.limit
+            )
+    
+    if args.format == 'json':
+        print(json.dumps(issues, indent=2, ensure_ascii=False, default=str))
+        return 0
+    
+    print(f"\n🔎 조회 결과 (실행 #{run_id}): {len(issues)}개")
+    for issue in issues:
+        location = issue.get('file') or ', '.join(issue.get('files', []))
+        if issue.get('line'):
+            location += f":{issue['line']}"
+        print(f"  [{issue['severity']}] {issue.get('type', 'unknown')} {location} - {issue.get('message', '')}")
+    
+    return 0
+
+
+def print_literal_occurrences(args, run_id: int, occurrences) -> int:
+    """하드코딩 값 조회 결과 출력"""
+    value = normalize_literal(args.literal)
+    
+    if args.format == 'json':
+        print(json.dumps({'value': value, 'occurrences': occurrences}, indent=2, ensure_ascii=False, default=str))
+        return 0
+    
+    file_count = len({occurrence['file'] for occurrence in occurrences})
+    print(f"\n🔎 '{value}' 등장 위치 (실행 #{run_id}): {len(occurrences)}회, {file_count}개 파일")
+    for occurrence in occurrences:
+        print(f"  {occurrence['file']}:{occurrence['line']}:{occurrence['column']} [{occurrence['type']}]")
+    
+    return 0
+
+
+def _parse_run_ref(store: ResultStore, ref: str, latest: Optional[int]) -> Optional[int]:
+    """실행 참조('latest', 'previous', 숫자)를 실행 id로 변환"""
+    if ref == 'latest':
+        return latest
+    if ref == 'previous':
+        return store.previous_run_id(latest) if latest is not None else None
+    
+    try:
+        return int(ref)
+    except ValueError:
+        logger.error(f"잘못된 실행 id: {ref}")
+        return None
+
+
+def diff_command(args):
+    """두 실행 결과 비교"""
+    with ResultStore() as store:
+        latest = store.latest_run_id()
+        run_a = _resolve_run_id(store, _parse_run_ref(store, args.run_a, latest))
+        if run_a is None:
+            return 1
+        run_b = _resolve_run_id(store, _parse_run_ref(store, args.run_b, latest))
+        if run_b is None:
+            return 1
+        
+        diff = store.diff_runs(run_a, run_b)
+    
+    if args.format == 'json':
+        print(json.dumps({'base': run_a, 'head': run_b, **diff}, indent=2, ensure_ascii=False, default=str))
+        return 0
+    
+    print(f"\n🔀 실행 비교: #{run_a} → #{run_b}")
+    print("=" * 50)
+    print(f"  - 새로운 문제: {len(diff['new'])}개")
+    print(f"  - 해결된 문제: {len(diff['fixed'])}개")
+    print(f"  - 유지된 문제: {len(diff['unchanged'])}개")
+    
+    for title, key in (("🆕 새로운 문제", 'new'), ("✅ 해결된 문제", 'fixed')):
+        issues = diff[key]
+        if not issues:
+            continue
+        print(f"\n{title}:")
+        for issue in issues[:args.limit]:
+            location = issue.get('file') or ', '.join(issue.get('files', []))
+            if issue.get('line'):
+                location += f":{issue['line']}"
+            print(f"  [{issue['severity']}] {location} - {issue.get('message', '')}")
+        if len(issues) > args.limit:
+            print(f"  ... 그 외 {len(issues) - args.limit}개")
+    
+    print("\n" + "=" * 50)
+    return 0
+
+
+def baseline_command(args):
+    """기준선 파일 생성"""
+    project_path = Path(args.path).resolve()
+    output_file = Path(args.output) if args.output else project_path / DEFAULT_BASELINE_FILE
+    
+    with ResultStore() as store:
+        run_id = args.run if args.run is not None else store.latest_run_id(str(project_path))
+        if run_id is None:
+            logger.error(f"분석 결과가 없습니다. 먼저 'halo-workflow analyze {args.path}'를 실행하세요.")
+            return 1
+        run_id = _resolve_run_id(store, run_id)
+        if run_id is None:
+            return 1
+        
+        fingerprints = store.run_fingerprints(run_id)
+    
+    # 기존 기준선에 있던 문제는 실행 결과에서 이미 빠져 있으므로 함께 유지
+    if output_file.exists():
+        fingerprints.extend(load_baseline(output_file))
+    
+    count = write_baseline(output_file, fingerprints)
+    logger.info(f"기준선 생성: {count}개 문제 (실행 #{run_id}) → {output_file}")
+    return 0
+
+
+def detectors_command(args):
+    """사용 가능한 탐지기 목록 출력"""
+    detectors = default_registry().describe()
+    
+    if args.format == 'json':
+        print(json.dumps(detectors, indent=2, ensure_ascii=False))
+        return 0
+    
+    print("\n🧩 사용 가능한 탐지기")
+    print("=" * 50)
+    for detector in detectors:
+        extensions = ', '.join(detector['extensions']) if detector['extensions'] is not None else '모든 파일'
+        print(f"  - {detector['name']} (문제 유형: {detector['issue_type']})")
+        print(f"      적용 확장자: {extensions}")
+        print(f"      규칙: {', '.join(detector['rule_ids']) or '-'}")
+        for pattern, risks in detector['pattern_risks'].items():
+            print(f"      ⚠️  백트래킹 위험 ({', '.join(risks)}): {pattern}")
+    print("=" * 50)
+    return 0
+
+
+def diagnose_command(args):
+    """프로젝트 진단 실행"""
+    project_path = Path(args.path).resolve()
+    
+    if not project_path.exists():
+        logger.error(f"경로를 찾을 수 없습니다: {project_path}")
+        return 1
+    
+    # complete 단계의 코드 분석은 analyze 기본 설정과 같은 분석기 사용 (데몬 캐시 공유)
+    is_premium = LicenseManager().is_premium()
+    max_files = None if is_premium else 100
+    
+    # 데몬에는 파일 목록과 분석만 요청하고 tsc, build는 이 프로세스에서 실행
+    result = None
+    client = None if args.no_daemon else DaemonClient.connect()
+    if client is not None:
+        try:
+            with client:
+                logger.debug("분석 데몬 사용")
+                analyzer = RemoteAnalyzer(
+                    client,
+                    max_files=max_files,
+                    ignore=args.ignore or [],
+                    premium=is_premium,
+                    file_timeout=DEFAULT_FILE_TIMEOUT,
+                    chunk_threshold=DEFAULT_CHUNK_THRESHOLD
+                )
+                logger.info(f"프로젝트 진단 시작 ({args.level}): {project_path}")
+                result = ProjectDiagnostic(
+                    analyzer, args.level, args.require_files, args.require_deps
+                ).run(project_path)
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"분석 데몬 요청 실패, 직접 진단합니다: {e}")
+    
+    if result is None:
+        try:
+            baseline_file = project_path / DEFAULT_BASELINE_FILE
+            analyzer = WorkflowAnalyzer(
+                max_files=max_files,
+                ignore_patterns=args.ignore or [],
+                premium_features=is_premium,
+                baseline=load_baseline(baseline_file) if baseline_file.exists() else None,
+                file_timeout=DEFAULT_FILE_TIMEOUT
+            )
+            logger.info(f"프로젝트 진단 시작 ({args.level}): {project_path}")
+            result = ProjectDiagnostic(
+                analyzer, args.level, args.require_files, args.require_deps
+            ).run(project_path)
+        except Exception as e:
+            logger.error(f"진단 중 오류 발생: {e}")
+            return 1
+    
+    if args.format == 'json':
+        print(json.dumps(result, indent=2, ensure_ascii=False, default=str))
+    else:
+        print_diagnosis(result)
+    
+    return 1 if result['summary']['failed'] else 0
+
+
+def print_diagnosis(result):
+    """진단 결과를 콘솔에 출력"""
+    flush_logging()
+    
+    icons = {'ok': '✅', 'warning': '⚠️ ', 'fail': '❌', 'skip': '⏭️ '}
+    print(f"\n🩺 Halo Workflow 프로젝트 진단 ({result['level']})")
+    print(f"   {result['project_path']}")
+    print("=" * 50)
+    
+    for check in result['checks']:
+        print(f"{icons[check['status']]} {check['title']}: {check['message']} ({check['duration']:.1f}초)")
+        for detail in check['details']:
+            print(f"     - {detail}")
+        if check['more_details']:
+            print(f"     ... 그 외 {check['more_details']}개")
+    
+    summary = result['summary']
+    print("=" * 50)
+    print(f"📊 통과 {summary['passed']}개, 경고 {summary['warnings']}개, "
+          f"실패 {summary['failed']}개, 건너뜀 {summary['skipped']}개 (전체 {summary['total']}개)")
+
+
+def serve_command(args):
+    """분석 데몬 실행 또는 종료"""
+    if args.stop:
+        client = DaemonClient.connect()
+        if client is None:
+            logger.error("실행 중인 분석 데몬이 없습니다.")
+            return 1
+        with client:
+            client.request('shutdown')
+        logger.info("분석 데몬 종료 요청을 보냈습니다.")
+        return 0
+    
+    client = DaemonClient.connect()
+    if client is not None:
+        client.close()
+        logger.error("분석 데몬이 이미 실행 중입니다.")
+        return 1
+    
+    AnalysisDaemon(socket_path=args.socket, port=args.port).run()
+    return 0
+
+
 def activate_command(args):
     """라이선스 활성화"""
     license_manager = LicenseManager()
@@ -255,10 +833,12 @@ def status_command(args):
     return 0
 
 
-def main():
-    """메인 엔트리 포인트"""
+def main(argv: Optional[List[str]] = None):
+    """메인 엔트리 포인트 (argv: 생략하면 sys.argv 사용)"""
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    
+    configure_logging(verbosity=-1 if args.quiet else args.verbose, log_file=args.log_file)
     
     if not args.command:
         parser.print_help()
@@ -269,6 +849,20 @@ def main():
         return analyze_command(args)
     elif args.command == 'report':
         return report_command(args)
+    elif args.command == 'merge':
+        return merge_command(args)
+    elif args.command == 'query':
+        return query_command(args)
+    elif args.command == 'diff':
+        return diff_command(args)
+    elif args.command == 'baseline':
+        return baseline_command(args)
+    elif args.command == 'detectors':
+        return detectors_command(args)
+    elif args.command == 'diagnose':
+        return diagnose_command(args)
+    elif args.command == 'serve':
+        return serve_command(args)
     elif args.command == 'activate':
         return activate_command(args)
     elif args.command == 'status':
@@ -4,48 +4,229 @@
 
 import os
 import ast
+import fnmatch
+import hashlib
 import json
 import re
+import time
+import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Iterable, Iterator
 from collections import defaultdict
 
-from ..analyzers.hardcoding_detector import HardcodingDetector
-from ..analyzers.dummy_data_detector import DummyDataDetector
+from ..analyzers.registry import (
+    DetectorRegistry, default_registry, build_dispatch_table, build_fast_dispatch_table
+)
+from ..analyzers.byte_scan import LineSpan, iter_windows, count_chars
 from ..analyzers.duplicate_detector import DuplicateDetector
 from ..analyzers.api_flow_analyzer import APIFlowAnalyzer
 from ..utils.logger import setup_logger
+from .result_store import ResultStore
+from .fingerprint import FingerprintBuilder, normalize_line, compute_fingerprint
+from .sharding import shard_for_path, PARTIAL_FORMAT, PARTIAL_VERSION
+from .file_index import FileIndex, FileCache
+from .issues import Issue
+from .literal_index import LiteralIndex
+from .triage import triage_file, FULL, FAST, SKIP
+from .watchdog import FileWorker, FileTimeout
 
 logger = setup_logger(__name__)
 
+# 창 단위 검사 기본 설정 (바이트) - 경계에 걸친 매치는 CHUNK_OVERLAP 길이까지 정확히 한 번 보고
+DEFAULT_CHUNK_THRESHOLD = 64 * 1024 * 1024
+CHUNK_SIZE = 4 * 1024 * 1024
+CHUNK_OVERLAP = 64 * 1024
+
 
 class WorkflowAnalyzer:
     """워크플로우 분석기"""
     
+    # 분석 가능한 파일 확장자
+    ANALYZABLE_EXTENSIONS = [
+        '.py', '.js', '.jsx', '.ts', '.tsx', '.java', '.cpp', '.c',
+        '.cs', '.go', '.rb', '.php', '.swift', '.kt', '.rs',
+        '.json', '.yaml', '.yml', '.xml', '.env', '.config'
+    ]
+    
     def __init__(self, max_files: Optional[int] = None, 
                  ignore_patterns: List[str] = None,
-                 premium_features: bool = False):
+                 premium_features: bool = False,
+                 store_path: Optional[Path] = None,
+                 baseline: Optional[Set[str]] = None,
+                 fail_fast: bool = False,
+                 file_index: Optional[FileIndex] = None,
+                 file_cache: Optional[FileCache] = None,
+                 detectors: Optional[List[str]] = None,
+                 disabled_detectors: Optional[List[str]] = None,
+                 registry: Optional[DetectorRegistry] = None,
+                 triage: bool = True,
+                 file_timeout: Optional[float] = None,
+                 chunk_threshold: Optional[int] = DEFAULT_CHUNK_THRESHOLD,
+                 check_patterns: bool = True):
         self.max_files = max_files
         self.ignore_patterns = ignore_patterns or []
         self.premium_features = premium_features
+        self.store_path = store_path
+        self.baseline = baseline or set()
+        self.fail_fast = fail_fast
+        self.triage = triage
+        # 파일 하나의 분석 시간 제한 (초, 지정하면 모든 파일을 재사용하는 작업 프로세스에서 분석)
+        self.file_timeout = file_timeout
+        self._detector_options = (detectors, disabled_detectors)
+        self._worker: Optional[FileWorker] = None
+        # 이보다 큰 파일은 창 단위로 읽음 (바이트, None이면 항상 전체를 읽음)
+        self.chunk_threshold = chunk_threshold
+        self.chunk_size = CHUNK_SIZE
+        self.chunk_overlap = CHUNK_OVERLAP
+        
+        # 데몬처럼 여러 번 분석하는 경우 공유되는 캐시 (없으면 사용 안 함)
+        self.file_index = file_index
+        self.file_cache = file_cache
         self.file_count = 0
+        self.suppressed_count = 0
+        
+        # 파일 단위 탐지기 (레지스트리에서 활성화된 것만 생성)
+        self.registry = registry or default_registry()
+        self.detectors = self.registry.create(detectors, disabled_detectors, check_patterns=check_patterns)
+        # 확장자별 실행할 탐지기 (분석 중에는 조회만 함)
+        self.dispatch_table = build_dispatch_table(self.detectors, self.ANALYZABLE_EXTENSIONS)
+        # 분류 결과 fast인 파일(생성 코드, 압축 파일)에 실행할 탐지기
+        self.fast_dispatch_table = build_fast_dispatch_table(self.dispatch_table)
+        
+        # 파일 단위 레코드에 영향을 주는 설정 (기준선, 활성 탐지기, 분류 사용 여부)
+        self.cache_key = compute_fingerprint(
+            *sorted(self.baseline), *(detector.name for detector in self.detectors),
+            'triage' if triage else 'no-triage', str(chunk_threshold)
+        )
         
         # 분석기 초기화
-        self.hardcoding_detector = HardcodingDetector()
-        self.dummy_data_detector = DummyDataDetector()
         self.duplicate_detector = DuplicateDetector()
         self.api_flow_analyzer = APIFlowAnalyzer()
+        # 프로젝트 전체 하드코딩 값 색인 (값 → 등장 위치)
+        self.literal_index = LiteralIndex()
+        # 내용 해시별 탐지 결과 (같은 내용의 파일은 탐지기를 한 번만 실행)
+        self._content_results: Dict[tuple, Dict[str, Any]] = {}
         
         # 기본 무시 패턴
         self.default_ignore = [
             'node_modules', '__pycache__', '.git', '.svn',
             '*.pyc', '*.pyo', '*.pyd', '.DS_Store', 'dist',
-            'build', '*.egg-info', '.venv', 'venv', '.env'
+            'build', '*.egg-info', '.venv', 'venv', '.env', '.env.*',
+            '.diagnostic_cache'
         ]
     
     def analyze(self, project_path: Path) -> Dict[str, Any]:
         """프로젝트 분석 실행"""
-        results = {
+        results = self._new_results(project_path)
+        
+        # 파일별 분석
+        try:
+            for file_path in self._select_files(project_path):
+                record = self._analyze_file_cached(file_path, project_path)
+                if not record:
+                    continue
+                self._merge_file_record(record, results)
+                
+                # fail-fast: 첫 오류에서 나머지 파일, 전체 분석, 저장을 모두 생략
+                # (값별로 모아 보고하는 리터럴 오류도 레코드에서 바로 확인)
+                if self.fail_fast and record['errors']:
+                    return self._abort_results(results, record['errors'][0])
+        finally:
+            self._close_worker()
+        
+        return self._finalize(results)
+    
+    def iter_issues(self, project_path: Path) -> Iterator[Issue]:
+        """파일 분석이 끝날 때마다 문제를 하나씩 반환하는 제너레이터
+        
+        파일 단위 문제는 바로 반환하고 버퍼에 쌓지 않는다. 중복 코드, API 흐름처럼
+        프로젝트 전체가 필요한 문제는 마지막에 반환한다. 중간에 멈춰도 되며,
+        결과 저장소에는 기록하지 않는다.
+        """
+        project_path = Path(project_path)
+        # 프로젝트 전체 분석에 필요한 상태(중복 지문, API 흐름)만 유지
+        state = self._new_results(project_path)
+        
+        try:
+            for file_path in self._select_files(project_path):
+                record = self._analyze_file_cached(file_path, project_path)
+                if not record:
+                    continue
+                
+                self.suppressed_count += record['suppressed']
+                self._merge_project_state(record, state)
+                
+                # 리터럴 값이 있는 문제는 analyze와 같이 마지막에 값별로 반환
+                for entry in record['errors']:
+                    if not entry.get('literal'):
+                        yield Issue.from_entry(entry, 'error')
+                for entry in record['warnings']:
+                    if not entry.get('literal'):
+                        yield Issue.from_entry(entry, 'warning')
+        finally:
+            # 소비자가 중간에 멈춰도(제너레이터 종료) 작업 프로세스 정리
+            self._close_worker()
+        
+        # 프로젝트 전체 문제 (값별 하드코딩 오류 포함)
+        self._analyze_project_wide(state)
+        for entry in state['errors']:
+            yield Issue.from_entry(entry, 'error')
+        for entry in state['warnings']:
+            yield Issue.from_entry(entry, 'warning')
+    
+    def analyze_shard(self, project_path: Path, shard_index: int, shard_count: int) -> Dict[str, Any]:
+        """샤드 분석 - 경로 해시가 shard_index인 파일만 분석한 부분 결과 반환
+        
+        프로젝트 전체 분석(중복, API 흐름)은 merge_partials에서 수행한다.
+        """
+        files = self._select_files(project_path)
+        records = []
+        
+        try:
+            for index, file_path in enumerate(files):
+                path_key = file_path.relative_to(project_path).as_posix()
+                if shard_for_path(path_key, shard_count) != shard_index:
+                    continue
+                
+                record = self._analyze_file_cached(file_path, project_path)
+                if record:
+                    # 병합 시 단일 실행과 같은 순서로 복원하기 위한 전역 순번
+                    records.append(dict(record, index=index))
+        finally:
+            self._close_worker()
+        
+        return {
+            'format': PARTIAL_FORMAT,
+            'version': PARTIAL_VERSION,
+            'project_path': str(project_path),
+            'shard': [shard_index, shard_count],
+            'total_files': len(files),
+            'records': records
+        }
+    
+    def merge_partials(self, partials: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """샤드 부분 결과를 병합하고 프로젝트 전체 분석 실행"""
+        partials = list(partials)
+        results = self._new_results(partials[0]['project_path'])
+        
+        records = sorted(
+            (record for partial in partials for record in partial['records']),
+            key=lambda record: record['index']
+        )
+        for record in records:
+            self._merge_file_record(record, results)
+        
+        return self._finalize(results)
+    
+    def _new_results(self, project_path) -> Dict[str, Any]:
+        """빈 결과 생성"""
+        self.suppressed_count = 0
+        # 분석기를 재사용할 때 이전 실행의 중복 검사 상태가 섞이지 않도록 초기화
+        self.duplicate_detector = DuplicateDetector()
+        self.literal_index = LiteralIndex()
+        self._content_results = {}
+        
+        return {
             'project_path': str(project_path),
             'summary': {},
             'errors': [],
@@ -54,10 +235,12 @@ class WorkflowAnalyzer:
             'files': {},
             'dependencies': {},
             'api_flows': {},
+            'hardcoded_values': [],
             'suggestions': []
         }
-        
-        # 파일 수집
+    
+    def _select_files(self, project_path: Path) -> List[Path]:
+        """분석 대상 파일 수집 및 제한 적용"""
         files = self._collect_files(project_path)
         
         # 파일 수 제한 체크
@@ -65,10 +248,10 @@ class WorkflowAnalyzer:
             logger.warning(f"파일 수 제한: {len(files)}개 중 {self.max_files}개만 분석합니다.")
             files = files[:self.max_files]
         
-        # 파일별 분석
-        for file_path in files:
-            self._analyze_file(file_path, results)
-        
+        return files
+    
+    def _finalize(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """프로젝트 전체 분석, 요약, 제안 생성 후 저장"""
         # 전체 프로젝트 분석
         self._analyze_project_wide(results)
         
@@ -83,122 +266,496 @@ class WorkflowAnalyzer:
         
         return results
     
+    def _abort_results(self, results: Dict[str, Any], trigger: Dict[str, Any]) -> Dict[str, Any]:
+        """fail-fast 중단 시 최소 결과 생성 (trigger: 중단 원인이 된 오류 항목)"""
+        trigger = {key: value for key, value in trigger.items() if key != 'literal'}
+        logger.info(f"fail-fast: 첫 오류 발견으로 분석 중단 ({trigger['file']}:{trigger['line']})")
+        
+        results['aborted'] = True
+        results['errors'] = [trigger]
+        results['warnings'] = []
+        self._generate_summary(results)
+        return results
+    
     def _collect_files(self, project_path: Path) -> List[Path]:
         """분석할 파일 수집"""
+        return [file_path for file_path in self.project_files(project_path) if self._is_analyzable(file_path)]
+    
+    def project_files(self, project_path: Path) -> List[Path]:
+        """무시 패턴을 제외한 프로젝트 전체 파일 (탐색 순서)
+        
+        분석 대상 여부와 관계없이 모든 파일을 색인해 두므로 diagnose 명령도
+        같은 색인(FileIndex)을 재사용한다.
+        """
+        index_key = (str(project_path), tuple(self.ignore_patterns))
+        if self.file_index is not None:
+            cached = self.file_index.get(index_key)
+            if cached is not None:
+                return cached
+        
         files = []
+        dir_mtimes = {}
         
         for root, dirs, filenames in os.walk(project_path):
+            if self.file_index is not None:
+                try:
+                    dir_mtimes[root] = os.stat(root).st_mtime_ns
+                except OSError:
+                    pass
+            
             # 무시할 디렉토리 제거
             dirs[:] = [d for d in dirs if not self._should_ignore(d)]
             
             for filename in filenames:
-                if self._should_ignore(filename):
-                    continue
-                
-                file_path = Path(root) / filename
-                
-                # 분석 가능한 파일만 추가
-                if self._is_analyzable(file_path):
-                    files.append(file_path)
+                if not self._should_ignore(filename):
+                    files.append(Path(root) / filename)
+        
+        if self.file_index is not None:
+            self.file_index.put(index_key, files, dir_mtimes)
         
         return files
     
     def _should_ignore(self, name: str) -> bool:
-        """파일/폴더 무시 여부 확인"""
-        # 기본 무시 패턴
-        for pattern in self.default_ignore + self.ignore_patterns:
-            if pattern.startswith('*'):
-                if name.endswith(pattern[1:]):
-                    return True
-            elif pattern in name:
-                return True
-        return False
+        """파일/폴더 무시 여부 확인
+        
+        이름 전체가 패턴(glob 가능)과 일치할 때만 무시한다 - 'dist'는 dist 폴더만
+        제외하고 distance.ts는 남긴다.
+        """
+        return any(
+            fnmatch.fnmatchcase(name, pattern)
+            for pattern in self.default_ignore + self.ignore_patterns
+        )
     
     def _is_analyzable(self, file_path: Path) -> bool:
         """분석 가능한 파일인지 확인"""
-        analyzable_extensions = [
-            '.py', '.js', '.jsx', '.ts', '.tsx', '.java', '.cpp', '.c',
-            '.cs', '.go', '.rb', '.php', '.swift', '.kt', '.rs',
-            '.json', '.yaml', '.yml', '.xml', '.env', '.config'
-        ]
+        return file_path.suffix.lower() in self.dispatch_table
+    
+    def _analyze_file_cached(self, file_path: Path, project_path) -> Optional[Dict[str, Any]]:
+        """파일 캐시가 있으면 변경되지 않은 파일의 레코드를 재사용"""
+        if self.file_cache is None:
+            return self._run_file_analysis(file_path, project_path)
+        
+        # 레코드의 경로와 지문은 프로젝트 기준 상대 경로이므로 프로젝트 루트도 키에 포함
+        config_key = compute_fingerprint(self.cache_key, str(project_path))
+        record = self.file_cache.get(file_path, config_key)
+        if record is not None:
+            return record
         
-        return file_path.suffix.lower() in analyzable_extensions
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            stat = None
+        
+        record = self._run_file_analysis(file_path, project_path)
+        # 시간 초과 레코드는 다음 실행에서 다시 시도하도록 캐시하지 않음
+        if record is not None and stat is not None and not record['file'].get('timed_out'):
+            self.file_cache.put(file_path, config_key, record, stat)
+        return record
     
-    def _analyze_file(self, file_path: Path, results: Dict[str, Any]):
-        """개별 파일 분석"""
+    def _run_file_analysis(self, file_path: Path, project_path) -> Optional[Dict[str, Any]]:
+        """시간 제한이 있으면 작업 프로세스에서, 없으면 직접 파일 분석
+        
+        작은 파일도 백트래킹하는 패턴에 걸리면 멈출 수 있으므로 크기와 관계없이 감시한다.
+        작업 프로세스는 실행 동안 재사용하므로 파일마다 드는 비용은 파이프 왕복뿐이다.
+        """
+        if not self.file_timeout:
+            return self._analyze_file(file_path, project_path)
+        
+        if self._worker is None:
+            detectors, disabled_detectors = self._detector_options
+            self._worker = FileWorker({
+                'baseline': self.baseline,
+                'detectors': detectors,
+                'disabled_detectors': disabled_detectors,
+                'triage': self.triage,
+                'chunk_threshold': self.chunk_threshold,
+                # 패턴 검사는 이 프로세스에서 이미 했음
+                'check_patterns': False
+            }, self.file_timeout)
+        
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            relative_path = file_path.relative_to(results['project_path'])
-            file_key = str(relative_path)
-            
-            file_results = {
-                'path': file_key,
-                'size': len(content),
-                'lines': content.count('\n') + 1,
-                'issues': []
-            }
-            
-            # 하드코딩 검사
-            hardcoding_issues = self.hardcoding_detector.detect(content, file_path)
-            for issue in hardcoding_issues:
-                file_results['issues'].append(issue)
-                if issue['severity'] == 'error':
-                    results['errors'].append({
-                        'file': file_key,
-                        'line': issue['line'],
-                        'message': issue['message'],
-                        'type': 'hardcoding'
-                    })
-                else:
-                    results['warnings'].append({
-                        'file': file_key,
-                        'line': issue['line'],
-                        'message': issue['message'],
-                        'type': 'hardcoding'
-                    })
+            return self._worker.analyze(file_path, project_path)
+        except FileTimeout as e:
+            logger.warning(str(e), extra={'file': str(file_path)})
+            return self._timed_out_record(file_path, project_path)
+    
+    def _close_worker(self):
+        """작업 프로세스 종료"""
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
+    
+    def _timed_out_record(self, file_path: Path, project_path) -> Dict[str, Any]:
+        """시간 제한을 넘겨 중단된 파일의 레코드 (문제로 보고)"""
+        file_key = file_path.relative_to(project_path).as_posix()
+        message = f"분석 시간 초과 ({self.file_timeout}초): 파일을 건너뛰었습니다"
+        entry = {
+            'file': file_key,
+            'line': None,
+            'message': message,
+            'type': 'timeout',
+            'fingerprint': FingerprintBuilder().build('timeout', message, file_key)
+        }
+        
+        return {
+            'path': file_key,
+            'file': {'path': file_key, 'size': os.path.getsize(file_path), 'issues': [], 'timed_out': True},
+            'errors': [],
+            'warnings': [] if self._is_suppressed(entry) else [entry],
+            'suppressed': 1 if self._is_suppressed(entry) else 0,
+            'api_info': None,
+            'duplicates': None
+        }
+    
+    def _analyze_file(self, file_path: Path, project_path) -> Optional[Dict[str, Any]]:
+        """개별 파일 분석 - 결과에 병합할 파일 단위 레코드 반환
+        
+        레코드는 JSON으로 직렬화할 수 있어 샤드 부분 결과에 그대로 저장된다.
+        """
+        start = time.perf_counter()
+        
+        try:
+            relative_path = file_path.relative_to(project_path)
+            # 샤드를 다른 OS에서 분석해도 같은 키가 되도록 posix 경로 사용
+            file_key = relative_path.as_posix()
             
-            # 더미 데이터 검사
-            dummy_issues = self.dummy_data_detector.detect(content, file_path)
-            for issue in dummy_issues:
-                file_results['issues'].append(issue)
-                results['warnings'].append({
-                    'file': file_key,
-                    'line': issue['line'],
-                    'message': issue['message'],
-                    'type': 'dummy_data'
-                })
+            # 분류: 잠금 파일, 외부 코드 등은 읽지 않고 건너뜀
+            decision, reason = triage_file(file_path, relative_path) if self.triage else (FULL, '')
+            if decision == SKIP:
+                return self._skipped_record(file_key, file_path, reason)
             
-            # 중복 검사 (나중에 프로젝트 전체 분석에서)
-            self.duplicate_detector.add_file(file_path, content)
+            record = self._new_record(file_key, decision, reason)
+            if self.chunk_threshold and os.path.getsize(file_path) > self.chunk_threshold:
+                self._scan_large_file(file_path, record, decision == FAST)
+            else:
+                self._scan_file(file_path, record, decision == FAST)
             
-            # API 분석
-            if file_path.suffix in ['.py', '.js', '.ts']:
-                api_info = self.api_flow_analyzer.analyze_file(content, file_path)
-                if api_info:
-                    results['api_flows'][file_key] = api_info
+        except Exception as e:
+            logger.error(f"파일 분석 오류 {file_path}: {e}", extra={'file': str(file_path)})
+            return None
+        
+        # 디버그 레벨에서만 파일별 처리 시간 기록
+        if logger.isEnabledFor(logging.DEBUG):
+            duration_ms = round((time.perf_counter() - start) * 1000, 3)
+            logger.debug(
+                f"파일 분석: {file_path} ({duration_ms}ms)",
+                extra={'file': str(file_path), 'duration_ms': duration_ms}
+            )
+        
+        return record
+    
+    def _new_record(self, file_key: str, decision: str, reason: str) -> Dict[str, Any]:
+        """빈 파일 단위 레코드"""
+        file_results = {'path': file_key, 'size': 0, 'lines': 0, 'issues': []}
+        if decision == FAST:
+            file_results['triage'] = {'decision': decision, 'reason': reason}
+        
+        return {
+            'path': file_key,
+            'file': file_results,
+            'errors': [],
+            'warnings': [],
+            'suppressed': 0,
+            'api_info': None,
+            'duplicates': None
+        }
+    
+    def _scan_file(self, file_path: Path, record: Dict[str, Any], fast: bool):
+        """파일 전체를 읽어 탐지기, 중복 지문, API 분석 실행
+        
+        읽으면서 내용 해시를 계산하고, 같은 내용(과 확장자)의 파일을 이미 분석했으면
+        탐지 결과, 중복 지문, API 분석 결과를 재사용한다. 경로에 따른 규칙
+        (탐지기의 applies_to)과 문제 지문은 경로마다 다시 계산한다.
+        """
+        # 원본 바이트로 읽음 - 탐지기는 바이트에서 검사하고, 텍스트가 필요할 때만 디코딩
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        
+        content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+        record['file']['size'] = len(data)
+        record['file']['lines'] = data.count(b'\n') + 1
+        record['file']['content_hash'] = content_hash
+        
+        shared = self._content_results.setdefault((content_hash, file_path.suffix, fast), {})
+        detected = self._run_detectors(data, file_path, fast, shared=shared)
+        
+        # 지문 계산용 라인 (문제가 있을 때만 분리, 필요한 줄만 디코딩)
+        lines = data.split(b'\n') if any(issues for _, issues in detected) else []
+        fingerprints = FingerprintBuilder()
+        
+        for issue_type, issues in detected:
+            pairs = [
+                (issue, self._file_issue_entry(
+                    record['path'], issue, issue_type,
+                    lines[issue['line'] - 1] if 0 < issue['line'] <= len(lines) else b'', fingerprints
+                ))
+                for issue in issues
+            ]
+            self._add_file_issues(record, pairs)
+        
+        # 생성 코드/압축 파일은 중복, API 흐름 분석에서 제외
+        if fast:
+            return
+        
+        # 중복 검사용 지문 (비교는 나중에 프로젝트 전체 분석에서)
+        if 'duplicates' not in shared:
+            shared['duplicates'] = self.duplicate_detector.fingerprint_file(data, file_path.suffix)
+        record['duplicates'] = shared['duplicates']
+        
+        # API 분석
+        if file_path.suffix in ['.py', '.js', '.ts']:
+            if 'api_info' not in shared:
+                shared['api_info'] = self.api_flow_analyzer.analyze_file(
+                    data.decode('utf-8', errors='ignore'), file_path
+                )
+            record['api_info'] = shared['api_info']
+    
+    def _scan_large_file(self, file_path: Path, record: Dict[str, Any], fast: bool):
+        """큰 파일을 겹치는 창 단위로 읽어 탐지기만 실행 (메모리 사용량이 파일 크기와 무관)
+        
+        파일 전체가 필요한 중복 지문과 API 분석은 생략한다.
+        """
+        record['file']['chunked'] = True
+        fingerprints = FingerprintBuilder()
+        # 탐지기별 (문제, 항목) - 작은 파일과 같은 순서(탐지기 순)로 합치기 위해 모아 둠
+        pairs_by_detector: Dict[int, List] = defaultdict(list)
+        size = 0
+        line_count = 0
+        
+        with open(file_path, 'rb') as f:
+            for window, spans in iter_windows(f, self.chunk_size, self.chunk_overlap):
+                detected = self._run_detectors(window, file_path, fast, spans)
+                size = f.tell()
+                line_count = spans[-1].line
+                
+                if not any(issues for _, issues in detected):
+                    continue
+                
+                # 문제가 있는 줄의 텍스트 (조각으로 나뉜 긴 줄은 None - 줄 번호와 매치로 지문 계산)
+                line_texts = {
+                    span.line: None if span.first or span.limit != span.end + 1 else window[span.start:span.end]
+                    for span in spans
+                }
+                for index, (issue_type, issues) in enumerate(detected):
+                    for issue in issues:
+                        entry = self._file_issue_entry(
+                            record['path'], issue, issue_type, line_texts.get(issue['line'], b''), fingerprints
+                        )
+                        pairs_by_detector[index].append((issue, entry))
+        
+        record['file']['size'] = size
+        record['file']['lines'] = line_count
+        for index in sorted(pairs_by_detector):
+            self._add_file_issues(record, pairs_by_detector[index])
+    
+    def _run_detectors(self, data: bytes, file_path: Path, fast: bool,
+                       spans: Optional[List[LineSpan]] = None,
+                       shared: Optional[Dict[str, Any]] = None) -> List[tuple]:
+        """확장자에 적용되는 탐지기 실행 (fast 파일은 빠른 규칙만) - [(문제 유형, 문제 목록)]
+        
+        shared는 같은 내용의 파일끼리 공유하는 탐지기별 결과다. applies_to를 구현한
+        탐지기는 경로 규칙만 경로마다 확인하고 검사 결과는 복사해서 재사용한다.
+        """
+        ext = file_path.suffix.lower()
+        content = None
+        detected = []
+        
+        for detector in (self.fast_dispatch_table if fast else self.dispatch_table).get(ext, []):
+            applies_to = getattr(detector, 'applies_to', None)
+            content_addressed = shared is not None and callable(applies_to)
+            if content_addressed:
+                if not applies_to(file_path):
+                    detected.append((detector.issue_type, []))
+                    continue
+                if detector.name in shared:
+                    detected.append((detector.issue_type, [dict(issue) for issue in shared[detector.name]]))
+                    continue
             
-            results['files'][file_key] = file_results
+            if callable(getattr(detector, 'detect_bytes', None)):
+                issues = detector.detect_bytes(data, file_path, fast=fast, spans=spans)
+            else:
+                # 바이트 검사를 지원하지 않는 탐지기(플러그인)용 텍스트 (창 단위면 줄 번호 보정)
+                if content is None:
+                    content = data.decode('utf-8', errors='ignore')
+                issues = detector.detect_fast(content, file_path) if fast else detector.detect(content, file_path)
+                if spans:
+                    issues = self._window_issues(issues, data, spans[0])
             
-        except Exception as e:
-            logger.error(f"파일 분석 오류 {file_path}: {e}")
+            if content_addressed:
+                shared[detector.name] = [dict(issue) for issue in issues]
+            detected.append((detector.issue_type, issues))
+        
+        return detected
+    
+    def _window_issues(self, issues: List[Dict[str, Any]], window: bytes, span: LineSpan) -> List[Dict[str, Any]]:
+        """창 단위로 실행한 플러그인 결과의 줄 번호 보정
+        
+        긴 줄의 조각이면 이 조각이 소유한 구간 [first, limit)에서 시작하는 매치만 남기고
+        열을 줄 기준으로 바꾼다. 열 정보가 없는 문제는 위치를 알 수 없으므로 줄의 첫 조각에서만 보고한다.
+        """
+        segment = bool(span.first) or span.limit != span.end + 1
+        if segment:
+            first_column = count_chars(window[:span.first])
+            limit_column = count_chars(window[:span.limit])
+        
+        kept = []
+        for issue in issues:
+            issue['line'] += span.line - 1
+            if segment:
+                column = issue.get('column')
+                if not isinstance(column, int):
+                    if span.first:
+                        continue
+                elif issue['line'] != span.line or not first_column <= column < limit_column:
+                    continue
+                else:
+                    issue['column'] = span.column_base + column
+            kept.append(issue)
+        return kept
+    
+    def _add_file_issues(self, record: Dict[str, Any], pairs: List[tuple]):
+        """(탐지기 문제, 결과 항목) 쌍을 레코드에 추가 (기준선에 있으면 억제)"""
+        for issue, entry in pairs:
+            if self._is_suppressed(entry):
+                record['suppressed'] += 1
+                continue
+            record['file']['issues'].append(issue)
+            if issue.get('severity') == 'error':
+                record['errors'].append(entry)
+            else:
+                record['warnings'].append(entry)
+    
+    def _skipped_record(self, file_key: str, file_path: Path, reason: str) -> Dict[str, Any]:
+        """분류 결과 건너뛴 파일의 레코드"""
+        logger.debug(f"파일 건너뜀 ({reason}): {file_path}", extra={'file': str(file_path)})
+        
+        return {
+            'path': file_key,
+            'file': {
+                'path': file_key,
+                'size': os.path.getsize(file_path),
+                'issues': [],
+                'triage': {'decision': SKIP, 'reason': reason}
+            },
+            'errors': [],
+            'warnings': [],
+            'suppressed': 0,
+            'api_info': None,
+            'duplicates': None
+        }
+    
+    def _merge_file_record(self, record: Dict[str, Any], results: Dict[str, Any]):
+        """파일 단위 레코드를 결과에 병합"""
+        file_key = record['path']
+        
+        # 리터럴 값이 있는 문제는 프로젝트 전체 분석에서 값별로 모아 보고
+        results['errors'].extend(entry for entry in record['errors'] if not entry.get('literal'))
+        results['warnings'].extend(entry for entry in record['warnings'] if not entry.get('literal'))
+        self.suppressed_count += record['suppressed']
+        self._merge_project_state(record, results)
+        results['files'][file_key] = record['file']
+    
+    def _merge_project_state(self, record: Dict[str, Any], results: Dict[str, Any]):
+        """프로젝트 전체 분석에 필요한 레코드 정보(중복 지문, API 흐름, 리터럴) 병합"""
+        file_key = record['path']
+        
+        self.literal_index.add_file(file_key, record['file']['issues'])
+        
+        # 다른 문제들과 같이 프로젝트 상대 경로로 기록해 경로 조회가 가능하게 함
+        if record['duplicates']:
+            self.duplicate_detector.add_fingerprints(file_key, record['duplicates'])
+        
+        if record['api_info']:
+            results['api_flows'][file_key] = record['api_info']
+    
+    def _file_issue_entry(self, file_key: str, issue: Dict[str, Any], issue_type: str,
+                          line: Optional[bytes], fingerprints: FingerprintBuilder) -> Dict[str, Any]:
+        """파일 단위 문제 항목 생성 (line: 문제가 있는 줄의 원본 바이트, 조각으로 나뉜 긴 줄은 None)
+        
+        창 크기보다 긴 줄은 큰 파일 경로에서 줄 전체를 볼 수 없으므로, 두 경로 모두
+        줄 내용 대신 줄 번호, 열, 매치 값으로 지문을 만든다.
+        """
+        if line is None or len(line) > self.chunk_size:
+            context = f"{issue['line']}:{issue.get('column', '')}:{issue.get('value', '')}"
+        else:
+            context = normalize_line(line.decode('utf-8', errors='ignore'))
+        
+        entry = {
+            'file': file_key,
+            'line': issue['line'],
+            'message': issue['message'],
+            'type': issue_type,
+            'fingerprint': fingerprints.build(issue_type, issue['message'], file_key, context)
+        }
+        if issue.get('literal'):
+            entry['literal'] = True
+        return entry
+    
+    def _is_suppressed(self, entry: Dict[str, Any]) -> bool:
+        """기준선에 포함된 문제인지 확인"""
+        return entry['fingerprint'] in self.baseline
     
     def _analyze_project_wide(self, results: Dict[str, Any]):
         """프로젝트 전체 분석"""
+        fingerprints = FingerprintBuilder()
+        
+        # 하드코딩 값별 집계 (여러 파일에 퍼진 값 순) - 값 하나당 문제 하나
+        results['hardcoded_values'] = self.literal_index.top()
+        for value in self.literal_index.ranked():
+            first = value['locations'][0]
+            message = f"하드코딩된 {value['type']} 발견: {value['value'][:60]}"
+            if value['occurrences'] > 1:
+                message += f" ({value['file_count']}개 파일, {value['occurrences']}회)"
+            entry = {
+                'file': first['file'],
+                'line': first['line'],
+                'files': value['files'],
+                'message': message,
+                'type': 'hardcoding',
+                'value': value['value'],
+                'count': value['occurrences'],
+                'locations': value['locations'],
+                'fingerprint': fingerprints.build('hardcoding', value['type'], value['key'])
+            }
+            if self._is_suppressed(entry):
+                self.suppressed_count += 1
+            else:
+                results['errors' if value['severity'] == 'error' else 'warnings'].append(entry)
+        
         # 중복 검사
         duplicates = self.duplicate_detector.find_duplicates()
         for dup_group in duplicates:
-            results['warnings'].append({
+            message = f"중복 코드 발견: {dup_group['similarity']}% 유사"
+            if dup_group['type'] == 'clone_class':
+                message = f"중복 코드 발견: {dup_group['message']}"
+            # 복제 묶음 하나당 경고 하나 (겹치는 줄 범위는 합쳐진 상태)
+            entry = {
                 'files': dup_group['files'],
-                'message': f"중복 코드 발견: {dup_group['similarity']}% 유사",
-                'type': 'duplicate'
-            })
+                'blocks': dup_group['blocks'],
+                'message': message,
+                'type': 'duplicate',
+                'fingerprint': fingerprints.build('duplicate', message, *sorted(dup_group['files']))
+            }
+            if self._is_suppressed(entry):
+                self.suppressed_count += 1
+            else:
+                results['warnings'].append(entry)
         
         # API 흐름 분석
         api_issues = self.api_flow_analyzer.analyze_flows(results['api_flows'])
         for issue in api_issues:
-            results['warnings'].append(issue)
+            if 'file' in issue:
+                issue['fingerprint'] = fingerprints.build(
+                    issue['type'], issue['message'], issue['file'], normalize_line(issue.get('code', ''))
+                )
+            else:
+                issue['fingerprint'] = fingerprints.build(
+                    issue['type'], issue['message'], *sorted(issue.get('files', []))
+                )
+            if self._is_suppressed(issue):
+                self.suppressed_count += 1
+            else:
+                results['warnings'].append(issue)
     
     def _generate_summary(self, results: Dict[str, Any]):
         """요약 생성"""
@@ -207,8 +764,13 @@ class WorkflowAnalyzer:
             'total_issues': len(results['errors']) + len(results['warnings']),
             'error_count': len(results['errors']),
             'warning_count': len(results['warnings']),
+            'suppressed_count': self.suppressed_count,
             'file_types': self._count_file_types(results['files']),
-            'issue_types': self._count_issue_types(results)
+            'issue_types': self._count_issue_types(results),
+            'triage': self._count_triage(results['files']),
+            'timed_out_count': sum(1 for file_info in results['files'].values() if file_info.get('timed_out')),
+            'distinct_hardcoded_values': len(self.literal_index),
+            'identical_files': self._count_identical_files(results['files'])
         }
     
     def _count_file_types(self, files: Dict[str, Any]) -> Dict[str, int]:
@@ -219,6 +781,26 @@ class WorkflowAnalyzer:
             types[ext] += 1
         return dict(types)
     
+    def _count_identical_files(self, files: Dict[str, Any]) -> int:
+        """앞에 나온 파일과 내용(과 확장자)이 같아 탐지 결과를 재사용한 파일 수"""
+        keys = [
+            (file_info['content_hash'], Path(path).suffix)
+            for path, file_info in files.items() if file_info.get('content_hash')
+        ]
+        return len(keys) - len(set(keys))
+    
+    def _count_triage(self, files: Dict[str, Any]) -> Dict[str, Any]:
+        """분류 결과 집계 (건너뜀/빠른 규칙 파일 수와 사유별 개수)"""
+        counts = {SKIP: 0, FAST: 0}
+        reasons = defaultdict(int)
+        for file_info in files.values():
+            triage = file_info.get('triage')
+            if triage:
+                counts[triage['decision']] += 1
+                reasons[triage['reason']] += 1
+        
+        return {'skipped': counts[SKIP], 'fast': counts[FAST], 'reasons': dict(reasons)}
+    
     def _count_issue_types(self, results: Dict[str, Any]) -> Dict[str, int]:
         """문제 타입별 개수"""
         types = defaultdict(int)
@@ -242,6 +824,13 @@ class WorkflowAnalyzer:
                 "환경 변수나 설정 파일을 사용하여 하드코딩된 값들을 분리하세요."
             )
         
+        # 같은 값이 여러 파일에 반복되는 경우
+        spread = [value for value in results.get('hardcoded_values', []) if value['file_count'] >= 3]
+        if spread:
+            suggestions.append(
+                f"'{spread[0]['value'][:40]}' 등 {len(spread)}개 값이 여러 파일에 반복됩니다. 공통 설정으로 모으세요."
+            )
+        
         # 더미 데이터가 있는 경우
         dummy_count = results['summary']['issue_types'].get('dummy_data', 0)
         if dummy_count > 0:
@@ -266,12 +855,12 @@ class WorkflowAnalyzer:
         results['suggestions'] = suggestions
     
     def _save_results(self, results: Dict[str, Any]):
-        """결과 저장"""
-        save_dir = Path.home() / '.halo-workflow'
-        save_dir.mkdir(exist_ok=True)
-        
-        with open(save_dir / 'last-analysis.json', 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        """결과 저장 (report/query 명령에서 사용)"""
+        try:
+            with ResultStore(self.store_path) as store:
+                results['run_id'] = store.save_run(results)
+        except Exception as e:
+            logger.error(f"결과 저장 오류: {e}")
     
     def auto_fix(self, results: Dict[str, Any]) -> int:
         """자동 수정 (프리미엄 기능)"""
@@ -0,0 +1,41 @@
+"""
+기준선(baseline) 파일 - 기존 문제 억제
+"""
+
+from pathlib import Path
+from typing import Iterable, Set
+
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 프로젝트 루트에 두는 기본 기준선 파일 이름
+DEFAULT_BASELINE_FILE = '.halo-baseline'
+
+BASELINE_HEADER = '# halo-workflow baseline v1'
+
+
+def write_baseline(path: Path, fingerprints: Iterable[str]) -> int:
+    """지문을 정렬/중복 제거하여 한 줄에 하나씩 저장하고 개수 반환"""
+    unique = sorted(set(fp for fp in fingerprints if fp))
+
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(BASELINE_HEADER + '\n')
+        for fingerprint in unique:
+            f.write(fingerprint + '\n')
+
+    return len(unique)
+
+
+def load_baseline(path: Path) -> Set[str]:
+    """기준선 파일을 지문 집합으로 로드"""
+    fingerprints = set()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                fingerprints.add(line)
+
+    logger.info(f"기준선 로드: {len(fingerprints)}개 문제 억제 ({path})")
+    return fingerprints
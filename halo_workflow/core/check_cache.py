@@ -0,0 +1,85 @@
+"""
+진단 검사 결과 캐시
+
+느린 검사(tsc, npm run build)의 결과를 입력 지문과 함께 저장한다. 설정/잠금 파일은
+내용으로, 소스 파일은 (경로, 크기, mtime)으로 해시하므로 프로젝트가 그대로이면
+저장된 결과를 재사용하고, 바뀌었으면 다시 실행한다. tsc의 증분 빌드 정보도
+같은 캐시 디렉토리에 둔다.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 프로젝트별 캐시 디렉토리 (검사 결과, import 목록, tsc 빌드 정보)
+CACHE_DIR_NAME = '.diagnostic_cache'
+
+LOCK_FILES = ('package-lock.json', 'yarn.lock', 'pnpm-lock.yaml')
+
+# 검사별 입력 - 내용으로 해시하는 파일과 메타데이터로 해시하는 소스 확장자
+TSC_INPUTS = ('tsconfig.json', 'tsconfig.node.json', 'package.json') + LOCK_FILES
+TSC_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs', '.json')
+
+# 빌드는 설정과 자원 파일만 - 소스 파일은 tsc 검사가 맡는다 (tsconfig.json이 없으면
+# 빌드 검사가 TSC_SUFFIXES도 함께 본다)
+BUILD_INPUTS = TSC_INPUTS + (
+    'index.html', 'vite.config.ts', 'vite.config.js', 'postcss.config.js', 'tailwind.config.js'
+)
+BUILD_SUFFIXES = ('.css', '.scss', '.sass', '.less', '.svg')
+
+
+def tree_fingerprint(base_dir, inputs: Iterable[str], files: Iterable[Tuple[str, int, float]]) -> str:
+    """입력 파일 내용과 소스 파일 (상대 경로, 크기, mtime)의 해시"""
+    digest = hashlib.sha256()
+    for name in inputs:
+        try:
+            content = (Path(base_dir) / name).read_bytes()
+        except OSError:
+            continue
+        digest.update(f"{name}\0{len(content)}\0".encode('utf-8'))
+        digest.update(content)
+
+    for rel_path, size, mtime in sorted(files):
+        digest.update(f"{rel_path}\0{size}\0{mtime!r}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def tsc_command(base_dir) -> List[str]:
+    """증분 빌드 정보를 캐시 디렉토리에 유지하는 tsc 타입 검사 명령"""
+    (Path(base_dir) / CACHE_DIR_NAME).mkdir(parents=True, exist_ok=True)
+    build_info = Path(CACHE_DIR_NAME) / 'tsconfig.tsbuildinfo'
+    return ['npx', 'tsc', '--noEmit', '--incremental', '--tsBuildInfoFile', build_info.as_posix()]
+
+
+class CheckCache:
+    """검사별 결과를 계산 당시의 지문과 함께 저장
+
+    결과 형식은 {'returncode', 'stdout', 'stderr'}로 통일해서 diagnose 명령과
+    진단 스크립트가 서로의 결과를 재사용할 수 있게 한다.
+    """
+
+    def __init__(self, base_dir):
+        self.path = Path(base_dir) / CACHE_DIR_NAME / 'checks.json'
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, name: str, key: str) -> Optional[Dict[str, Any]]:
+        """같은 지문으로 계산된 결과 (없으면 None)"""
+        entry = self.entries.get(name)
+        if isinstance(entry, dict) and entry.get('key') == key:
+            return entry.get('result')
+        return None
+
+    def put(self, name: str, key: str, result: Dict[str, Any]):
+        """결과 저장 (저장 실패는 무시 - 다음 실행에서 다시 계산)"""
+        self.entries[name] = {'key': key, 'result': result}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+        except OSError:
+            pass
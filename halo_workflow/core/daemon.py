@@ -0,0 +1,339 @@
+"""
+분석 데몬 - 캐시를 유지한 채 로컬 소켓으로 요청 처리
+
+프로토콜: 한 줄에 하나의 JSON 요청/응답
+  요청: {"command": "analyze" | "files" | "query" | "invalidate" | "ping" | "shutdown", ...}
+  응답: {"ok": true, "result": ...} 또는 {"ok": false, "error": "..."}
+
+데몬은 파일 목록과 분석만 처리하고 외부 명령(tsc, npm run build)은 실행하지 않는다.
+diagnose 명령은 RemoteAnalyzer로 파일 목록과 분석을 요청하고 나머지 검사는 직접 실행한다.
+
+모든 요청에는 주소 파일(소유자만 읽을 수 있음)에 기록된 token이 있어야 한다.
+"""
+
+import asyncio
+import hmac
+import json
+import os
+import secrets
+import signal
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from .analyzer import WorkflowAnalyzer, DEFAULT_CHUNK_THRESHOLD
+from .baseline import DEFAULT_BASELINE_FILE, load_baseline
+from .file_index import FileIndex, FileCache
+from .result_store import ResultStore
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+STATE_DIR = Path.home() / '.halo-workflow'
+DEFAULT_SOCKET_PATH = STATE_DIR / 'daemon.sock'
+# 실행 중인 데몬의 주소 정보 (클라이언트가 접속 위치를 찾는 데 사용)
+DAEMON_INFO_FILE = STATE_DIR / 'daemon.json'
+
+# 설정별로 유지하는 분석기 수
+MAX_ANALYZERS = 8
+
+
+class AnalysisDaemon:
+    """분석 요청을 처리하는 asyncio 데몬"""
+
+    def __init__(self, socket_path: Optional[Path] = None, port: Optional[int] = None):
+        self.socket_path = Path(socket_path) if socket_path else None
+        self.port = port
+        if self.socket_path is None and self.port is None:
+            self.socket_path = DEFAULT_SOCKET_PATH
+
+        # 요청 인증 토큰 (localhost 포트는 다른 사용자도 접속할 수 있음)
+        self.token = secrets.token_hex(16)
+
+        self.file_index = FileIndex()
+        self.file_cache = FileCache()
+        self.analyzers: Dict[Tuple, WorkflowAnalyzer] = {}
+        self.baselines: Dict[str, Tuple[int, set]] = {}
+
+        # 캐시 접근을 직렬화하기 위해 분석은 작업 스레드 하나에서 실행
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self._stop: Optional[asyncio.Event] = None
+
+    def run(self):
+        """데몬 실행 (종료될 때까지 블록)"""
+        asyncio.run(self._serve())
+
+    async def _serve(self):
+        """서버 시작 및 종료 대기"""
+        self._stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        STATE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.port is not None:
+            server = await asyncio.start_server(self._handle_client, '127.0.0.1', self.port)
+            address = {'host': '127.0.0.1', 'port': server.sockets[0].getsockname()[1]}
+        else:
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            # bind 시점부터 소유자만 접근할 수 있도록 umask로 권한 제한
+            old_umask = os.umask(0o077)
+            try:
+                server = await asyncio.start_unix_server(self._handle_client, str(self.socket_path))
+            finally:
+                os.umask(old_umask)
+            address = {'socket': str(self.socket_path)}
+
+        # 토큰이 들어 있으므로 소유자만 읽을 수 있게 생성
+        if DAEMON_INFO_FILE.exists():
+            DAEMON_INFO_FILE.unlink()
+        fd = os.open(DAEMON_INFO_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(dict(address, pid=os.getpid(), token=self.token), f)
+        logger.info(f"분석 데몬 시작: {address}")
+
+        try:
+            async with server:
+                await self._stop.wait()
+        finally:
+            self._cleanup()
+            self.executor.shutdown(wait=False)
+            logger.info("분석 데몬 종료")
+
+    def _cleanup(self):
+        """소켓 및 주소 파일 정리"""
+        try:
+            with open(DAEMON_INFO_FILE) as f:
+                if json.load(f).get('pid') == os.getpid():
+                    DAEMON_INFO_FILE.unlink()
+        except (OSError, ValueError):
+            pass
+
+        if self.socket_path is not None and self.socket_path.exists():
+            self.socket_path.unlink()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """클라이언트 연결 처리"""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                try:
+                    request = json.loads(line)
+                    if not hmac.compare_digest(str(request.get('token', '')), self.token):
+                        writer.write(json.dumps({'ok': False, 'error': '인증 실패'}).encode('utf-8') + b'\n')
+                        await writer.drain()
+                        break
+
+                    if request.get('command') == 'shutdown':
+                        writer.write(json.dumps({'ok': True, 'result': None}).encode('utf-8') + b'\n')
+                        await writer.drain()
+                        self._stop.set()
+                        break
+
+                    result = await loop.run_in_executor(self.executor, self.dispatch, request)
+                    response = {'ok': True, 'result': result}
+                except Exception as e:
+                    logger.error(f"데몬 요청 처리 오류: {e}")
+                    response = {'ok': False, 'error': str(e)}
+
+                writer.write(json.dumps(response, ensure_ascii=False, default=str).encode('utf-8') + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            # 연결 끊김 또는 데몬 종료 중
+            pass
+        finally:
+            writer.close()
+
+    def dispatch(self, request: Dict[str, Any]) -> Any:
+        """요청 처리 (작업 스레드에서 실행)"""
+        command = request.get('command')
+
+        if command == 'ping':
+            return {'pid': os.getpid(), 'cached_files': len(self.file_cache), 'indexed_projects': len(self.file_index)}
+        if command == 'analyze':
+            return self._analyze(request)
+        if command == 'files':
+            return self._files(request)
+        if command == 'query':
+            return self._query(request)
+        if command == 'invalidate':
+            paths = request.get('paths') or None
+            self.file_index.invalidate(paths)
+            return {'invalidated': self.file_cache.invalidate(paths)}
+
+        raise ValueError(f"알 수 없는 명령: {command}")
+
+    def _analyze(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """분석 요청 처리"""
+        project_path = Path(request['path']).resolve()
+        return self._get_analyzer(request, project_path).analyze(project_path)
+
+    def _files(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """프로젝트 파일 목록 요청 처리 (analyze와 같은 파일 색인 사용)"""
+        project_path = Path(request['path']).resolve()
+        files = self._get_analyzer(request, project_path).project_files(project_path)
+        return {'files': [str(path) for path in files]}
+
+    def _get_analyzer(self, request: Dict[str, Any], project_path: Path) -> WorkflowAnalyzer:
+        """요청 옵션에 맞는 분석기 (같은 옵션이면 재사용)"""
+        baseline = self._load_baseline(request, project_path)
+
+        key = (
+            request.get('max_files'),
+            tuple(request.get('ignore') or []),
+            bool(request.get('premium')),
+            bool(request.get('fail_fast')),
+            frozenset(baseline) if baseline else None,
+            tuple(request.get('detectors') or []),
+            tuple(sorted(request.get('disabled_detectors') or [])),
+            bool(request.get('no_triage')),
+            request.get('file_timeout'),
+            request.get('chunk_threshold', DEFAULT_CHUNK_THRESHOLD),
+        )
+        analyzer = self.analyzers.pop(key, None)
+        if analyzer is None:
+            analyzer = WorkflowAnalyzer(
+                max_files=request.get('max_files'),
+                ignore_patterns=request.get('ignore') or [],
+                premium_features=bool(request.get('premium')),
+                baseline=baseline,
+                fail_fast=bool(request.get('fail_fast')),
+                detectors=request.get('detectors'),
+                disabled_detectors=request.get('disabled_detectors'),
+                triage=not request.get('no_triage'),
+                file_timeout=request.get('file_timeout'),
+                chunk_threshold=request.get('chunk_threshold', DEFAULT_CHUNK_THRESHOLD),
+                file_index=self.file_index,
+                file_cache=self.file_cache
+            )
+        # 최근 사용 순서 유지 (오래된 분석기부터 제거)
+        self.analyzers[key] = analyzer
+        while len(self.analyzers) > MAX_ANALYZERS:
+            self.analyzers.pop(next(iter(self.analyzers)))
+
+        return analyzer
+
+    def _load_baseline(self, request: Dict[str, Any], project_path: Path) -> Optional[set]:
+        """기준선 로드 (파일 mtime으로 캐시)"""
+        if request.get('no_baseline'):
+            return None
+
+        baseline_file = Path(request['baseline']) if request.get('baseline') else project_path / DEFAULT_BASELINE_FILE
+        try:
+            mtime_ns = os.stat(baseline_file).st_mtime_ns
+        except OSError:
+            if request.get('baseline'):
+                raise FileNotFoundError(f"기준선 파일을 찾을 수 없습니다: {baseline_file}")
+            return None
+
+        cached = self.baselines.get(str(baseline_file))
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, load_baseline(baseline_file))
+            self.baselines[str(baseline_file)] = cached
+        return cached[1]
+
+    def _query(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """저장소 조회 요청 처리"""
+        with ResultStore() as store:
+            run_id = request.get('run') or store.latest_run_id()
+            if run_id is None or store.get_run(run_id) is None:
+                raise ValueError(f"실행 기록을 찾을 수 없습니다: {run_id}")
+            if request.get('literal') is not None:
+                occurrences = store.query_literal(
+                    run_id, request['literal'], path=request.get('path'), limit=request.get('limit')
+                )
+                return {'run_id': run_id, 'occurrences': occurrences}
+            issues = store.query_issues(
+                run_id,
+                issue_type=request.get('type'),
+                path=request.get('path'),
+                severity=request.get('severity'),
+                limit=request.get('limit')
+            )
+        return {'run_id': run_id, 'issues': issues}
+
+
+class DaemonClient:
+    """실행 중인 데몬에 요청을 보내는 클라이언트"""
+
+    def __init__(self, sock: socket.socket, token: str = ''):
+        self.sock = sock
+        self.token = token
+        self.stream = sock.makefile('rwb')
+
+    @classmethod
+    def connect(cls, timeout: float = 0.2) -> Optional['DaemonClient']:
+        """데몬에 접속 (실행 중이 아니면 None)"""
+        try:
+            with open(DAEMON_INFO_FILE) as f:
+                address = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            if 'socket' in address:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.settimeout(timeout)
+                sock.connect(address['socket'])
+            else:
+                sock = socket.create_connection((address['host'], address['port']), timeout=timeout)
+        except (OSError, KeyError, AttributeError):
+            return None
+
+        # 분석 시간은 제한하지 않음
+        sock.settimeout(None)
+        return cls(sock, address.get('token', ''))
+
+    def request(self, command: str, **params) -> Any:
+        """요청 전송 후 응답 결과 반환 (실패 응답은 RuntimeError)"""
+        payload = dict(params, command=command, token=self.token)
+        self.stream.write(json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8') + b'\n')
+        self.stream.flush()
+
+        line = self.stream.readline()
+        if not line:
+            raise ConnectionError("데몬 연결이 끊어졌습니다.")
+
+        response = json.loads(line)
+        if not response.get('ok'):
+            raise RuntimeError(response.get('error', '알 수 없는 오류'))
+        return response['result']
+
+    def close(self):
+        """연결 종료"""
+        self.stream.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class RemoteAnalyzer:
+    """데몬의 파일 색인과 파일 캐시를 쓰는 분석기 대리자 (ProjectDiagnostic용)
+
+    project_files와 analyze만 데몬에 요청하므로 진단의 하위 프로세스 검사는
+    호출한 프로세스에서 실행된다. options는 analyze 요청과 같은 분석기 옵션이다.
+    """
+
+    def __init__(self, client: DaemonClient, **options):
+        self.client = client
+        self.options = options
+
+    def project_files(self, project_path: Path) -> List[Path]:
+        result = self.client.request('files', path=str(project_path), **self.options)
+        return [Path(path) for path in result['files']]
+
+    def analyze(self, project_path: Path) -> Dict[str, Any]:
+        return self.client.request('analyze', path=str(project_path), **self.options)
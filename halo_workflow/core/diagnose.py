@@ -0,0 +1,322 @@
+"""
+프로젝트 진단 (diagnose 명령)
+
+단계가 높을수록 앞 단계의 검사를 모두 포함한다.
+  quick:    필수 파일, package.json, node_modules, TypeScript 설치 여부 (하위 프로세스 없음)
+  standard: + tsc 타입 검사, npm run build (입력 지문이 같으면 이전 결과 재사용)
+  complete: + 프로젝트 구조, import 순환 참조, analyze 결과 요약
+
+파일 목록은 분석기의 project_files를 사용한다. 데몬이 실행 중이면 RemoteAnalyzer로
+파일 목록과 분석만 데몬에 요청해 analyze와 같은 파일 색인과 파일 단위 캐시를 공유하고,
+외부 명령(tsc, npm run build)은 항상 진단을 요청한 프로세스에서 실행한다.
+"""
+
+import json
+import platform
+import subprocess
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+from .analyzer import WorkflowAnalyzer
+from .check_cache import (
+    CheckCache, CACHE_DIR_NAME, tree_fingerprint, tsc_command,
+    TSC_INPUTS, TSC_SUFFIXES, BUILD_INPUTS, BUILD_SUFFIXES
+)
+from .snapshot import ProjectSnapshot
+from ..analyzers.module_graph import ModuleGraph
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+LEVELS = ('quick', 'standard', 'complete')
+
+# 검사 결과 상태
+OK, WARNING, FAIL, SKIP = 'ok', 'warning', 'fail', 'skip'
+
+# 기본 필수 파일과 필수 의존성 (Vite + React 프론트엔드, Express 서버)
+# 구조가 다른 프로젝트도 진단할 수 있도록 기본 목록에서 빠진 항목은 경고로, 직접 지정한 목록에서
+# 빠진 항목은 실패로 보고한다.
+REQUIRED_FILES = ('package.json', 'tsconfig.json', 'src/main.tsx', 'src/App.tsx', 'server/index.js')
+REQUIRED_DEPENDENCIES = ('react', 'react-dom')
+
+# 하위 프로세스 시간 제한 (초)
+TSC_TIMEOUT = 120
+BUILD_TIMEOUT = 180
+
+# 검사별로 표시할 최대 상세 항목 수
+MAX_DETAILS = 20
+
+
+class ProjectDiagnostic:
+    """프로젝트 진단 실행기
+
+    analyzer는 파일 목록(project_files)과 complete 단계의 분석(analyze)에 사용한다.
+    WorkflowAnalyzer 또는 같은 두 메서드를 가진 데몬 대리자(RemoteAnalyzer)다.
+    required_files, required_dependencies를 주면 기본 목록 대신 사용하고, 빠진 항목은 실패로 본다.
+    """
+
+    def __init__(self, analyzer: WorkflowAnalyzer, level: str = 'standard',
+                 required_files: Optional[List[str]] = None,
+                 required_dependencies: Optional[List[str]] = None):
+        if level not in LEVELS:
+            raise ValueError(f"알 수 없는 진단 단계: {level} (사용 가능: {', '.join(LEVELS)})")
+        self.analyzer = analyzer
+        self.level = level
+        self.required_files = REQUIRED_FILES if required_files is None else tuple(required_files)
+        self.required_dependencies = (
+            REQUIRED_DEPENDENCIES if required_dependencies is None else tuple(required_dependencies)
+        )
+        self.missing_files_status = WARNING if required_files is None else FAIL
+        self.missing_dependencies_status = WARNING if required_dependencies is None else FAIL
+        self.project_path: Optional[Path] = None
+        self.snapshot: Optional[ProjectSnapshot] = None
+        self.package: Optional[Dict[str, Any]] = None
+        self.cache: Optional[CheckCache] = None
+
+    def run(self, project_path: Path) -> Dict[str, Any]:
+        """진단 실행 후 검사 결과 반환"""
+        self.project_path = Path(project_path)
+        self.snapshot = ProjectSnapshot.from_paths(self.project_path, self.analyzer.project_files(self.project_path))
+        self.package = self._load_package_json()
+        self.cache = CheckCache(self.project_path)
+
+        results: Dict[str, Any] = {
+            'project_path': str(self.project_path),
+            'level': self.level,
+            'checks': [],
+            'summary': {}
+        }
+
+        checks: List[Tuple[str, str, Callable[[], Tuple[str, str, List[str]]]]] = [
+            ('required_files', '필수 파일', self._check_required_files),
+            ('package_json', 'package.json', self._check_package_json),
+            ('node_modules', '의존성 설치', self._check_node_modules),
+        ]
+        if self.level == 'quick':
+            checks.append(('typescript', 'TypeScript 설치', self._check_typescript_installed))
+        else:
+            checks.append(('typescript', 'TypeScript 타입 검사', self._check_typescript))
+            checks.append(('build', '빌드', self._check_build))
+        if self.level == 'complete':
+            checks.append(('structure', '프로젝트 구조', lambda: self._check_structure(results)))
+            checks.append(('import_cycles', 'import 순환 참조', self._check_import_cycles))
+            checks.append(('analysis', '코드 분석', lambda: self._check_analysis(results)))
+
+        for name, title, check in checks:
+            results['checks'].append(self._run_check(name, title, check))
+
+        statuses = [check['status'] for check in results['checks']]
+        results['summary'] = {
+            'total': len(statuses),
+            'passed': statuses.count(OK),
+            'warnings': statuses.count(WARNING),
+            'failed': statuses.count(FAIL),
+            'skipped': statuses.count(SKIP)
+        }
+        return results
+
+    def _run_check(self, name: str, title: str, check: Callable) -> Dict[str, Any]:
+        """검사 하나 실행 (예외는 실패로 기록)"""
+        start = time.perf_counter()
+        try:
+            status, message, details = check()
+        except Exception as e:
+            logger.debug(f"진단 검사 오류 ({name}): {e}")
+            status, message, details = FAIL, f"검사 중 오류: {e}", []
+
+        return {
+            'name': name,
+            'title': title,
+            'status': status,
+            'message': message,
+            'details': details[:MAX_DETAILS],
+            'more_details': max(0, len(details) - MAX_DETAILS),
+            'duration': round(time.perf_counter() - start, 3)
+        }
+
+    def _load_package_json(self) -> Optional[Dict[str, Any]]:
+        """package.json 로드 (없거나 읽을 수 없으면 None)"""
+        if not self.snapshot.exists('package.json'):
+            return None
+        try:
+            return json.loads(self.snapshot.read_text('package.json'))
+        except (OSError, ValueError):
+            return None
+
+    def _has_node_modules(self) -> bool:
+        # node_modules는 무시 패턴이라 스냅샷에 없으므로 직접 확인
+        return (self.project_path / 'node_modules').is_dir()
+
+    def _check_required_files(self) -> Tuple[str, str, List[str]]:
+        missing = [name for name in self.required_files if name not in self.snapshot.files]
+        if missing:
+            return self.missing_files_status, f"필수 파일 {len(missing)}개 없음", missing
+
+        # 필수 파일이 들어 있는 최상위 디렉토리별 파일 수
+        dirs = dict.fromkeys(name.split('/')[0] for name in self.required_files if '/' in name)
+        counts = [f"{name}/ 파일 {self.snapshot.dirs[name]['file_count']}개" for name in dirs if name in self.snapshot.dirs]
+        return OK, ', '.join(counts) or f"필수 파일 {len(self.required_files)}개 있음", []
+
+    def _check_package_json(self) -> Tuple[str, str, List[str]]:
+        if self.package is None:
+            if self.snapshot.exists('package.json'):
+                return FAIL, "package.json을 읽을 수 없습니다", []
+            return SKIP, "package.json 없음", []
+
+        problems = [f"'{section}' 항목 없음" for section in ('dependencies', 'scripts') if section not in self.package]
+        dependencies = self.package.get('dependencies') or {}
+        missing = [f"필수 의존성 없음: {name}" for name in self.required_dependencies if name not in dependencies]
+        if problems or missing:
+            status = FAIL if problems else self.missing_dependencies_status
+            return status, f"문제 {len(problems) + len(missing)}개", problems + missing
+        return OK, f"의존성 {len(dependencies)}개, 스크립트 {len(self.package['scripts'])}개", []
+
+    def _check_node_modules(self) -> Tuple[str, str, List[str]]:
+        if self.package is None:
+            return SKIP, "package.json 없음", []
+        if not self._has_node_modules():
+            return FAIL, "node_modules 없음 - 'npm install'을 실행하세요", []
+        return OK, "설치됨", []
+
+    def _check_typescript_installed(self) -> Tuple[str, str, List[str]]:
+        if not self.snapshot.exists('tsconfig.json'):
+            return SKIP, "tsconfig.json 없음", []
+        package_file = self.project_path / 'node_modules' / 'typescript' / 'package.json'
+        try:
+            with open(package_file, 'r', encoding='utf-8') as f:
+                version = json.load(f).get('version', '?')
+        except (OSError, ValueError):
+            return FAIL, "typescript 패키지가 설치되지 않았습니다", []
+        return OK, f"typescript {version}", []
+
+    def _check_typescript(self) -> Tuple[str, str, List[str]]:
+        if not self.snapshot.exists('tsconfig.json'):
+            return SKIP, "tsconfig.json 없음", []
+        if not self._has_node_modules():
+            return SKIP, "node_modules 없음 - 'npm install'을 실행하세요", []
+
+        result, cached = self._cached_command(
+            'tsc', TSC_INPUTS, TSC_SUFFIXES, tsc_command(self.project_path), TSC_TIMEOUT
+        )
+        suffix = " (캐시)" if cached else ""
+        if result['returncode'] == 0:
+            return OK, f"통과{suffix}", []
+
+        output = result['stdout'] + result['stderr']
+        errors = [line for line in output.splitlines() if 'error TS' in line]
+        if not errors:
+            return FAIL, f"tsc 실패 (종료 코드 {result['returncode']}){suffix}", [
+                line for line in output.splitlines() if line.strip()
+            ]
+        return FAIL, f"타입 오류 {len(errors)}개{suffix}", errors
+
+    def _check_build(self) -> Tuple[str, str, List[str]]:
+        if self.package is None or 'build' not in (self.package.get('scripts') or {}):
+            return SKIP, "build 스크립트 없음", []
+        if not self._has_node_modules():
+            return SKIP, "node_modules 없음 - 'npm install'을 실행하세요", []
+
+        # 소스 파일의 변경은 tsc 검사가 다시 확인하므로 빌드는 설정, 자원 파일이 바뀔 때만 다시 실행
+        suffixes = BUILD_SUFFIXES if self.snapshot.exists('tsconfig.json') else TSC_SUFFIXES + BUILD_SUFFIXES
+        result, cached = self._cached_command(
+            'build', BUILD_INPUTS, suffixes, ['npm', 'run', 'build'], BUILD_TIMEOUT
+        )
+        suffix = " (캐시)" if cached else ""
+        if result['returncode'] == 0:
+            return OK, f"성공{suffix}", []
+
+        output = result['stdout'] + result['stderr']
+        lines = [line for line in output.splitlines() if line.strip()]
+        return FAIL, f"빌드 실패 (종료 코드 {result['returncode']}){suffix}", lines[-MAX_DETAILS:]
+
+    def _cached_command(self, name: str, inputs, suffixes, command: List[str],
+                        timeout: int) -> Tuple[Dict[str, Any], bool]:
+        """입력 지문이 같으면 저장된 결과를, 아니면 실행 후 저장한 결과 반환"""
+        key = tree_fingerprint(self.project_path, inputs, (
+            (info.path, info.size, info.mtime) for info in self.snapshot.iter_files(suffixes=suffixes)
+        ))
+        result = self.cache.get(name, key)
+        if result is not None:
+            return result, True
+
+        logger.info(f"실행: {' '.join(command)}")
+        try:
+            completed = subprocess.run(
+                command,
+                cwd=self.project_path,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                shell=platform.system() == 'Windows'
+            )
+        except subprocess.TimeoutExpired:
+            # 시간 초과는 캐시하지 않음 (다음 실행에서 다시 시도)
+            return {'returncode': -1, 'stdout': '', 'stderr': f"시간 초과 ({timeout}초)"}, False
+
+        result = {'returncode': completed.returncode, 'stdout': completed.stdout, 'stderr': completed.stderr}
+        self.cache.put(name, key, result)
+        return result, False
+
+    def _check_structure(self, results: Dict[str, Any]) -> Tuple[str, str, List[str]]:
+        extensions = Counter(info.suffix or 'no_extension' for info in self.snapshot.files.values())
+
+        root = self.snapshot.dirs.get('', {'size': 0, 'file_count': 0})
+        results['structure'] = {
+            'total_files': root['file_count'],
+            'total_directories': max(0, len(self.snapshot.dirs) - 1),
+            'total_size': root['size'],
+            'file_types': dict(extensions.most_common()),
+            'largest_files': [{'path': path, 'size': size} for path, size in self.snapshot.largest_files()]
+        }
+        return OK, (
+            f"파일 {root['file_count']}개, 디렉토리 {results['structure']['total_directories']}개, "
+            f"{format_size(root['size'])}"
+        ), [f"{path} ({format_size(size)})" for path, size in self.snapshot.largest_files()]
+
+    def _check_import_cycles(self) -> Tuple[str, str, List[str]]:
+        graph = ModuleGraph(self.snapshot, self.project_path / CACHE_DIR_NAME / 'import_edges.json').build()
+        if not graph.modules:
+            return SKIP, "JS/TS 모듈 없음", []
+
+        cycles = graph.cycles()
+        details = []
+        for cycle in cycles:
+            detail = ' → '.join(cycle['path'] + cycle['path'][:1])
+            if len(cycle['modules']) > len(cycle['path']):
+                detail += f" (서로 의존하는 모듈 {len(cycle['modules'])}개: {', '.join(cycle['modules'])})"
+            details.append(detail)
+        details.extend(f"해석할 수 없는 import: {path} → '{specifier}'" for path, specifier in graph.unresolved)
+        message = f"모듈 {len(graph.modules)}개, import {graph.edge_count}개"
+        if cycles:
+            return WARNING, f"{message}, 순환 참조 {len(cycles)}개", details
+        if graph.unresolved:
+            return WARNING, f"{message}, 해석할 수 없는 import {len(graph.unresolved)}개", details
+        return OK, message, []
+
+    def _check_analysis(self, results: Dict[str, Any]) -> Tuple[str, str, List[str]]:
+        analysis = self.analyzer.analyze(self.project_path)
+        summary = analysis['summary']
+        results['analysis'] = summary
+
+        details = [
+            f"{entry.get('file') or ', '.join(entry.get('files', []))}"
+            f"{':' + str(entry['line']) if entry.get('line') else ''} {entry['message']}"
+            for entry in analysis['errors'] + analysis['warnings']
+        ]
+        message = f"파일 {summary['total_files']}개, 오류 {summary['error_count']}개, 경고 {summary['warning_count']}개"
+        if summary['error_count']:
+            return FAIL, message, details
+        if summary['warning_count']:
+            return WARNING, message, details
+        return OK, message, []
+
+
+def format_size(size: float) -> str:
+    """사람이 읽기 쉬운 파일 크기"""
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024.0:
+            return f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} TB"
@@ -0,0 +1,115 @@
+"""
+파일 목록 및 파일 단위 분석 결과 캐시
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+
+class FileIndex:
+    """프로젝트 파일 목록 캐시
+
+    탐색한 디렉토리들의 mtime을 함께 저장해 두고, 모두 그대로이면
+    다시 탐색하지 않고 저장된 목록(탐색 순서 그대로)을 반환한다.
+    디렉토리 mtime은 항목이 추가/삭제/이름 변경될 때 바뀐다.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Any, Tuple[Dict[str, int], List[Path]]] = {}
+
+    def get(self, key: Any) -> Optional[List[Path]]:
+        """유효한 캐시 목록 반환 (변경되었으면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        dir_mtimes, files = entry
+        for directory, mtime_ns in dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    break
+            except OSError:
+                break
+        else:
+            return list(files)
+
+        del self._entries[key]
+        return None
+
+    def put(self, key: Any, files: List[Path], dir_mtimes: Dict[str, int]):
+        """목록 저장"""
+        self._entries[key] = (dir_mtimes, list(files))
+
+    def invalidate(self, paths: Optional[Iterable[str]] = None):
+        """캐시 무효화 (paths를 지정하면 해당 경로를 포함하는 프로젝트만)"""
+        if paths is None:
+            self._entries.clear()
+            return
+
+        paths = [str(Path(p).resolve()) for p in paths]
+        for key in list(self._entries):
+            dir_mtimes = self._entries[key][0]
+            if any(_is_related(path, directory) for path in paths for directory in dir_mtimes):
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class FileCache:
+    """파일 단위 분석 레코드 캐시
+
+    경로별로 (mtime, 크기, 분석 설정 키)가 모두 같을 때만 재사용한다.
+    반환된 레코드는 캐시와 공유되므로 수정하지 않는다.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, int, str, Dict[str, Any]]] = {}
+
+    def get(self, file_path: Path, config_key: str) -> Optional[Dict[str, Any]]:
+        """유효한 레코드 반환"""
+        key = str(file_path)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        try:
+            stat = os.stat(key)
+        except OSError:
+            del self._entries[key]
+            return None
+
+        mtime_ns, size, cached_config, record = entry
+        if stat.st_mtime_ns != mtime_ns or stat.st_size != size or cached_config != config_key:
+            del self._entries[key]
+            return None
+
+        return record
+
+    def put(self, file_path: Path, config_key: str, record: Dict[str, Any], stat: os.stat_result):
+        """레코드 저장 (stat은 분석 전에 얻은 값 - 분석 중 변경되면 다음 조회에서 무효화)"""
+        self._entries[str(file_path)] = (stat.st_mtime_ns, stat.st_size, config_key, record)
+
+    def invalidate(self, paths: Optional[Iterable[str]] = None) -> int:
+        """캐시 무효화 (paths: 파일 또는 디렉토리), 제거된 항목 수 반환"""
+        if paths is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+        paths = [str(Path(p).resolve()) for p in paths]
+        removed = [key for key in self._entries if any(_is_related(path, key) for path in paths)]
+        for key in removed:
+            del self._entries[key]
+        return len(removed)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _is_related(path: str, other: str) -> bool:
+    """두 경로가 같거나 한쪽이 다른 쪽의 하위 경로인지 확인"""
+    if path == other:
+        return True
+    return other.startswith(path.rstrip(os.sep) + os.sep) or path.startswith(other.rstrip(os.sep) + os.sep)
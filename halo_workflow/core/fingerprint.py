@@ -0,0 +1,40 @@
+"""
+문제 지문(fingerprint) 생성
+"""
+
+import hashlib
+from collections import defaultdict
+from typing import Any
+
+
+def normalize_line(text: str) -> str:
+    """공백을 정규화한 라인 내용"""
+    return ' '.join(text.split())
+
+
+def compute_fingerprint(*parts: Any) -> str:
+    """구성 요소들의 내용 해시 (16자리 hex)"""
+    digest = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        digest.update(str(part).encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class FingerprintBuilder:
+    """같은 범위 안에서 지문 생성
+
+    라인 번호 대신 규칙, 파일, 라인 내용으로 지문을 만들기 때문에
+    관계없는 수정으로 라인이 밀려도 지문이 유지된다. 같은 내용이
+    반복되는 경우에는 등장 순번을 섞어 서로 구분한다.
+    """
+
+    def __init__(self):
+        self._seen = defaultdict(int)
+
+    def build(self, *parts: Any) -> str:
+        """지문 생성"""
+        base = compute_fingerprint(*parts)
+        ordinal = self._seen[base]
+        self._seen[base] += 1
+        return base if ordinal == 0 else compute_fingerprint(base, ordinal)
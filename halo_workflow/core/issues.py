@@ -0,0 +1,49 @@
+"""
+문제(issue) 레코드 타입
+"""
+
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Any, Optional
+
+# 결과 dict에서 Issue 필드로 옮기는 키 (나머지는 data에 보존)
+_ISSUE_FIELDS = ('type', 'message', 'file', 'line', 'files', 'fingerprint')
+
+
+@dataclass
+class Issue:
+    """분석에서 발견된 문제 하나"""
+
+    type: str
+    severity: str
+    message: str
+    file: Optional[str] = None
+    line: Optional[int] = None
+    files: List[str] = field(default_factory=list)
+    fingerprint: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_entry(cls, entry: Dict[str, Any], severity: str) -> 'Issue':
+        """결과 dict의 errors/warnings 항목에서 생성"""
+        return cls(
+            type=entry.get('type', 'unknown'),
+            severity=entry.get('severity', severity),
+            message=entry.get('message', ''),
+            file=entry.get('file'),
+            line=entry.get('line'),
+            files=list(entry.get('files', [])),
+            fingerprint=entry.get('fingerprint'),
+            data={k: v for k, v in entry.items() if k not in _ISSUE_FIELDS and k != 'severity'}
+        )
+
+    @property
+    def location(self) -> str:
+        """표시용 위치 (file:line 또는 파일 목록)"""
+        location = self.file or ', '.join(self.files)
+        if self.line:
+            location += f":{self.line}"
+        return location
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 dict"""
+        return asdict(self)
@@ -0,0 +1,142 @@
+"""
+문자열 리터럴 색인 - 정규화한 값에서 등장 위치로의 역색인
+
+같은 URL, 포트가 여러 파일에 반복되면 파일마다 따로 경고가 나오므로
+값별로 모아 얼마나 넓게 퍼져 있는지(파일 수) 순으로 보여 준다.
+탐지기가 문제에 'literal' 필드를 넣으면 색인 대상이 된다.
+
+비밀 값(api_key, password, secret)은 결과와 보고서에 가린 값으로만 나오고,
+저장소에는 값 대신 저장소마다 다른 임의의 키로 계산한 HMAC(literal_key)으로 기록된다.
+"""
+
+import hashlib
+import heapq
+import hmac
+import re
+from typing import Dict, List, Any, Iterable, Optional
+
+# 결과에 포함하는 상위 값 수와 값별 위치 수
+TOP_VALUES = 20
+MAX_LOCATIONS = 10
+
+# 값을 그대로 보여 주거나 저장하지 않는 규칙 유형
+SECRET_TYPES = ('api_key', 'password', 'secret')
+
+_URL = re.compile(r'^([a-z][a-z0-9+.-]*://)([^/?#]*)(.*)$', re.IGNORECASE | re.DOTALL)
+
+
+def normalize_literal(value: str) -> str:
+    """비교용 정규화 - 앞뒤 공백/따옴표 제거, URL은 scheme/호스트 소문자화 및 끝의 '/' 제거"""
+    value = value.strip().strip('"\'').strip()
+
+    match = _URL.match(value)
+    if match:
+        scheme, authority, rest = match.groups()
+        # 사용자 정보(user:pw@)는 대소문자를 구분하므로 호스트 부분만 소문자화
+        userinfo, at, host = authority.rpartition('@')
+        value = scheme.lower() + userinfo + at + host.lower() + rest.rstrip('/')
+
+    return value
+
+
+def mask_literal(value: str) -> str:
+    """비밀 값 표시용 - 앞 두 글자와 길이만 남김"""
+    return f"{value[:2]}****({len(value)})"
+
+
+def secret_key(value: str, salt: bytes) -> str:
+    """정규화한 비밀 값의 HMAC (salt: 저장소별 임의의 키 - 저장소만 읽어서는 값을 추측해 확인할 수 없음)"""
+    digest = hmac.new(salt, value.encode('utf-8', 'surrogatepass'), hashlib.sha256).hexdigest()
+    return 'hmac:' + digest[:32]
+
+
+def display_literal(summary: Dict[str, Any]) -> str:
+    """집계 dict의 표시용 값 (가리지 않고 저장된 비밀 값도 가림)"""
+    if not summary.get('masked') and summary.get('type') in SECRET_TYPES:
+        return mask_literal(summary['value'])
+    return summary['value']
+
+
+def literal_key(value: str, rule_type: str, salt: bytes) -> str:
+    """저장소에 기록하는 값 (비밀 유형은 HMAC)"""
+    value = normalize_literal(value)
+    return secret_key(value, salt) if rule_type in SECRET_TYPES else value
+
+
+class LiteralIndex:
+    """정규화한 리터럴 값 → 등장 위치 목록"""
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, literal: str, rule_type: str, file_key: str,
+            line: Optional[int] = None, column: Optional[int] = None, severity: str = 'warning'):
+        """등장 위치 추가"""
+        value = normalize_literal(literal)
+        if not value:
+            return
+
+        entry = self._entries.get(value)
+        if entry is None:
+            # 규칙 유형은 처음 발견된 것을 사용
+            entry = self._entries[value] = {
+                'type': rule_type, 'files': {}, 'occurrences': 0, 'severity': severity, 'secret': False
+            }
+        entry['occurrences'] += 1
+        entry['files'].setdefault(file_key, []).append((line, column))
+        if severity == 'error':
+            entry['severity'] = 'error'
+        if rule_type in SECRET_TYPES:
+            entry['secret'] = True
+
+    def add_file(self, file_key: str, issues: Iterable[Dict[str, Any]]):
+        """파일의 탐지 결과 중 'literal' 필드가 있는 것을 색인"""
+        for issue in issues:
+            literal = issue.get('literal')
+            if literal:
+                self.add(
+                    literal, issue.get('type', 'unknown'), file_key,
+                    issue.get('line'), issue.get('column'), issue.get('severity', 'warning')
+                )
+
+    def top(self, limit: int = TOP_VALUES, max_locations: int = MAX_LOCATIONS) -> List[Dict[str, Any]]:
+        """퍼진 정도(파일 수, 등장 횟수) 순 상위 값"""
+        ranked = heapq.nsmallest(limit, self._entries.items(), key=self._rank)
+        return [self._summarize(value, entry, max_locations) for value, entry in ranked]
+
+    def ranked(self, max_locations: int = MAX_LOCATIONS) -> List[Dict[str, Any]]:
+        """모든 값의 집계 (top과 같은 순서)
+
+        등장한 파일 전체 목록(files)과 지문용 식별자(key)를 포함한다. 비밀 값의 key는
+        값 대신 등장 파일 목록이라 지문에서 값을 추측해 확인할 수 없다.
+        """
+        return [
+            dict(self._summarize(value, entry, max_locations), files=list(entry['files']),
+                 key='\0'.join(sorted(entry['files'])) if entry['secret'] else value)
+            for value, entry in sorted(self._entries.items(), key=self._rank)
+        ]
+
+    @staticmethod
+    def _rank(item) -> tuple:
+        value, entry = item
+        return -len(entry['files']), -entry['occurrences'], value
+
+    def _summarize(self, value: str, entry: Dict[str, Any], max_locations: int) -> Dict[str, Any]:
+        """값 하나의 집계 dict (JSON 직렬화 가능, 비밀 값은 가림)"""
+        locations = [
+            {'file': file_key, 'line': line, 'column': column}
+            for file_key, positions in entry['files'].items()
+            for line, column in positions
+        ]
+        return {
+            'value': mask_literal(value) if entry['secret'] else value,
+            'masked': entry['secret'],
+            'type': entry['type'],
+            'severity': entry['severity'],
+            'occurrences': entry['occurrences'],
+            'file_count': len(entry['files']),
+            'locations': locations[:max_locations],
+        }
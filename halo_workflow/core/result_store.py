@@ -0,0 +1,457 @@
+"""
+분석 결과 저장소 (SQLite)
+"""
+
+import json
+import secrets
+import sqlite3
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from ..utils.logger import setup_logger
+from .literal_index import SECRET_TYPES, normalize_literal, literal_key, secret_key, mask_literal
+
+logger = setup_logger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_path TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    suggestions TEXT NOT NULL,
+    extra TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS issues (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    severity TEXT NOT NULL,
+    type TEXT NOT NULL,
+    file TEXT,
+    line INTEGER,
+    message TEXT NOT NULL,
+    fingerprint TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS files (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (run_id, path)
+);
+
+-- 여러 파일에 걸친 문제(중복 코드 등)의 파일별 색인
+CREATE TABLE IF NOT EXISTS issue_files (
+    issue_id INTEGER NOT NULL REFERENCES issues(id) ON DELETE CASCADE,
+    run_id INTEGER NOT NULL,
+    file TEXT NOT NULL
+);
+
+-- 저장소 설정 (비밀 값 HMAC 키 등)
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+-- 하드코딩 값 역색인 (정규화한 값 → 등장 위치, 비밀 값은 HMAC)
+CREATE TABLE IF NOT EXISTS literals (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    value TEXT NOT NULL,
+    type TEXT NOT NULL,
+    file TEXT NOT NULL,
+    line INTEGER,
+    col INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_literals_run_value ON literals(run_id, value);
+CREATE INDEX IF NOT EXISTS idx_issues_run_severity ON issues(run_id, severity, id);
+CREATE INDEX IF NOT EXISTS idx_issues_run_type ON issues(run_id, type, severity);
+CREATE INDEX IF NOT EXISTS idx_issues_run_file ON issues(run_id, file);
+CREATE INDEX IF NOT EXISTS idx_issue_files_run_file ON issue_files(run_id, file, issue_id);
+CREATE INDEX IF NOT EXISTS idx_runs_project ON runs(project_path, id);
+"""
+
+# 기존 데이터베이스를 현재 스키마로 올리기 위한 단계 (user_version 기준)
+MIGRATIONS = [
+    # 1: 문제 지문 컬럼 추가
+    "ALTER TABLE issues ADD COLUMN fingerprint TEXT",
+    # 2: 키 없이 해시한 비밀 값 삭제 (저장소별 HMAC으로 대체)
+    "DELETE FROM literals WHERE value LIKE 'blake2b:%'",
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+POST_MIGRATION_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_issues_run_fingerprint ON issues(run_id, fingerprint);
+"""
+
+SEVERITY_SECTIONS = {'error': 'errors', 'warning': 'warnings', 'info': 'info'}
+
+
+class ResultStore:
+    """분석 결과를 SQLite에 저장하고 조회"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else Path.home() / '.halo-workflow' / 'results.db'
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        self._init_schema()
+        self.secret_salt = self._load_secret_salt()
+
+    def _init_schema(self):
+        """스키마 생성 및 마이그레이션"""
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        is_new = not self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'runs'"
+        ).fetchone()
+
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            if not is_new:
+                for statement in MIGRATIONS[version:]:
+                    self.conn.execute(statement)
+            self.conn.executescript(POST_MIGRATION_SCHEMA)
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def _load_secret_salt(self) -> bytes:
+        """비밀 값 HMAC 키 (저장소를 처음 열 때 임의로 생성)"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO store_meta (key, value) VALUES ('secret_salt', ?)",
+                (secrets.token_hex(32),)
+            )
+        row = self.conn.execute("SELECT value FROM store_meta WHERE key = 'secret_salt'").fetchone()
+        return bytes.fromhex(row['value'])
+
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def save_run(self, results: Dict[str, Any]) -> int:
+        """분석 결과를 새 실행(run)으로 저장하고 run id 반환"""
+        extra = {
+            key: results.get(key, {})
+            for key in ('api_flows', 'dependencies', 'hardcoded_values')
+        }
+
+        with self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO runs (project_path, created_at, summary, suggestions, extra) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (
+                    results.get('project_path', ''),
+                    datetime.now().isoformat(),
+                    json.dumps(results.get('summary', {}), default=str),
+                    json.dumps(results.get('suggestions', []), default=str),
+                    json.dumps(extra, default=str),
+                )
+            )
+            run_id = cursor.lastrowid
+
+            rows = []
+            issue_files = []
+            for severity, section in SEVERITY_SECTIONS.items():
+                for issue in results.get(section, []):
+                    rows.append(self._issue_row(run_id, severity, issue))
+                    issue_files.append(issue.get('files') or [])
+            self.conn.executemany(
+                'INSERT INTO issues (run_id, severity, type, file, line, message, fingerprint, data) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+
+            # 여러 파일에 걸친 문제는 모든 파일로 조회되도록 파일별 행 추가
+            # (같은 트랜잭션에서 삽입 순서대로 id가 부여됨)
+            if any(issue_files):
+                issue_ids = [
+                    row['id'] for row in
+                    self.conn.execute('SELECT id FROM issues WHERE run_id = ? ORDER BY id', (run_id,))
+                ]
+                self.conn.executemany(
+                    'INSERT INTO issue_files (issue_id, run_id, file) VALUES (?, ?, ?)',
+                    (
+                        (issue_id, run_id, file_key)
+                        for issue_id, files in zip(issue_ids, issue_files)
+                        for file_key in dict.fromkeys(files)
+                    )
+                )
+
+            self.conn.executemany(
+                'INSERT INTO files (run_id, path, data) VALUES (?, ?, ?)',
+                (
+                    (run_id, path, json.dumps(self._file_data(file_results), default=str))
+                    for path, file_results in results.get('files', {}).items()
+                )
+            )
+
+            self.conn.executemany(
+                'INSERT INTO literals (run_id, value, type, file, line, col) VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    (run_id, literal_key(issue['literal'], issue.get('type', 'unknown'), self.secret_salt), issue.get('type', 'unknown'),
+                     path, issue.get('line'), issue.get('column'))
+                    for path, file_results in results.get('files', {}).items()
+                    for issue in file_results.get('issues', [])
+                    if issue.get('literal')
+                )
+            )
+
+        return run_id
+
+    def latest_run_id(self, project_path: Optional[str] = None) -> Optional[int]:
+        """가장 최근 실행 id (project_path를 지정하면 해당 프로젝트만)"""
+        if project_path is None:
+            row = self.conn.execute('SELECT MAX(id) AS id FROM runs').fetchone()
+        else:
+            row = self.conn.execute(
+                'SELECT MAX(id) AS id FROM runs WHERE project_path = ?', (project_path,)
+            ).fetchone()
+        return row['id'] if row else None
+
+    def previous_run_id(self, run_id: int) -> Optional[int]:
+        """같은 프로젝트의 직전 실행 id"""
+        row = self.conn.execute(
+            'SELECT id FROM runs WHERE id < ? AND project_path = '
+            '(SELECT project_path FROM runs WHERE id = ?) ORDER BY id DESC LIMIT 1',
+            (run_id, run_id)
+        ).fetchone()
+        return row['id'] if row else None
+
+    def list_runs(self, project_path: Optional[str] = None, limit: Optional[int] = None,
+                  until_run_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """실행 기록 조회 (오래된 순, until_run_id 이하만)"""
+        sql = 'SELECT id, project_path, created_at, summary FROM runs WHERE 1 = 1'
+        params: List[Any] = []
+        if project_path is not None:
+            sql += ' AND project_path = ?'
+            params.append(project_path)
+        if until_run_id is not None:
+            sql += ' AND id <= ?'
+            params.append(until_run_id)
+        sql += ' ORDER BY id DESC'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        runs = [
+            {
+                'id': row['id'],
+                'project_path': row['project_path'],
+                'created_at': row['created_at'],
+                'summary': json.loads(row['summary']),
+            }
+            for row in self.conn.execute(sql, params)
+        ]
+        runs.reverse()
+        return runs
+
+    def get_run(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """실행 메타데이터 조회"""
+        row = self.conn.execute('SELECT * FROM runs WHERE id = ?', (run_id,)).fetchone()
+        if not row:
+            return None
+
+        return {
+            'id': row['id'],
+            'project_path': row['project_path'],
+            'created_at': row['created_at'],
+            'summary': json.loads(row['summary']),
+            'suggestions': json.loads(row['suggestions']),
+            'extra': json.loads(row['extra']),
+        }
+
+    def query_issues(self, run_id: int, issue_type: Optional[str] = None,
+                     path: Optional[str] = None, severity: Optional[str] = None,
+                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """조건에 맞는 문제 조회 (path는 glob 패턴)"""
+        sql = 'SELECT severity, data FROM issues WHERE run_id = ?'
+        params: List[Any] = [run_id]
+
+        if issue_type:
+            sql += ' AND type = ?'
+            params.append(issue_type)
+        if severity:
+            sql += ' AND severity = ?'
+            params.append(severity)
+        if path:
+            sql += (' AND (file GLOB ? OR id IN '
+                    '(SELECT issue_id FROM issue_files WHERE run_id = ? AND file GLOB ?))')
+            params.extend([path, run_id, path])
+
+        sql += ' ORDER BY id'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        issues = []
+        for row in self.conn.execute(sql, params):
+            issue = json.loads(row['data'])
+            issue['severity'] = row['severity']
+            issues.append(issue)
+        return issues
+
+    def query_literal(self, run_id: int, value: str, path: Optional[str] = None,
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """하드코딩 값의 등장 위치 조회 (값은 정규화해서 비교, path는 glob 패턴)
+
+        비밀 값은 HMAC으로 저장되어 있으므로 정규화한 값과 그 HMAC을 함께 찾는다.
+        """
+        value = normalize_literal(value)
+        sql = 'SELECT type, file, line, col FROM literals WHERE run_id = ? AND value IN (?, ?)'
+        params: List[Any] = [run_id, value, secret_key(value, self.secret_salt)]
+
+        if path:
+            sql += ' AND file GLOB ?'
+            params.append(path)
+
+        sql += ' ORDER BY rowid'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        return [
+            {'file': row['file'], 'line': row['line'], 'column': row['col'], 'type': row['type']}
+            for row in self.conn.execute(sql, params)
+        ]
+
+    def load_results(self, run_id: int, limit: Optional[int] = None,
+                     include_files: bool = True) -> Optional[Dict[str, Any]]:
+        """저장된 실행을 결과 dict로 복원
+
+        limit을 지정하면 심각도별로 앞의 limit개 문제만 읽는다.
+        """
+        run = self.get_run(run_id)
+        if not run:
+            return None
+
+        results = {
+            'project_path': run['project_path'],
+            'run_id': run['id'],
+            'created_at': run['created_at'],
+            'summary': run['summary'],
+            'errors': [],
+            'warnings': [],
+            'info': [],
+            'files': {},
+            'dependencies': run['extra'].get('dependencies', {}),
+            'api_flows': run['extra'].get('api_flows', {}),
+            'hardcoded_values': run['extra'].get('hardcoded_values', []),
+            'suggestions': run['suggestions'],
+        }
+
+        for severity, section in SEVERITY_SECTIONS.items():
+            results[section] = [
+                json.loads(row['data'])
+                for row in self._select_issue_data(run_id, severity, limit)
+            ]
+
+        if include_files:
+            for row in self.conn.execute(
+                'SELECT path, data FROM files WHERE run_id = ? ORDER BY rowid', (run_id,)
+            ):
+                results['files'][row['path']] = json.loads(row['data'])
+
+        return results
+
+    def diff_runs(self, base_run_id: int, head_run_id: int) -> Dict[str, List[Dict[str, Any]]]:
+        """두 실행의 문제를 지문 집합 연산으로 비교
+
+        new: head에만 있는 문제, fixed: base에만 있는 문제, unchanged: 양쪽 모두
+        """
+        base = self._fingerprint_rows(base_run_id)
+        head = self._fingerprint_rows(head_run_id)
+
+        base_keys = base.keys()
+        head_keys = head.keys()
+
+        def decode(rows: Dict[str, tuple], keys) -> List[Dict[str, Any]]:
+            issues = []
+            for key in keys:
+                severity, data = rows[key]
+                issue = json.loads(data)
+                issue['severity'] = severity
+                issues.append(issue)
+            return issues
+
+        # 저장 순서를 유지하기 위해 dict 순회 순서대로 필터링
+        return {
+            'new': decode(head, [k for k in head_keys if k not in base]),
+            'fixed': decode(base, [k for k in base_keys if k not in head]),
+            'unchanged': decode(head, [k for k in head_keys if k in base]),
+        }
+
+    def run_fingerprints(self, run_id: int) -> List[str]:
+        """실행에 포함된 문제 지문 목록"""
+        return [
+            row['fingerprint']
+            for row in self.conn.execute(
+                'SELECT fingerprint FROM issues WHERE run_id = ? AND fingerprint IS NOT NULL',
+                (run_id,)
+            )
+        ]
+
+    def _fingerprint_rows(self, run_id: int) -> Dict[str, tuple]:
+        """실행의 지문별 (심각도, 데이터)"""
+        return {
+            row['fingerprint']: (row['severity'], row['data'])
+            for row in self.conn.execute(
+                'SELECT fingerprint, severity, data FROM issues '
+                'WHERE run_id = ? AND fingerprint IS NOT NULL ORDER BY id',
+                (run_id,)
+            )
+        }
+
+    def _select_issue_data(self, run_id: int, severity: str, limit: Optional[int]):
+        """심각도별 문제 데이터 조회"""
+        sql = 'SELECT data FROM issues WHERE run_id = ? AND severity = ? ORDER BY id'
+        params: List[Any] = [run_id, severity]
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        return self.conn.execute(sql, params)
+
+    def _file_data(self, file_results: Dict[str, Any]) -> Dict[str, Any]:
+        """files 테이블에 저장할 파일 결과 (비밀 유형 문제의 값은 가림)"""
+        issues = file_results.get('issues', [])
+        if not any(issue.get('type') in SECRET_TYPES for issue in issues):
+            return file_results
+
+        masked = []
+        for issue in issues:
+            if issue.get('type') in SECRET_TYPES:
+                issue = dict(issue)
+                issue.pop('literal', None)
+                if issue.get('value'):
+                    issue['value'] = mask_literal(normalize_literal(issue['value']))
+            masked.append(issue)
+        return dict(file_results, issues=masked)
+
+    def _issue_row(self, run_id: int, severity: str, issue: Dict[str, Any]) -> tuple:
+        """issues 테이블 행 생성"""
+        # 여러 파일에 걸친 문제(중복 코드 등)는 첫 번째 파일로 표시 (파일별 색인은 issue_files)
+        file_key = issue.get('file')
+        if file_key is None and issue.get('files'):
+            file_key = issue['files'][0]
+
+        return (
+            run_id,
+            severity,
+            issue.get('type', 'unknown'),
+            file_key,
+            issue.get('line'),
+            issue.get('message', ''),
+            issue.get('fingerprint'),
+            json.dumps(issue, ensure_ascii=False, default=str),
+        )
@@ -0,0 +1,67 @@
+"""
+여러 머신에 분석을 나누기 위한 샤딩 및 부분 결과 입출력
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+from .fingerprint import compute_fingerprint
+
+PARTIAL_FORMAT = 'halo-workflow-partial'
+PARTIAL_VERSION = 1
+
+
+def parse_shard_spec(spec: str) -> Tuple[int, int]:
+    """'i/N' 형식의 샤드 지정 파싱 (0 <= i < N)"""
+    try:
+        index_str, count_str = spec.split('/')
+        index, count = int(index_str), int(count_str)
+    except ValueError:
+        raise ValueError(f"샤드 형식은 'i/N' 이어야 합니다: {spec}")
+
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"샤드 번호는 0 이상 {count} 미만이어야 합니다: {spec}")
+
+    return index, count
+
+
+def shard_for_path(path_key: str, shard_count: int) -> int:
+    """프로젝트 상대 경로(posix)의 안정적인 해시로 샤드 번호 결정"""
+    return int(compute_fingerprint(path_key), 16) % shard_count
+
+
+def write_partial(partial: Dict[str, Any], output_file: Path):
+    """부분 결과 저장"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(partial, f, ensure_ascii=False, default=str)
+
+
+def load_partials(paths: List[Path]) -> List[Dict[str, Any]]:
+    """부분 결과 로드 및 검증 (같은 샤드 수와 파일 수, 누락/중복 없음)
+
+    머신마다 체크아웃 경로가 다를 수 있으므로 project_path는 비교하지 않는다.
+    """
+    partials = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            partial = json.load(f)
+        if partial.get('format') != PARTIAL_FORMAT or partial.get('version') != PARTIAL_VERSION:
+            raise ValueError(f"부분 결과 파일이 아닙니다: {path}")
+        partials.append(partial)
+
+    if not partials:
+        raise ValueError("병합할 부분 결과가 없습니다.")
+
+    shard_counts = {partial['shard'][1] for partial in partials}
+    total_files = {partial['total_files'] for partial in partials}
+    if len(shard_counts) > 1 or len(total_files) > 1:
+        raise ValueError("서로 다른 분석(샤드 수, 파일 목록)의 부분 결과는 병합할 수 없습니다.")
+
+    shard_count = shard_counts.pop()
+    indices = sorted(partial['shard'][0] for partial in partials)
+    if indices != list(range(shard_count)):
+        missing = sorted(set(range(shard_count)) - set(indices))
+        raise ValueError(f"샤드가 누락되었거나 중복되었습니다 (누락: {missing}, 입력: {indices})")
+
+    return partials
@@ -0,0 +1,109 @@
+"""
+프로젝트 파일 스냅샷
+
+분석기의 파일 목록(WorkflowAnalyzer.project_files - 데몬에서는 FileIndex로 캐시)을
+받아 파일마다 한 번씩 stat하고, 디렉토리별 하위 트리 합계와 가장 큰 파일을 계산한다.
+진단 단계들은 디스크를 다시 탐색하지 않고 이 스냅샷만 조회한다.
+"""
+
+import heapq
+import os
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+FileInfo = namedtuple('FileInfo', ['path', 'name', 'suffix', 'size', 'mtime'])
+
+# 유지하는 가장 큰 파일 수
+TOP_FILES = 10
+
+
+class ProjectSnapshot:
+    """프로젝트 파일 스냅샷
+
+    경로는 프로젝트 기준 상대 POSIX 문자열('' = 루트)이다. 디렉토리는 파일이 있는
+    디렉토리와 그 상위 디렉토리만 포함하며, 각각 하위 트리 전체의 바이트 수와
+    파일 수를 가진다.
+    """
+
+    def __init__(self, root, top_files: int = TOP_FILES):
+        self.root = Path(root)
+        self.top_files = top_files
+        self.files: Dict[str, FileInfo] = {}
+        self.dirs: Dict[str, Dict] = {}
+        self.largest: List[Tuple[int, str]] = []
+
+    @classmethod
+    def from_paths(cls, root, paths: Iterable[Path], top_files: int = TOP_FILES) -> 'ProjectSnapshot':
+        """파일 경로 목록으로 스냅샷 생성 (stat할 수 없는 파일은 제외)"""
+        snapshot = cls(root, top_files)
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            rel_path = Path(path).relative_to(snapshot.root).as_posix()
+            snapshot._add_file(rel_path, stat.st_size, stat.st_mtime)
+        snapshot._aggregate()
+        return snapshot
+
+    def _add_file(self, rel_path: str, size: int, mtime: float):
+        """파일 추가 (상위 디렉토리가 없으면 함께 생성)"""
+        rel_dir, _, name = rel_path.rpartition('/')
+        self.files[rel_path] = FileInfo(rel_path, name, os.path.splitext(name)[1].lower(), size, mtime)
+
+        directory = self._directory(rel_dir)
+        directory['files'].append(name)
+        directory['size'] += size
+        directory['file_count'] += 1
+
+        if len(self.largest) < self.top_files:
+            heapq.heappush(self.largest, (size, rel_path))
+        elif size > self.largest[0][0]:
+            heapq.heapreplace(self.largest, (size, rel_path))
+
+    def _directory(self, rel_dir: str) -> Dict:
+        """디렉토리 항목 (없으면 상위까지 생성)"""
+        directory = self.dirs.get(rel_dir)
+        if directory is None:
+            directory = self.dirs[rel_dir] = {'dirs': [], 'files': [], 'size': 0, 'file_count': 0}
+            if rel_dir:
+                parent, _, name = rel_dir.rpartition('/')
+                self._directory(parent)['dirs'].append(name)
+        return directory
+
+    def _aggregate(self):
+        """이름순 정렬 후 하위 디렉토리 합계를 상위로 누적 (깊은 디렉토리부터)"""
+        for directory in self.dirs.values():
+            directory['dirs'].sort()
+            directory['files'].sort()
+
+        for rel_dir in sorted(self.dirs, key=lambda path: path.count('/') if path else -1, reverse=True):
+            if rel_dir:
+                parent = self.dirs[rel_dir.rpartition('/')[0]]
+                parent['size'] += self.dirs[rel_dir]['size']
+                parent['file_count'] += self.dirs[rel_dir]['file_count']
+
+    def largest_files(self) -> List[Tuple[str, int]]:
+        """비어 있지 않은 가장 큰 파일들의 (경로, 크기), 큰 순서"""
+        return [(path, size) for size, path in sorted(self.largest, reverse=True) if size > 0]
+
+    def iter_files(self, under: str = '', suffixes: Optional[Iterable[str]] = None) -> Iterator[FileInfo]:
+        """디렉토리 아래 파일 (suffixes: 소문자 확장자 필터)"""
+        prefix = f"{under}/" if under else ''
+        for info in self.files.values():
+            if info.path.startswith(prefix) and (suffixes is None or info.suffix in suffixes):
+                yield info
+
+    def listdir(self, rel_dir: str = '') -> Tuple[List[str], List[str]]:
+        """디렉토리의 (하위 디렉토리 이름, 파일 이름)"""
+        entry = self.dirs.get(rel_dir)
+        return (entry['dirs'], entry['files']) if entry else ([], [])
+
+    def exists(self, rel_path: str) -> bool:
+        """스냅샷에 있는 파일 또는 디렉토리인지 확인"""
+        return rel_path in self.files or rel_path in self.dirs
+
+    def read_text(self, rel_path: str) -> str:
+        """파일 내용을 텍스트로 읽기"""
+        return (self.root / rel_path).read_text(encoding='utf-8')
@@ -0,0 +1,112 @@
+"""
+파일 분류(triage) - 탐지기 실행 전에 잡음이 되는 파일을 걸러냄
+
+결정:
+  full  모든 탐지기 실행
+  fast  빠른 규칙만 실행 (생성 코드, 압축된 번들 - 비밀 값 유출만 확인)
+  skip  탐지기를 실행하지 않음 (잠금 파일, 외부 코드, 바이너리/인코딩된 데이터)
+"""
+
+import codecs
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Tuple
+
+FULL = 'full'
+FAST = 'fast'
+SKIP = 'skip'
+
+# 분류에 사용하는 파일 앞부분 크기
+HEADER_SIZE = 8192
+
+# 이보다 긴 줄이 있으면 압축(minified)된 파일로 간주
+MAX_LINE_LENGTH = 1000
+
+# 바이트 엔트로피(bits/byte)가 이보다 높으면 인코딩/압축된 데이터로 간주
+# (일반 소스 코드 4~5.5, base64 약 6) - UTF-8 텍스트는 한글 등 비 ASCII 문자만으로도
+# 이 값을 넘으므로, 유효한 UTF-8이면 base64 형태의 긴 문자열만 모아서 측정한다
+MAX_ENTROPY = 5.8
+
+# 인코딩된 데이터로 보는 base64 형태 문자열의 최소 길이와 앞부분에서 차지하는 최소 비율
+_ENCODED_RUN = re.compile(rb'[A-Za-z0-9+/=_-]{64,}')
+MIN_ENCODED_RATIO = 0.5
+
+LOCKFILE_NAMES = {
+    'package-lock.json', 'npm-shrinkwrap.json', 'yarn.lock', 'pnpm-lock.yaml',
+    'composer.lock', 'Gemfile.lock', 'Cargo.lock', 'poetry.lock', 'Pipfile.lock',
+    'go.sum', 'packages.lock.json',
+}
+
+MINIFIED_SUFFIXES = ('.min.js', '.min.css', '.bundle.js', '.min.mjs')
+
+VENDORED_DIRS = {'vendor', 'vendors', 'third_party', 'third-party', 'bower_components', 'jspm_packages'}
+
+# 앞부분에 있으면 생성된 코드로 간주하는 표시 (소문자 비교)
+GENERATED_MARKERS = (
+    b'@generated', b'do not edit', b'code generated by', b'auto-generated',
+    b'autogenerated', b'this file was automatically generated', b'generated by the protocol buffer compiler',
+)
+
+
+def triage_file(file_path: Path, relative_path: Path) -> Tuple[str, str]:
+    """파일 분류 결과 (결정, 사유) 반환
+
+    이름/경로로 판단할 수 있으면 파일을 읽지 않고, 그 외에는 앞부분만 읽는다.
+    """
+    name = file_path.name
+
+    if name in LOCKFILE_NAMES:
+        return SKIP, 'lockfile'
+    if any(part in VENDORED_DIRS for part in relative_path.parts[:-1]):
+        return SKIP, 'vendored'
+    if name.lower().endswith(MINIFIED_SUFFIXES):
+        return FAST, 'minified'
+
+    with open(file_path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+
+    return classify_header(header)
+
+
+def classify_header(header: bytes) -> Tuple[str, str]:
+    """파일 앞부분 바이트로 분류"""
+    if b'\0' in header:
+        return SKIP, 'binary'
+
+    lowered = header[:1024].lower()
+    if any(marker in lowered for marker in GENERATED_MARKERS):
+        return FAST, 'generated'
+
+    lines = header.split(b'\n')
+    # 마지막 줄은 잘렸을 수 있으므로 앞부분 전체가 한 줄일 때만 포함
+    complete = lines[:-1] if len(lines) > 1 else lines
+    if max(len(line) for line in complete) > MAX_LINE_LENGTH:
+        return FAST, 'minified'
+
+    if len(header) >= 1024 and is_high_entropy(header):
+        return SKIP, 'high_entropy'
+
+    return FULL, ''
+
+
+def is_high_entropy(header: bytes) -> bool:
+    """인코딩/압축된 데이터인지 (UTF-8이 아니면 바이트 전체, UTF-8이면 base64 형태 문자열로 판단)"""
+    try:
+        # 앞부분 끝에서 잘린 문자는 오류로 보지 않음
+        codecs.getincrementaldecoder('utf-8')().decode(header, final=False)
+    except UnicodeDecodeError:
+        return byte_entropy(header) > MAX_ENTROPY
+
+    encoded = b''.join(_ENCODED_RUN.findall(header))
+    return len(encoded) >= len(header) * MIN_ENCODED_RATIO and byte_entropy(encoded) > MAX_ENTROPY
+
+
+def byte_entropy(data: bytes) -> float:
+    """바이트 단위 섀넌 엔트로피 (bits/byte)"""
+    if not data:
+        return 0.0
+
+    total = len(data)
+    return -sum(count / total * math.log2(count / total) for count in Counter(data).values())
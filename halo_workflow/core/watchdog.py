@@ -0,0 +1,135 @@
+"""
+파일 분석 감시 - 파일 하나의 분석 시간을 제한
+
+정규식은 실행 중에 중단할 수 없으므로 파일 분석을 작업 프로세스에서 실행하고,
+시간 제한을 넘기면 프로세스를 종료한 뒤 다음 파일에서 새 작업 프로세스를 시작한다.
+작업 프로세스의 로그는 파이프로 받아 부모 프로세스의 로거로 출력한다.
+작업 프로세스는 한 번 시작하면 시간 초과로 종료될 때까지 모든 파일에 재사용한다.
+"""
+
+import logging
+import multiprocessing
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from ..utils.logger import setup_logger, forward_logging, PACKAGE_LOGGER
+
+logger = setup_logger(__name__)
+
+# 작업 프로세스 시작(패키지 import, 탐지기 생성) 대기 시간
+STARTUP_TIMEOUT = 60.0
+
+
+class FileTimeout(Exception):
+    """파일 분석 시간 초과"""
+
+
+class FileWorker:
+    """파일 분석을 실행하는 작업 프로세스"""
+
+    def __init__(self, analyzer_config: Dict[str, Any], timeout: float):
+        self.analyzer_config = analyzer_config
+        self.timeout = timeout
+        self._process = None
+        self._conn = None
+
+    def analyze(self, file_path: Path, project_path: Path) -> Optional[Dict[str, Any]]:
+        """파일 분석 레코드 반환 (시간 초과 시 FileTimeout)"""
+        self._ensure_started()
+        self._conn.send((file_path, project_path))
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._conn.poll(remaining):
+                self._kill()
+                raise FileTimeout(f"파일 분석 시간 초과 ({self.timeout}초): {file_path}")
+
+            try:
+                kind, payload = self._conn.recv()
+            except (EOFError, OSError):
+                self._kill()
+                logger.error(f"작업 프로세스가 비정상 종료되었습니다: {file_path}", extra={'file': str(file_path)})
+                return None
+
+            if kind == 'log':
+                logging.getLogger(payload.name).handle(payload)
+            else:
+                return payload
+
+    def close(self):
+        """작업 프로세스 종료"""
+        if self._process is None:
+            return
+
+        try:
+            self._conn.send(None)
+        except OSError:
+            pass
+        self._process.join(timeout=1)
+        self._kill()
+
+    def _ensure_started(self):
+        """작업 프로세스가 없으면 시작 (준비될 때까지 대기)"""
+        if self._process is not None:
+            return
+
+        parent_conn, child_conn = multiprocessing.Pipe()
+        level = logging.getLogger(PACKAGE_LOGGER).getEffectiveLevel()
+        self._process = multiprocessing.Process(
+            target=_worker_main, args=(self.analyzer_config, child_conn, level), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+        try:
+            if not self._conn.poll(STARTUP_TIMEOUT):
+                raise EOFError
+            self._conn.recv()
+        except (EOFError, OSError):
+            self._kill()
+            raise RuntimeError("작업 프로세스를 시작하지 못했습니다.")
+
+    def _kill(self):
+        """작업 프로세스 강제 종료"""
+        if self._process is None:
+            return
+
+        if self._process.is_alive():
+            self._process.kill()
+        self._process.join()
+        self._conn.close()
+        self._process = None
+        self._conn = None
+
+
+class _PipeLogSink:
+    """QueueHandler 대신 로그 레코드를 파이프로 보내는 큐"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def put_nowait(self, record: logging.LogRecord):
+        self.conn.send(('log', record))
+
+
+def _worker_main(analyzer_config: Dict[str, Any], conn, log_level: int):
+    """작업 프로세스 본체 - 파일 경로를 받아 분석 레코드를 돌려줌"""
+    forward_logging(_PipeLogSink(conn), log_level)
+
+    from .analyzer import WorkflowAnalyzer
+    analyzer = WorkflowAnalyzer(**analyzer_config)
+    conn.send(('ready', None))
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+
+        file_path, project_path = request
+        conn.send(('result', analyzer._analyze_file(file_path, project_path)))
@@ -1,29 +1,162 @@
 """
 로깅 설정
+
+모든 로거는 QueueHandler로 레코드를 큐에 넣기만 하고, 포맷팅과 출력은
+백그라운드 QueueListener 스레드가 담당한다. 분석 루프에서는 출력 I/O가
+일어나지 않으며, 콘솔 로그는 보고서 출력(stdout)과 섞이지 않도록 stderr로 보낸다.
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
+PACKAGE_LOGGER = 'halo_workflow'
+
+# LogRecord 기본 속성 (JSON 로그에서 extra 필드를 구분하는 데 사용)
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+_log_queue: 'queue.Queue[logging.LogRecord]' = queue.Queue(-1)
+_listener: Optional[logging.handlers.QueueListener] = None
+_console_handler: Optional[logging.Handler] = None
+_file_handler: Optional[logging.Handler] = None
+_level = logging.INFO
+
+
+class JSONLineFormatter(logging.Formatter):
+    """JSON Lines 형식 포맷터 (extra 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+
+        # 파일 경로, 처리 시간 등 extra로 전달된 필드
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _ensure_listener():
+    """백그라운드 리스너 시작 (최초 1회)"""
+    global _listener, _console_handler
+
+    if _listener is not None:
+        return
+
+    _console_handler = logging.StreamHandler(sys.stderr)
+    _console_handler.setLevel(logging.INFO)
+    _console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+
+    _listener = logging.handlers.QueueListener(
+        _log_queue, _console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    logging.getLogger(PACKAGE_LOGGER).setLevel(_level)
 
 
 def setup_logger(name: str) -> logging.Logger:
     """로거 설정"""
+    _ensure_listener()
     logger = logging.getLogger(name)
-    
+
     if not logger.handlers:
-        # 콘솔 핸들러
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        
-        # 포맷터
-        formatter = logging.Formatter(
-            '%(levelname)s: %(message)s'
-        )
-        console_handler.setFormatter(formatter)
-        
-        # 로거에 핸들러 추가
-        logger.addHandler(console_handler)
-        logger.setLevel(logging.INFO)
-    
-    return logger
\ No newline at end of file
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+        logger.propagate = False
+
+        # 패키지 밖의 로거(예: __main__)는 레벨을 직접 지정
+        if name != PACKAGE_LOGGER and not name.startswith(PACKAGE_LOGGER + '.'):
+            logger.setLevel(_level)
+
+    return logger
+
+
+def configure_logging(verbosity: int = 0, log_file: Optional[str] = None):
+    """로그 레벨 및 JSON Lines 로그 파일 설정
+
+    verbosity: -1 이하 경고 이상만, 0 정보, 1 이상 디버그 (파일별 처리 시간 포함)
+    log_file: 지정하면 모든 디버그 레코드를 JSON Lines로 기록
+    """
+    global _level, _file_handler
+
+    _ensure_listener()
+
+    if verbosity < 0:
+        console_level = logging.WARNING
+    elif verbosity == 0:
+        console_level = logging.INFO
+    else:
+        console_level = logging.DEBUG
+    _console_handler.setLevel(console_level)
+
+    handlers = [_console_handler]
+    if log_file:
+        _file_handler = logging.FileHandler(Path(log_file), mode='a', encoding='utf-8')
+        _file_handler.setLevel(logging.DEBUG)
+        _file_handler.setFormatter(JSONLineFormatter())
+        handlers.append(_file_handler)
+
+    # 리스너 핸들러 교체 (실행 중인 스레드가 다음 레코드부터 사용)
+    _listener.handlers = tuple(handlers)
+
+    # 로거 레벨은 가장 상세한 핸들러에 맞춰, 필요 없는 레코드는 큐에 넣기 전에 거른다
+    _level = min(handler.level for handler in handlers)
+    logging.getLogger(PACKAGE_LOGGER).setLevel(_level)
+    for logger in logging.Logger.manager.loggerDict.values():
+        if isinstance(logger, logging.Logger) and logger.level != logging.NOTSET \
+                and any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers):
+            logger.setLevel(_level)
+
+
+def forward_logging(sink, level: int):
+    """하위 프로세스에서 호출 - 레코드를 sink.put_nowait(record)로 넘겨 부모 프로세스가 출력하게 함"""
+    global _log_queue, _level
+
+    _log_queue = sink
+    _level = level
+    logging.getLogger(PACKAGE_LOGGER).setLevel(level)
+    for logger in logging.Logger.manager.loggerDict.values():
+        if isinstance(logger, logging.Logger):
+            for handler in logger.handlers:
+                if isinstance(handler, logging.handlers.QueueHandler):
+                    handler.queue = sink
+
+
+def flush_logging():
+    """큐에 쌓인 로그가 모두 출력될 때까지 대기"""
+    if _listener is not None:
+        _log_queue.join()
+
+
+def shutdown_logging():
+    """리스너 종료 (남은 로그 출력 후)"""
+    global _listener
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+    for handler in _listener.handlers:
+        try:
+            handler.flush()
+        except (OSError, ValueError):
+            # 종료 시점에 이미 닫힌 스트림 (테스트 러너가 가로챈 stderr 등)
+            pass
+        if handler is _file_handler:
+            handler.close()
+    _listener = None
@@ -2,29 +2,41 @@
 보고서 생성기
 """
 
+import html as html_lib
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from ..core.literal_index import display_literal
+
 
 class HTMLReporter:
     """HTML 보고서 생성"""
     
-    def generate(self, results: Dict[str, Any], output_file: str):
-        """HTML 보고서 생성"""
-        html_content = self._generate_html(results)
+    # 심각도별로 보고서에 표시하는 최대 문제 수
+    MAX_ISSUES = 20
+    
+    def generate(self, results: Dict[str, Any], output_file: str,
+                 history: Optional[List[Dict[str, Any]]] = None):
+        """HTML 보고서 생성 (history: 추이 차트에 쓸 실행 기록, 오래된 순)"""
+        html_content = self._generate_html(results, history)
         
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(html_content)
     
-    def _generate_html(self, results: Dict[str, Any]) -> str:
+    def _generate_html(self, results: Dict[str, Any],
+                       history: Optional[List[Dict[str, Any]]] = None) -> str:
         """HTML 콘텐츠 생성"""
         summary = results.get('summary', {})
         errors = results.get('errors', [])
         warnings = results.get('warnings', [])
         suggestions = results.get('suggestions', [])
         
+        # 저장소에서 일부 행만 읽은 경우에도 전체 개수는 요약 기준으로 표시
+        error_total = summary.get('error_count', len(errors))
+        warning_total = summary.get('warning_count', len(warnings))
+        
         html = f"""
 <!DOCTYPE html>
 <html lang="ko">
@@ -174,6 +186,16 @@ class HTMLReporter:
             border-radius: 5px;
             transition: width 0.3s ease;
         }}
+        .bar-fill.trend-error {{
+            background: #e53e3e;
+            border-radius: 5px 0 0 5px;
+            float: left;
+        }}
+        .bar-fill.trend-warning {{
+            background: #dd6b20;
+            border-radius: 0 5px 5px 0;
+            float: left;
+        }}
         .bar-value {{
             position: absolute;
             right: 5px;
@@ -211,6 +233,17 @@ class HTMLReporter:
     </div>
 """
         
+        # 분류(triage) 결과
+        triage = summary.get('triage') or {}
+        if triage.get('skipped') or triage.get('fast'):
+            reasons = ', '.join(f"{reason} {count}개" for reason, count in triage.get('reasons', {}).items())
+            html += f"""
+    <div class="section">
+        <h2>🗂️ 파일 분류</h2>
+        <p>건너뛴 파일 {triage['skipped']}개, 빠른 규칙만 적용한 파일 {triage['fast']}개 ({reasons})</p>
+    </div>
+"""
+        
         # 문제 타입별 차트
         if summary.get('issue_types'):
             html += """
@@ -235,13 +268,22 @@ class HTMLReporter:
     </div>
 """
         
+        # 여러 파일에 반복되는 하드코딩 값
+        repeated = [value for value in results.get('hardcoded_values', []) if value['file_count'] > 1]
+        if repeated:
+            html += self._generate_hardcoded_values_html(repeated)
+        
+        # 실행 추이 차트
+        if history and len(history) > 1:
+            html += self._generate_trend_html(history)
+        
         # 오류 섹션
         if errors:
             html += f"""
     <div class="section">
-        <h2>❌ 오류 ({len(errors)}개)</h2>
+        <h2>❌ 오류 ({error_total}개)</h2>
 """
-            for error in errors[:20]:  # 최대 20개만 표시
+            for error in errors[:self.MAX_ISSUES]:
                 html += f"""
         <div class="issue error">
             <div class="issue-header">
@@ -251,10 +293,10 @@ class HTMLReporter:
             <div class="issue-message">{error.get('message', '')}</div>
         </div>
 """
-            if len(errors) > 20:
+            if error_total > self.MAX_ISSUES:
                 html += f"""
         <div style="text-align: center; margin-top: 20px; color: #666;">
-            ... 그 외 {len(errors) - 20}개의 오류
+            ... 그 외 {error_total - self.MAX_ISSUES}개의 오류
         </div>
 """
             html += """
@@ -265,9 +307,9 @@ class HTMLReporter:
         if warnings:
             html += f"""
     <div class="section">
-        <h2>⚠️ 경고 ({len(warnings)}개)</h2>
+        <h2>⚠️ 경고 ({warning_total}개)</h2>
 """
-            for warning in warnings[:20]:  # 최대 20개만 표시
+            for warning in warnings[:self.MAX_ISSUES]:
                 html += f"""
         <div class="issue warning">
             <div class="issue-header">
@@ -277,10 +319,10 @@ class HTMLReporter:
             <div class="issue-message">{warning.get('message', '')}</div>
         </div>
 """
-            if len(warnings) > 20:
+            if warning_total > self.MAX_ISSUES:
                 html += f"""
         <div style="text-align: center; margin-top: 20px; color: #666;">
-            ... 그 외 {len(warnings) - 20}개의 경고
+            ... 그 외 {warning_total - self.MAX_ISSUES}개의 경고
         </div>
 """
             html += """
@@ -314,6 +356,61 @@ class HTMLReporter:
 """
         
         return html
+    
+    def _generate_hardcoded_values_html(self, values: List[Dict[str, Any]]) -> str:
+        """파일 수 순으로 정렬된 반복 하드코딩 값 목록"""
+        html = """
+    <div class="section">
+        <h2>🔁 반복되는 하드코딩 값</h2>
+"""
+        for value in values:
+            locations = ', '.join(
+                f"{location['file']}:{location['line']}" for location in value['locations']
+            )
+            html += f"""
+        <div class="issue warning">
+            <div class="issue-header">
+                <span class="issue-file">{html_lib.escape(display_literal(value)[:100])}</span>
+                <span class="issue-line">{value['file_count']}개 파일, {value['occurrences']}회 ({value['type']})</span>
+            </div>
+            <div class="issue-message">{html_lib.escape(locations)}</div>
+        </div>
+"""
+        html += """
+    </div>
+"""
+        return html
+    
+    def _generate_trend_html(self, history: List[Dict[str, Any]]) -> str:
+        """최근 실행별 오류/경고 추이 차트"""
+        max_total = max(
+            run['summary'].get('error_count', 0) + run['summary'].get('warning_count', 0)
+            for run in history
+        ) or 1
+        
+        html = f"""
+    <div class="section">
+        <h2>📈 최근 {len(history)}회 실행 추이</h2>
+        <div class="chart">
+"""
+        for run in history:
+            error_count = run['summary'].get('error_count', 0)
+            warning_count = run['summary'].get('warning_count', 0)
+            html += f"""
+            <div class="bar" title="{run['created_at'][:19]}">
+                <div class="bar-label">#{run['id']}</div>
+                <div class="bar-container">
+                    <div class="bar-fill trend-error" style="width: {error_count / max_total * 100}%"></div>
+                    <div class="bar-fill trend-warning" style="width: {warning_count / max_total * 100}%"></div>
+                    <div class="bar-value">오류 {error_count} / 경고 {warning_count}</div>
+                </div>
+            </div>
+"""
+        html += """
+        </div>
+    </div>
+"""
+        return html
 
 
 class JSONReporter:
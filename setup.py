@@ -64,6 +64,10 @@ setup(
         "jinja2>=3.0.0",
     ],
     extras_require={
+        # 엔트로피 기반 secret 규칙의 묶음 계산 가속 (없으면 순수 Python으로 계산)
+        "fast": [
+            "numpy>=1.20",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -76,6 +80,11 @@ setup(
         "console_scripts": [
             "halo-workflow=halo_workflow.cli.main:main",
         ],
+        # 파일 단위 탐지기 (외부 패키지도 같은 그룹으로 탐지기를 추가할 수 있음)
+        "halo_workflow.detectors": [
+            "hardcoding=halo_workflow.analyzers.hardcoding_detector:HardcodingDetector",
+            "dummy_data=halo_workflow.analyzers.dummy_data_detector:DummyDataDetector",
+        ],
     },
     include_package_data=True,
     package_data={
@@ -0,0 +1,55 @@
+"""
+WorkflowAnalyzer 테스트
+"""
+
+import pytest
+
+from halo_workflow.core.analyzer import WorkflowAnalyzer
+from halo_workflow.core.issues import Issue
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+
+
+def test_fail_fast_stops_on_secret(tmp_path):
+    project = tmp_path / 'project'
+    project.mkdir()
+    (project / 'a_config.py').write_text('password = "hunter2secret"\n')
+    (project / 'b_config.py').write_text('api_key = "sk_live_0123456789abcdefghij"\n')
+
+    results = WorkflowAnalyzer(fail_fast=True).analyze(project)
+
+    assert results.get('aborted')
+    assert len(results['errors']) == 1
+    assert results['errors'][0]['type'] == 'hardcoding'
+    assert 'literal' not in results['errors'][0]
+    assert results['summary']['total_files'] == 1
+
+
+def test_iter_issues_matches_analyze(tmp_path):
+    project = tmp_path / 'project'
+    (project / 'src').mkdir(parents=True)
+    for name in ('first', 'second'):
+        (project / 'src' / f'{name}.js').write_text(
+            'const url = "https://api.acme.io/v1";\n'
+            'const password = "hunter2secret";\n'
+            'const user = "foo";\n'
+        )
+    (project / 'src' / 'server.py').write_text('PORT = 8080\napi_key = "sk_live_0123456789abcdefghij"\n')
+
+    def key(issue):
+        return issue.type, issue.severity, issue.message, issue.file, issue.line, issue.fingerprint
+
+    results = WorkflowAnalyzer().analyze(project)
+    expected = {
+        key(Issue.from_entry(entry, severity))
+        for severity, section in (('error', 'errors'), ('warning', 'warnings'))
+        for entry in results[section]
+    }
+    streamed = [key(issue) for issue in WorkflowAnalyzer().iter_issues(project)]
+
+    assert any(issue[1] == 'error' for issue in expected)
+    assert len(streamed) == len(set(streamed))
+    assert set(streamed) == expected
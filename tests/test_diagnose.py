@@ -0,0 +1,54 @@
+"""
+diagnose 필수 파일/의존성 검사 테스트
+"""
+
+import json
+
+import pytest
+
+from halo_workflow.core.analyzer import WorkflowAnalyzer
+from halo_workflow.core.diagnose import ProjectDiagnostic
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+
+
+@pytest.fixture
+def project(tmp_path):
+    """기본 구조(Vite + React, Express)가 아닌 Node 라이브러리"""
+    root = tmp_path / 'project'
+    (root / 'lib').mkdir(parents=True)
+    (root / 'package.json').write_text(json.dumps({
+        'dependencies': {'express': '^4.18.0'},
+        'scripts': {'test': 'node --test'}
+    }))
+    (root / 'lib' / 'index.js').write_text('module.exports = {};\n')
+    return root
+
+
+def diagnose(project, **options):
+    results = ProjectDiagnostic(WorkflowAnalyzer(), 'quick', **options).run(project)
+    return {check['name']: check for check in results['checks']}
+
+
+def test_default_requirements_only_warn(project):
+    checks = diagnose(project)
+
+    assert checks['required_files']['status'] == 'warning'
+    assert 'src/main.tsx' in checks['required_files']['details']
+    assert checks['package_json']['status'] == 'warning'
+    assert checks['package_json']['details'] == ['필수 의존성 없음: react', '필수 의존성 없음: react-dom']
+
+
+def test_configured_requirements(project):
+    checks = diagnose(project, required_files=['package.json', 'lib/index.js'], required_dependencies=['express'])
+    assert checks['required_files']['status'] == 'ok'
+    assert checks['required_files']['message'] == 'lib/ 파일 1개'
+    assert checks['package_json']['status'] == 'ok'
+
+    checks = diagnose(project, required_files=['lib/cli.js'], required_dependencies=['commander'])
+    assert checks['required_files']['status'] == 'fail'
+    assert checks['required_files']['details'] == ['lib/cli.js']
+    assert checks['package_json']['status'] == 'fail'
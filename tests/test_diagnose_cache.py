@@ -0,0 +1,108 @@
+"""
+diagnose 검사 캐시 테스트
+
+PATH 앞에 호출을 기록하는 npx/npm 스텁을 두고 standard 단계를 반복 실행해,
+입력이 바뀐 검사만 하위 프로세스를 다시 실행하는지 확인한다.
+"""
+
+import json
+import os
+import stat
+
+import pytest
+
+from halo_workflow.core.analyzer import WorkflowAnalyzer
+from halo_workflow.core.diagnose import ProjectDiagnostic
+
+pytestmark = pytest.mark.skipif(os.name == 'nt', reason='스텁 명령이 POSIX 셸 스크립트')
+
+STUB = """#!/bin/sh
+echo "{name} $*" >> "$STUB_CALLS"
+exit 0
+"""
+
+
+@pytest.fixture
+def stub_calls(tmp_path, monkeypatch):
+    """npx/npm 스텁을 PATH 앞에 두고, 기록된 호출을 읽어 비우는 함수 반환"""
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    for name in ('npx', 'npm'):
+        script = bin_dir / name
+        script.write_text(STUB.format(name=name))
+        script.chmod(script.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+    log = tmp_path / 'calls.log'
+    monkeypatch.setenv('STUB_CALLS', str(log))
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+
+    def take():
+        if not log.exists():
+            return []
+        calls = log.read_text().splitlines()
+        log.unlink()
+        return calls
+
+    return take
+
+
+@pytest.fixture
+def project(tmp_path):
+    """tsconfig, build 스크립트, node_modules가 있는 최소 프로젝트"""
+    root = tmp_path / 'project'
+    (root / 'src').mkdir(parents=True)
+    (root / 'node_modules').mkdir()
+    (root / 'package.json').write_text(json.dumps({
+        'dependencies': {'react': '^18.0.0', 'react-dom': '^18.0.0'},
+        'scripts': {'build': 'vite build'}
+    }))
+    (root / 'tsconfig.json').write_text('{"compilerOptions": {"strict": true}}')
+    (root / 'src' / 'App.tsx').write_text('export const App = () => null;\n')
+    (root / 'src' / 'index.css').write_text('body { margin: 0; }\n')
+    return root
+
+
+def diagnose(project):
+    results = ProjectDiagnostic(WorkflowAnalyzer(), 'standard').run(project)
+    return {check['name']: check for check in results['checks']}
+
+
+def touch(path):
+    """mtime을 확실히 바꿈 (파일 시스템 시간 해상도와 무관)"""
+    mtime = path.stat().st_mtime + 10
+    os.utime(path, (mtime, mtime))
+
+
+def kinds(calls):
+    return sorted('tsc' if call.startswith('npx tsc') else call for call in calls)
+
+
+def test_unchanged_project_reuses_results(project, stub_calls):
+    checks = diagnose(project)
+    assert checks['typescript']['status'] == 'ok'
+    assert checks['build']['status'] == 'ok'
+    assert kinds(stub_calls()) == ['npm run build', 'tsc']
+
+    checks = diagnose(project)
+    assert stub_calls() == []
+    assert checks['typescript']['message'].endswith('(캐시)')
+    assert checks['build']['message'].endswith('(캐시)')
+
+
+def test_source_change_reruns_tsc_only(project, stub_calls):
+    diagnose(project)
+    stub_calls()
+
+    touch(project / 'src' / 'App.tsx')
+    diagnose(project)
+    assert kinds(stub_calls()) == ['tsc']
+
+
+def test_stylesheet_change_reruns_build_only(project, stub_calls):
+    diagnose(project)
+    stub_calls()
+
+    touch(project / 'src' / 'index.css')
+    diagnose(project)
+    assert kinds(stub_calls()) == ['npm run build']
@@ -0,0 +1,97 @@
+"""
+중복 코드 탐지 테스트
+"""
+
+from halo_workflow.analyzers.duplicate_detector import DuplicateDetector
+
+FX = '''
+def fx(items):
+    total = 0
+    for item in items:
+        total += item
+    return total
+'''
+
+GY = '''
+def gy(value):
+    if value is None:
+        raise ValueError('value')
+    else:
+        return str(value).strip()
+'''
+
+CLASS = '''
+class Store:
+    def load(self, path):
+        with open(path) as handle:
+            return handle.read()
+
+    def save(self, path, data):
+        with open(path, 'w') as handle:
+            handle.write(data)
+'''
+
+
+def find(files):
+    detector = DuplicateDetector(min_lines=3)
+    for name, content in files.items():
+        detector.add_file(name, content)
+    return detector.find_duplicates()
+
+
+def groups(duplicates):
+    return sorted((dup['type'], sorted(dup['files'])) for dup in duplicates)
+
+
+def test_identical_files_do_not_merge_unrelated_clones():
+    # a.py와 a2.py가 같아도 fx 복제(x.py)와 gy 복제(y.py)는 따로 보고
+    duplicates = find({
+        'a.py': FX + GY,
+        'a2.py': FX + GY,
+        'x.py': FX.replace('fx', 'sum_items'),
+        'y.py': GY.replace('gy', 'clean'),
+    })
+
+    assert groups(duplicates) == [
+        ('clone_class', ['a.py', 'a2.py', 'x.py']),
+        ('clone_class', ['a.py', 'a2.py', 'y.py']),
+        ('file_duplicate', ['a.py', 'a2.py']),
+    ]
+
+
+def test_partially_overlapping_clones_stay_separate():
+    # Store 클래스 복제(b.py, c.py) 안의 메서드가 각각 다른 파일에도 있으면 세 묶음으로 보고
+    load, save = CLASS.split('\n\n')
+    duplicates = find({
+        'b.py': CLASS,
+        'c.py': CLASS.replace('Store', 'Cache'),
+        'load.py': load.replace('class Store:\n', 'class Loader:\n    limit = 1\n'),
+        'save.py': 'class Saver:\n    limit = 1\n' + save,
+    })
+
+    assert groups(duplicates) == [
+        ('clone_class', ['b.py', 'c.py']),
+        ('clone_class', ['b.py', 'c.py', 'load.py']),
+        ('clone_class', ['b.py', 'c.py', 'save.py']),
+    ]
+
+
+def test_cloned_class_includes_its_methods():
+    duplicates = find({'b.py': CLASS, 'c.py': CLASS.replace('Store', 'Cache')})
+
+    assert len(duplicates) == 1
+    assert duplicates[0]['blocks'] == [
+        {'file': 'b.py', 'start_line': 2, 'end_line': 9, 'names': ['Store', 'load', 'save']},
+        {'file': 'c.py', 'start_line': 2, 'end_line': 9, 'names': ['Cache', 'load', 'save']},
+    ]
+
+
+def test_identical_files_include_their_own_blocks():
+    duplicates = find({'a.py': FX + GY, 'a2.py': FX + GY, 'x.py': FX})
+
+    assert groups(duplicates) == [
+        ('clone_class', ['a.py', 'a2.py', 'x.py']),
+        ('file_duplicate', ['a.py', 'a2.py']),
+    ]
+    file_duplicate = next(dup for dup in duplicates if dup['type'] == 'file_duplicate')
+    assert [block['end_line'] for block in file_duplicate['blocks']] == [None, None]
@@ -0,0 +1,29 @@
+"""
+하드코딩 탐지 테스트
+"""
+
+from pathlib import Path
+
+import pytest
+
+from halo_workflow.analyzers.hardcoding_detector import HardcodingDetector
+
+
+def secrets(source):
+    issues = HardcodingDetector().detect(source, Path('sample.ts'))
+    return [issue['literal'] for issue in issues if issue['type'] == 'secret']
+
+
+@pytest.mark.parametrize('value', [
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789',
+    'abcdefghijklmnopqrstuvwxyz0123456789',
+    '0123456789abcdefghijklmnopqrstuvwxyz',
+    'ZYXWVUTSRQPONMLKJIHGFEDCBA9876543210',
+])
+def test_sequential_alphabet_is_not_secret(value):
+    assert secrets(f'const ALPHABET = "{value}";\n') == []
+
+
+def test_random_token_is_secret():
+    token = 'q8Xf2LmZ0vKp7RtY3nWb9HsJ4cUe1GdA'
+    assert secrets(f'const token = "{token}";\n') == [token]
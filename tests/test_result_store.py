@@ -0,0 +1,49 @@
+"""
+ResultStore 테스트
+"""
+
+import pytest
+
+from halo_workflow.core.analyzer import WorkflowAnalyzer
+from halo_workflow.core.result_store import ResultStore
+
+SECRET = 'sk_live_0123456789abcdefghij'
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+
+
+@pytest.fixture
+def results(tmp_path):
+    project = tmp_path / 'project'
+    project.mkdir()
+    (project / 'config.py').write_text(f'api_key = "{SECRET}"\n')
+    return WorkflowAnalyzer().analyze(project)
+
+
+def stored_values(store, run_id):
+    return [row['value'] for row in store.conn.execute('SELECT value FROM literals WHERE run_id = ?', (run_id,))]
+
+
+def test_secret_literal_is_keyed_per_store(tmp_path, results):
+    with ResultStore(tmp_path / 'a.db') as first, ResultStore(tmp_path / 'b.db') as second:
+        first_run = first.save_run(results)
+        second_run = second.save_run(results)
+
+        assert first.secret_salt != second.secret_salt
+        assert stored_values(first, first_run) != stored_values(second, second_run)
+        assert [row['file'] for row in first.query_literal(first_run, SECRET)] == ['config.py']
+
+    # 다시 열어도 같은 키
+    with ResultStore(tmp_path / 'a.db') as reopened:
+        assert [row['file'] for row in reopened.query_literal(first_run, SECRET)] == ['config.py']
+
+
+def test_secret_is_not_stored(tmp_path, results):
+    db_path = tmp_path / 'a.db'
+    with ResultStore(db_path) as store:
+        store.save_run(results)
+
+    assert SECRET.encode() not in db_path.read_bytes()
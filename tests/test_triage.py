@@ -0,0 +1,44 @@
+"""
+파일 분류(triage) 테스트
+"""
+
+import base64
+import random
+
+from halo_workflow.core.triage import FULL, SKIP, byte_entropy, classify_header
+
+KOREAN_SOURCE = '''// 시스템 메시지 상수들
+export const UI_MESSAGES = {
+  LOGIN_REQUIRED: '로그인이 필요합니다.',
+  SAVE_SUCCESS: '워크플로우가 저장되었습니다!',
+  SAVE_ERROR: '저장 중 오류가 발생했습니다.',
+  UPLOAD_TOO_LARGE: '파일 크기가 너무 큽니다.',
+  INVITE_SENT: '팀원에게 초대 메일을 보냈습니다.',
+  BILLING_EXPIRED: '카드 유효기간을 확인하세요.',
+  SEARCH_EMPTY: '검색 결과가 없습니다.',
+  EXPORT_PENDING: '보고서를 내보내는 중입니다.',
+  NETWORK_OFFLINE: '네트워크 연결을 확인하세요.',
+} as const;
+
+export type UIMessage = typeof UI_MESSAGES[keyof typeof UI_MESSAGES];
+'''
+
+
+def test_non_ascii_source_is_analyzed():
+    header = (KOREAN_SOURCE * 4).encode('utf-8')[:8192]
+    # 한글 UTF-8 바이트만으로 바이트 엔트로피 기준을 넘는 파일
+    assert byte_entropy(header) > 5.8
+    assert classify_header(header) == (FULL, '')
+
+
+def test_encoded_data_is_skipped():
+    rng = random.Random(0)
+    encoded = base64.b64encode(bytes(rng.randrange(256) for _ in range(6000)))
+    header = b'\n'.join(encoded[i:i + 76] for i in range(0, len(encoded), 76))[:8192]
+    assert classify_header(header) == (SKIP, 'high_entropy')
+
+
+def test_invalid_utf8_high_entropy_is_skipped():
+    rng = random.Random(0)
+    header = b'\n'.join(bytes(rng.randrange(1, 256) for _ in range(200)) for _ in range(20))
+    assert classify_header(header) == (SKIP, 'high_entropy')
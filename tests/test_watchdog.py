@@ -0,0 +1,51 @@
+"""
+파일 분석 시간 제한 테스트
+"""
+
+import multiprocessing
+import re
+import time
+
+import pytest
+
+from halo_workflow.analyzers import registry
+from halo_workflow.core.analyzer import WorkflowAnalyzer
+
+# 작업 프로세스가 테스트에서 등록한 탐지기를 물려받아야 함
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != 'fork', reason='fork 시작 방식에서만 탐지기 등록이 전달됨'
+)
+
+
+class BacktrackingDetector:
+    """중첩 수량자 패턴 - 'a' 뒤에 다른 문자가 오면 지수 시간"""
+
+    name = 'backtracking'
+    issue_type = 'backtracking'
+    languages = None
+    extensions = ['.txt']
+    pattern = re.compile(r'^(a+)+$')
+
+    def detect(self, content, file_path):
+        return [{'line': 1, 'message': 'match', 'severity': 'warning'}] if self.pattern.match(content) else []
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    monkeypatch.setattr(registry, 'BUILTIN_DETECTORS', registry.BUILTIN_DETECTORS + [BacktrackingDetector])
+
+
+def test_small_file_with_backtracking_pattern_is_killed(tmp_path):
+    project = tmp_path / 'project'
+    project.mkdir()
+    (project / 'slow.txt').write_text('a' * 64 + '!')
+    (project / 'fine.txt').write_text('aaaa')
+
+    start = time.monotonic()
+    results = WorkflowAnalyzer(file_timeout=1, detectors=['backtracking']).analyze(project)
+
+    assert time.monotonic() - start < 30
+    assert results['files']['slow.txt'].get('timed_out')
+    assert not results['files']['fine.txt'].get('timed_out')
+    assert results['summary']['timed_out_count'] == 1